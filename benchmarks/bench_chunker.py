@@ -0,0 +1,126 @@
+"""
+Benchmark the text chunker on multi-megabyte input.
+
+Compares ``TextChunker`` splitting against the original string
+concatenation based implementation on synthetic text of doubling size,
+with line breaks and with all whitespace collapsed to single spaces. With
+linear scaling the time per megabyte stays flat as the input grows.
+
+Usage:
+    python benchmarks/bench_chunker.py [--chunk-size 1000] [--max-mb 8]
+"""
+
+import argparse
+import random
+import re
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pdfreadermcp.utils.chunker import TextChunker  # noqa: E402
+
+
+def legacy_split_text_recursive(chunker: TextChunker, text: str, separators: list) -> list:
+    """Original implementation: string concatenation and separator slicing."""
+    final_chunks = []
+    separator = ""
+    for sep in separators:
+        if sep in text:
+            separator = sep
+            break
+
+    splits = text.split(separator) if separator else [text]
+    current_chunk = ""
+    for split in splits:
+        if len(current_chunk) + len(split) + len(separator) > chunker.chunk_size:
+            if current_chunk:
+                final_chunks.append(current_chunk)
+                current_chunk = ""
+            if len(split) > chunker.chunk_size and len(separators) > 1:
+                final_chunks.extend(legacy_split_text_recursive(chunker, split, separators[1:]))
+            else:
+                final_chunks.append(split)
+        else:
+            if current_chunk:
+                current_chunk += separator
+            current_chunk += split
+
+    if current_chunk:
+        final_chunks.append(current_chunk)
+    return final_chunks
+
+
+def make_text(char_count: int, seed: int = 0) -> str:
+    """Generate prose with sentences, lines and paragraphs of roughly char_count characters."""
+    rng = random.Random(seed)
+    vocabulary = [
+        ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 10)))
+        for _ in range(2000)
+    ]
+    parts = []
+    length = 0
+    while length < char_count:
+        word = rng.choice(vocabulary)
+        roll = rng.random()
+        if roll < 0.005:
+            word += '.\n\n'
+        elif roll < 0.02:
+            word += '\n'
+        elif roll < 0.08:
+            word += '. '
+        else:
+            word += ' '
+        parts.append(word)
+        length += len(word)
+    return ''.join(parts)[:char_count]
+
+
+def best_of(func, repeat: int = 3) -> float:
+    """Best wall time of several calls, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--chunk-size", type=int, default=1000, help="Chunk size in characters")
+    parser.add_argument("--max-mb", type=float, default=8, help="Largest input size in megabytes")
+    args = parser.parse_args()
+
+    chunker = TextChunker(chunk_size=args.chunk_size, chunk_overlap=0)
+    separators = TextChunker.DEFAULT_SEPARATORS
+
+    def limit(position: int) -> int:
+        return position + args.chunk_size
+
+    # "spaced" has no line breaks, so the splitter works through sentences and words
+    print(f"{'input':>8} {'MB':>6} {'chunks':>8} {'legacy ms':>11} {'ms/MB':>8} {'current ms':>11} {'ms/MB':>8}")
+    for kind in ("lines", "spaced"):
+        size_mb = 0.5
+        while size_mb <= args.max_mb:
+            text = make_text(int(size_mb * 1024 * 1024), seed=int(size_mb * 10))
+            if kind == "spaced":
+                text = re.sub(r"\s+", " ", text)
+
+            def current():
+                return [text[s:e] for s, e in chunker._split_ranges(text, 0, len(text), separators, limit)]
+
+            chunk_count = len(current())
+            legacy = best_of(lambda: legacy_split_text_recursive(chunker, text, separators)) * 1000
+            ranges = best_of(current) * 1000
+            print(
+                f"{kind:>8} {size_mb:>6.1f} {chunk_count:>8} {legacy:>11.1f} {legacy / size_mb:>8.1f} "
+                f"{ranges:>11.1f} {ranges / size_mb:>8.1f}"
+            )
+            size_mb *= 2
+
+
+if __name__ == "__main__":
+    main()
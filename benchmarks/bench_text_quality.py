@@ -0,0 +1,120 @@
+"""
+Benchmark the per-page cost of the text quality analyzer.
+
+Compares ``analyze_text_quality`` against the original regex/list based
+implementation on synthetic English and Chinese pages of increasing size.
+The original only understood ASCII letters, so the metrics differ on
+non-ASCII pages; the timings show the cost per page.
+
+Usage:
+    python benchmarks/bench_text_quality.py [--repeat 20]
+"""
+
+import argparse
+import random
+import re
+import string
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pdfreadermcp.utils.text_quality import analyze_text_quality  # noqa: E402
+
+
+def legacy_analyze_text_quality(text: str) -> dict:
+    """Original implementation: five passes and per-character match lists."""
+    if not text.strip():
+        return {'quality_score': 0.0, 'word_count': 0, 'has_extractable_text': False}
+
+    word_count = len(text.split())
+    char_count = len(text)
+    char_word_ratio = char_count / max(word_count, 1)
+    sentences = re.split(r'[.!?]+', text)
+    avg_sentence_length = sum(len(s.split()) for s in sentences) / max(len(sentences), 1)
+    letters = re.findall(r'[a-zA-Z]', text)
+    letter_ratio = len(letters) / max(char_count, 1)
+    special_chars = re.findall(r'[^\w\s\.,!?\'"()-]', text)
+    special_char_ratio = len(special_chars) / max(char_count, 1)
+
+    quality_score = 0.0
+    if 3 <= char_word_ratio <= 8:
+        quality_score += 0.3
+    if 3 <= avg_sentence_length <= 25:
+        quality_score += 0.3
+    if letter_ratio >= 0.6:
+        quality_score += 0.3
+    if special_char_ratio <= 0.1:
+        quality_score += 0.1
+
+    return {
+        'quality_score': quality_score,
+        'word_count': word_count,
+        'char_word_ratio': char_word_ratio,
+        'avg_sentence_length': avg_sentence_length,
+        'letter_ratio': letter_ratio,
+        'special_char_ratio': special_char_ratio,
+        'has_extractable_text': word_count >= 5 and quality_score >= 0.4
+    }
+
+
+def make_page(char_count: int, seed: int = 0) -> str:
+    """Generate English-like page text of roughly char_count characters."""
+    rng = random.Random(seed)
+    vocabulary = [
+        ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 10)))
+        for _ in range(2000)
+    ]
+    words = []
+    length = 0
+    while length < char_count:
+        word = rng.choice(vocabulary)
+        if rng.random() < 0.08:
+            word += rng.choice('.,;:!?')
+        if rng.random() < 0.02:
+            word += '\n'
+        words.append(word)
+        length += len(word) + 1
+    return ' '.join(words)[:char_count]
+
+
+def make_cjk_page(char_count: int, seed: int = 0) -> str:
+    """Generate Chinese-like page text of roughly char_count characters."""
+    rng = random.Random(seed)
+    chars = []
+    while len(chars) < char_count:
+        chars.append(chr(rng.randint(0x4E00, 0x9FA5)))
+        roll = rng.random()
+        if roll < 0.04:
+            chars.append('，')
+        elif roll < 0.06:
+            chars.append('。')
+        elif roll < 0.07:
+            chars.append('\n')
+    return ''.join(chars[:char_count])
+
+
+def measure(kind: str, page: str, repeat: int) -> None:
+    """Time both analyzers on one page and print a result row."""
+    analyze_text_quality(page)  # warm up lazily built patterns
+    legacy = min(timeit.repeat(lambda: legacy_analyze_text_quality(page), number=repeat, repeat=3))
+    current = min(timeit.repeat(lambda: analyze_text_quality(page), number=repeat, repeat=3))
+    legacy_ms = legacy / repeat * 1000
+    current_ms = current / repeat * 1000
+    print(f"{kind:>8} {len(page):>10} {legacy_ms:>12.3f} {current_ms:>12.3f} {legacy_ms / current_ms:>8.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20, help="Calls per measurement")
+    args = parser.parse_args()
+
+    print(f"{'page':>8} {'chars':>10} {'legacy ms':>12} {'current ms':>12} {'speedup':>9}")
+    for kind, generate in (("latin", make_page), ("cjk", make_cjk_page)):
+        for size in (2_000, 10_000, 50_000, 250_000, 1_000_000):
+            measure(kind, generate(size, seed=size), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
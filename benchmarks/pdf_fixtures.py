@@ -0,0 +1,257 @@
+"""
+Generate synthetic PDF files for the benchmarks using only the standard library.
+
+Each generator is seeded, so the same arguments always produce the same
+bytes and results stay comparable between runs and machines:
+
+- ``text_heavy``: dense English prose, about 4 KB of text per page
+- ``image_only``: one grayscale image per page and no text (a scan)
+- ``many_pages``: hundreds of pages with a few lines each
+- ``cjk``: Chinese text in the non-embedded Adobe-GB1 ``STSong-Light`` font
+- ``many_small_files``: a directory of short two-page documents
+
+Usage:
+    python benchmarks/pdf_fixtures.py OUTPUT_DIR
+"""
+
+import argparse
+import random
+import string
+import zlib
+from pathlib import Path
+from typing import Dict, List
+
+# Bump when generated files change so cached fixture directories are rebuilt
+FIXTURES_VERSION = 1
+
+PAGE_WIDTH = 612
+PAGE_HEIGHT = 792
+
+_HELVETICA = b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>"
+_STSONG_DESCRIPTOR = (
+    b"<< /Type /FontDescriptor /FontName /STSong-Light /Flags 6 /FontBBox [-25 -254 1000 880]"
+    b" /ItalicAngle 0 /Ascent 880 /Descent -120 /CapHeight 880 /StemV 93 >>"
+)
+
+
+class PDFWriter:
+    """
+    Minimal PDF 1.4 writer: numbered objects, Flate-compressed streams and
+    a classic cross-reference table.
+    """
+
+    def __init__(self):
+        self._objects: List[bytes] = []
+        self._pages: List[int] = []
+        # Object 1 is the catalog and object 2 the page tree, written last
+        self._objects.extend([b"", b""])
+
+    def add_object(self, body: bytes) -> int:
+        """Add an object and return its number."""
+        self._objects.append(body)
+        return len(self._objects)
+
+    def add_stream(self, data: bytes, attributes: bytes = b"") -> int:
+        """Add a Flate-compressed stream and return its object number."""
+        compressed = zlib.compress(data)
+        header = b"<< /Length %d /Filter /FlateDecode %s>>" % (len(compressed), attributes)
+        return self.add_object(header + b"\nstream\n" + compressed + b"\nendstream")
+
+    def add_page(self, content: bytes, resources: bytes) -> None:
+        """Add a page with a content stream and a resource dictionary."""
+        content_id = self.add_stream(content)
+        self._pages.append(self.add_object(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] /Resources %s /Contents %d 0 R >>"
+            % (PAGE_WIDTH, PAGE_HEIGHT, resources, content_id)
+        ))
+
+    def write(self, path: Path) -> None:
+        """Write the document to path."""
+        kids = b" ".join(b"%d 0 R" % page for page in self._pages)
+        self._objects[0] = b"<< /Type /Catalog /Pages 2 0 R >>"
+        self._objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(self._pages))
+
+        output = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        offsets = []
+        for number, body in enumerate(self._objects, start=1):
+            offsets.append(len(output))
+            output += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+
+        xref_offset = len(output)
+        output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(self._objects) + 1)
+        for offset in offsets:
+            output += b"%010d 00000 n \n" % offset
+        output += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+            len(self._objects) + 1, xref_offset
+        )
+        Path(path).write_bytes(bytes(output))
+
+
+def _escape(text: str) -> bytes:
+    """Encode ASCII text as the body of a PDF literal string."""
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)").encode("latin-1")
+
+
+def _text_content(lines: List[bytes], font: bytes, size: int) -> bytes:
+    """Content stream drawing pre-encoded string operands, one per line."""
+    leading = size + 3
+    parts = [b"BT /%s %d Tf %d TL 50 %d Td" % (font, size, leading, PAGE_HEIGHT - 60)]
+    for line in lines:
+        parts.append(line + b" Tj T*")
+    parts.append(b"ET")
+    return b"\n".join(parts)
+
+
+def _vocabulary(rng: random.Random) -> List[str]:
+    """Random lower-case words used by the prose generators."""
+    return [
+        ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 10)))
+        for _ in range(2000)
+    ]
+
+
+def _prose_lines(rng: random.Random, vocabulary: List[str], line_count: int) -> List[bytes]:
+    """Lines of about 90 characters of sentence-like text."""
+    lines = []
+    for _ in range(line_count):
+        words = []
+        length = 0
+        while length < 90:
+            word = rng.choice(vocabulary)
+            if rng.random() < 0.08:
+                word += "."
+            words.append(word)
+            length += len(word) + 1
+        lines.append(b"(" + _escape(" ".join(words)) + b")")
+    return lines
+
+
+def text_heavy(path: Path, pages: int = 20, seed: int = 1) -> None:
+    """Dense prose, 48 lines of about 90 characters per page."""
+    rng = random.Random(seed)
+    vocabulary = _vocabulary(rng)
+    writer = PDFWriter()
+    font = writer.add_object(_HELVETICA)
+    resources = b"<< /Font << /F1 %d 0 R >> >>" % font
+    for _ in range(pages):
+        writer.add_page(_text_content(_prose_lines(rng, vocabulary, 48), b"F1", 9), resources)
+    writer.write(path)
+
+
+def many_pages(path: Path, pages: int = 300, seed: int = 2) -> None:
+    """Many short pages of a few lines each."""
+    rng = random.Random(seed)
+    vocabulary = _vocabulary(rng)
+    writer = PDFWriter()
+    font = writer.add_object(_HELVETICA)
+    resources = b"<< /Font << /F1 %d 0 R >> >>" % font
+    for _ in range(pages):
+        writer.add_page(_text_content(_prose_lines(rng, vocabulary, 6), b"F1", 11), resources)
+    writer.write(path)
+
+
+def image_only(path: Path, pages: int = 20, seed: int = 3) -> None:
+    """A full-page grayscale image per page and no text, like a scanned document."""
+    rng = random.Random(seed)
+    width, height = 400, 520
+    writer = PDFWriter()
+    for _ in range(pages):
+        # Noisy horizontal bands, so every page stores a different image
+        rows = []
+        for y in range(height):
+            shade = 255 if (y // 12) % 3 else rng.randint(0, 120)
+            noise = bytes(max(0, min(255, shade + value % 41 - 20)) for value in range(256))
+            rows.append(rng.randbytes(width).translate(noise))
+        image = writer.add_stream(
+            b"".join(rows),
+            b"/Type /XObject /Subtype /Image /Width %d /Height %d /ColorSpace /DeviceGray /BitsPerComponent 8 "
+            % (width, height)
+        )
+        writer.add_page(
+            b"q %d 0 0 %d 50 80 cm /Im1 Do Q" % (PAGE_WIDTH - 100, PAGE_HEIGHT - 160),
+            b"<< /XObject << /Im1 %d 0 R >> >>" % image
+        )
+    writer.write(path)
+
+
+def cjk(path: Path, pages: int = 20, seed: int = 4) -> None:
+    """Chinese text using a predefined CMap font that PDF readers map to Unicode."""
+    rng = random.Random(seed)
+    writer = PDFWriter()
+    descriptor = writer.add_object(_STSONG_DESCRIPTOR)
+    descendant = writer.add_object(
+        b"<< /Type /Font /Subtype /CIDFontType0 /BaseFont /STSong-Light"
+        b" /CIDSystemInfo << /Registry (Adobe) /Ordering (GB1) /Supplement 2 >>"
+        b" /FontDescriptor %d 0 R /DW 1000 >>" % descriptor
+    )
+    font = writer.add_object(
+        b"<< /Type /Font /Subtype /Type0 /BaseFont /STSong-Light /Encoding /UniGB-UCS2-H"
+        b" /DescendantFonts [%d 0 R] >>" % descendant
+    )
+    resources = b"<< /Font << /F1 %d 0 R >> >>" % font
+    for _ in range(pages):
+        lines = []
+        for _ in range(40):
+            chars = []
+            while len(chars) < 40:
+                chars.append(chr(rng.randint(0x4E00, 0x9FA5)))
+                roll = rng.random()
+                if roll < 0.05:
+                    chars.append('，')
+                elif roll < 0.08:
+                    chars.append('。')
+            lines.append(b"<" + ''.join(chars[:40]).encode("utf-16-be").hex().upper().encode("ascii") + b">")
+        writer.add_page(_text_content(lines, b"F1", 12), resources)
+    writer.write(path)
+
+
+def many_small_files(directory: Path, count: int = 50, seed: int = 5) -> None:
+    """A directory of two-page documents, e.g. for merging."""
+    directory.mkdir(parents=True, exist_ok=True)
+    for index in range(count):
+        text_heavy(directory / f"small_{index:03d}.pdf", pages=2, seed=seed * 1000 + index)
+
+
+def generate(directory: Path) -> Dict[str, Path]:
+    """
+    Generate every fixture into directory, skipping files that already exist.
+
+    Args:
+        directory: Output directory
+
+    Returns:
+        Mapping of fixture name to path
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    fixtures = {
+        "text_heavy": directory / "text_heavy.pdf",
+        "image_only": directory / "image_only.pdf",
+        "many_pages": directory / "many_pages.pdf",
+        "cjk": directory / "cjk.pdf",
+        "many_small_files": directory / "small",
+    }
+    generators = {
+        "text_heavy": text_heavy,
+        "image_only": image_only,
+        "many_pages": many_pages,
+        "cjk": cjk,
+        "many_small_files": many_small_files,
+    }
+    for name, path in fixtures.items():
+        if not path.exists():
+            generators[name](path)
+    return fixtures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("output_dir", type=Path, help="Directory for the generated files")
+    args = parser.parse_args()
+
+    for name, path in generate(args.output_dir).items():
+        print(f"{name:>18} {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,413 @@
+"""
+Benchmark suite for the text extraction and page operation hot paths.
+
+Generates synthetic PDFs with ``pdf_fixtures`` (once, into a cache
+directory) and runs every case in a fresh subprocess, so each case starts
+cold and its peak RSS is its own. A case reports the best wall time of
+``--repeat`` runs, the pages it processed per second and the peak resident
+set size of the process (including finished worker processes).
+
+Results can be written as JSON and compared against a previous run; the
+comparison exits with status 1 when a case got slower or bigger than the
+threshold allows, so it can gate a dependency upgrade.
+
+Usage:
+    python benchmarks/run_benchmarks.py [--repeat 3] [--cases extract_text] [--output results.json]
+    python benchmarks/run_benchmarks.py --compare baseline.json [--threshold 0.2]
+    python benchmarks/run_benchmarks.py --compare baseline.json --current results.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import pdf_fixtures  # noqa: E402
+
+RESULTS_VERSION = 1
+
+
+class CaseContext:
+    """Shared state of one case subprocess: fixtures, scratch directory and event loop."""
+
+    def __init__(self, fixtures: Dict[str, Path], workdir: Path):
+        from pdfreadermcp.utils.executor import WorkerPool
+
+        self.fixtures = fixtures
+        self.workdir = workdir
+        self.loop = asyncio.new_event_loop()
+        # One pool per process: worker start-up is paid once, like in the server
+        self.pool = WorkerPool()
+        self._scratch = 0
+
+    def reader(self):
+        """A PDFReader with empty caches and no persistent tier."""
+        from pdfreadermcp.tools.pdf_reader import PDFReader
+
+        return PDFReader(executor=self.pool, disk_cache=None)
+
+    def operations(self):
+        """A PDFOperations instance with an empty document cache."""
+        from pdfreadermcp.tools.pdf_operations import PDFOperations
+
+        return PDFOperations(executor=self.pool)
+
+    def scratch_dir(self) -> Path:
+        """A new empty output directory."""
+        self._scratch += 1
+        path = self.workdir / f"run{self._scratch}"
+        path.mkdir(parents=True)
+        return path
+
+    def run(self, coroutine) -> Any:
+        return self.loop.run_until_complete(coroutine)
+
+    @lru_cache(maxsize=None)
+    def page_count(self, fixture: str) -> int:
+        """Page count of a fixture, read without touching the benchmarked caches."""
+        from pypdf import PdfReader
+
+        return len(PdfReader(self.fixtures[fixture]).pages)
+
+    @lru_cache(maxsize=None)
+    def pages(self, fixture: str) -> List[Dict[str, Any]]:
+        """Extracted page dictionaries of a fixture, for the in-memory cases."""
+        reader = self.reader()
+        path = self.fixtures[fixture]
+        page_count = self.run(reader._get_page_count(path))
+        return self.run(reader._get_pages(path, list(range(page_count))))
+
+    def close(self) -> None:
+        self.pool.shutdown(wait=True)
+        self.loop.close()
+
+
+def _check(response: str) -> None:
+    """Fail the case on an error response instead of timing it."""
+    if not response.startswith('{"success":true'):
+        raise RuntimeError(response[:500])
+
+
+# Each case prepares untimed state and returns the timed function, which
+# returns the number of pages it processed
+
+
+def extract_text_case(fixture: str, engine: str = "plumber") -> Callable[[CaseContext], Callable[[], int]]:
+    def prepare(ctx: CaseContext) -> Callable[[], int]:
+        reader = ctx.reader()
+        path = ctx.fixtures[fixture]
+        page_count = ctx.page_count(fixture)
+
+        def run() -> int:
+            _check(ctx.run(reader.extract_text(path, engine=engine)))
+            return page_count
+        return run
+    return prepare
+
+
+def extract_text_cached(ctx: CaseContext) -> Callable[[], int]:
+    """Second request for the same pages: served from the in-memory page cache."""
+    reader = ctx.reader()
+    path = ctx.fixtures["text_heavy"]
+    page_count = ctx.page_count("text_heavy")
+    _check(ctx.run(reader.extract_text(path)))
+
+    def run() -> int:
+        _check(ctx.run(reader.extract_text(path)))
+        return page_count
+    return run
+
+
+def chunk_pages_case(ctx: CaseContext) -> Callable[[], int]:
+    from pdfreadermcp.utils.chunker import TextChunker
+
+    pages = ctx.pages("text_heavy")
+    chunker = TextChunker(chunk_size=1000, chunk_overlap=100)
+
+    def run() -> int:
+        chunker.chunk_pages(pages)
+        return len(pages)
+    return run
+
+
+def text_quality_case(fixture: str) -> Callable[[CaseContext], Callable[[], int]]:
+    def prepare(ctx: CaseContext) -> Callable[[], int]:
+        from pdfreadermcp.utils.text_quality import analyze_text_quality
+
+        texts = [page['text'] for page in ctx.pages(fixture)]
+        analyze_text_quality(texts[0])  # warm up lazily built patterns
+
+        def run() -> int:
+            for text in texts:
+                analyze_text_quality(text)
+            return len(texts)
+        return run
+    return prepare
+
+
+def pdf_cache_hits(ctx: CaseContext) -> Callable[[], int]:
+    """Page cache lookups that hit the memory tier, including the file validity check."""
+    from pdfreadermcp.utils.cache import PDFCache
+
+    cache = PDFCache(max_entries=100000)
+    path = ctx.fixtures["many_pages"]
+    pages = ctx.pages("many_pages")
+    for page_num, page_data in enumerate(pages):
+        cache.set(path, 'page_text', page_data, page=page_num)
+
+    def run() -> int:
+        for _ in range(10):
+            for page_num in range(len(pages)):
+                if cache.get(path, 'page_text', page=page_num) is None:
+                    raise RuntimeError("unexpected cache miss")
+        return 10 * len(pages)
+    return run
+
+
+def split_pdf_case(ctx: CaseContext) -> Callable[[], int]:
+    operations = ctx.operations()
+    path = ctx.fixtures["many_pages"]
+    page_count = ctx.page_count("many_pages")
+    ranges = [f"{start}-{min(start + 49, page_count)}" for start in range(1, page_count + 1, 50)]
+    output_dir = ctx.scratch_dir()
+
+    def run() -> int:
+        _check(ctx.run(operations.split_pdf(path, ranges, output_dir=str(output_dir))))
+        return page_count
+    return run
+
+
+def extract_pages_case(ctx: CaseContext) -> Callable[[], int]:
+    operations = ctx.operations()
+    path = ctx.fixtures["many_pages"]
+    half = ctx.page_count("many_pages") // 2
+    output_dir = ctx.scratch_dir()
+
+    def run() -> int:
+        _check(ctx.run(operations.extract_pages(path, f"1-{half}", output_dir=str(output_dir))))
+        return half
+    return run
+
+
+def merge_pdfs_case(ctx: CaseContext) -> Callable[[], int]:
+    operations = ctx.operations()
+    files = sorted(str(path) for path in ctx.fixtures["many_small_files"].glob("*.pdf"))
+    output_dir = ctx.scratch_dir()
+
+    def run() -> int:
+        _check(ctx.run(operations.merge_pdfs(files, output_file="merged.pdf", output_dir=str(output_dir))))
+        return 2 * len(files)
+    return run
+
+
+CASES: Dict[str, Callable[[CaseContext], Callable[[], int]]] = {
+    "extract_text.text_heavy": extract_text_case("text_heavy"),
+    "extract_text.image_only": extract_text_case("image_only"),
+    "extract_text.many_pages": extract_text_case("many_pages"),
+    "extract_text.cjk": extract_text_case("cjk"),
+    "extract_text.text_heavy.auto": extract_text_case("text_heavy", "auto"),
+    "extract_text.image_only.auto": extract_text_case("image_only", "auto"),
+    "extract_text.cjk.auto": extract_text_case("cjk", "auto"),
+    "extract_text.cached": extract_text_cached,
+    "chunk_pages.text_heavy": chunk_pages_case,
+    "text_quality.text_heavy": text_quality_case("text_heavy"),
+    "text_quality.cjk": text_quality_case("cjk"),
+    "pdf_cache.hits": pdf_cache_hits,
+    "split_pdf.many_pages": split_pdf_case,
+    "extract_pages.many_pages": extract_pages_case,
+    "merge_pdfs.many_small_files": merge_pdfs_case,
+}
+
+
+def _peak_rss_mb() -> Dict[str, Optional[float]]:
+    """Peak RSS of this process and of its finished children, in megabytes."""
+    if resource is None:
+        return {'self': None, 'children': None}
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return {
+        'self': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale,
+        'children': resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / scale,
+    }
+
+
+def run_case(name: str, fixtures_dir: Path, repeat: int) -> Dict[str, Any]:
+    """Run one case in this process; called in the case subprocess."""
+    fixtures = pdf_fixtures.generate(fixtures_dir)
+    workdir = Path(tempfile.mkdtemp(prefix="pdfreadermcp-bench-"))
+    baseline = _peak_rss_mb()['self']
+    ctx = CaseContext(fixtures, workdir)
+    try:
+        timings = []
+        pages = 0
+        for _ in range(repeat):
+            run = CASES[name](ctx)
+            started = time.perf_counter()
+            pages = run()
+            timings.append(time.perf_counter() - started)
+    finally:
+        ctx.close()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    rss = _peak_rss_mb()
+    wall = min(timings)
+    peak = None if rss['self'] is None else max(rss['self'], rss['children'])
+    return {
+        'wall_s': round(wall, 6),
+        'mean_s': round(sum(timings) / len(timings), 6),
+        'pages': pages,
+        'pages_per_s': round(pages / wall, 1) if wall > 0 else None,
+        'peak_rss_mb': None if peak is None else round(peak, 1),
+        'baseline_rss_mb': None if baseline is None else round(baseline, 1),
+    }
+
+
+def _environment() -> Dict[str, Any]:
+    """Interpreter, platform and dependency versions the results were taken with."""
+    versions = {}
+    for package in ("pdfplumber", "pdfminer.six", "pypdf", "orjson"):
+        try:
+            from importlib.metadata import version
+            versions[package] = version(package)
+        except Exception:
+            versions[package] = None
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'packages': versions,
+    }
+
+
+def run_suite(names: List[str], fixtures_dir: Path, repeat: int) -> Dict[str, Any]:
+    """Run every case in its own subprocess and collect the results."""
+    pdf_fixtures.generate(fixtures_dir)
+    results = {}
+    for name in names:
+        completed = subprocess.run(
+            [sys.executable, __file__, "--run-case", name, "--fixtures-dir", str(fixtures_dir),
+             "--repeat", str(repeat)],
+            capture_output=True, text=True
+        )
+        if completed.returncode != 0:
+            results[name] = {'error': completed.stderr.strip().splitlines()[-1] if completed.stderr else 'failed'}
+        else:
+            results[name] = json.loads(completed.stdout.strip().splitlines()[-1])
+        _print_row(name, results[name])
+    return {
+        'version': RESULTS_VERSION,
+        'environment': _environment(),
+        'settings': {'repeat': repeat, 'fixtures_version': pdf_fixtures.FIXTURES_VERSION},
+        'cases': results,
+    }
+
+
+def _print_header() -> None:
+    print(f"{'case':<30} {'wall ms':>10} {'pages/s':>10} {'peak MB':>9}")
+
+
+def _print_row(name: str, result: Dict[str, Any]) -> None:
+    if 'error' in result:
+        print(f"{name:<30} error: {result['error']}")
+        return
+    peak = result['peak_rss_mb']
+    print(
+        f"{name:<30} {result['wall_s'] * 1000:>10.1f} {result['pages_per_s'] or 0:>10.1f} "
+        f"{'-' if peak is None else f'{peak:.1f}':>9}"
+    )
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> bool:
+    """
+    Print the change of every case shared by two result sets.
+
+    Args:
+        baseline: Earlier results
+        current: New results
+        threshold: Allowed relative increase of wall time and peak RSS
+
+    Returns:
+        True if no case regressed beyond the threshold
+    """
+    ok = True
+    print(f"{'case':<30} {'base ms':>10} {'ms':>10} {'change':>8} {'base MB':>9} {'MB':>9} {'change':>8}")
+    for name, now in current['cases'].items():
+        before = baseline['cases'].get(name)
+        if before is None or 'error' in before or 'error' in now:
+            print(f"{name:<30} {'not comparable':>10}")
+            continue
+
+        wall_change = now['wall_s'] / before['wall_s'] - 1 if before['wall_s'] else 0.0
+        rss_change = 0.0
+        if now['peak_rss_mb'] and before['peak_rss_mb']:
+            rss_change = now['peak_rss_mb'] / before['peak_rss_mb'] - 1
+
+        regressed = wall_change > threshold or rss_change > threshold
+        ok = ok and not regressed
+        print(
+            f"{name:<30} {before['wall_s'] * 1000:>10.1f} {now['wall_s'] * 1000:>10.1f} {wall_change:>+8.1%} "
+            f"{before['peak_rss_mb'] or 0:>9.1f} {now['peak_rss_mb'] or 0:>9.1f} {rss_change:>+8.1%}"
+            f"{'  REGRESSION' if regressed else ''}"
+        )
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case; the best is reported")
+    parser.add_argument("--cases", nargs="*", default=None,
+                        help="Run only cases whose name starts with one of these prefixes")
+    parser.add_argument("--fixtures-dir", type=Path,
+                        default=Path(tempfile.gettempdir()) / f"pdfreadermcp-bench-v{pdf_fixtures.FIXTURES_VERSION}",
+                        help="Directory for the generated PDFs (reused between runs)")
+    parser.add_argument("--output", type=Path, help="Write results as JSON to this file")
+    parser.add_argument("--compare", type=Path, help="Baseline results JSON to compare against")
+    parser.add_argument("--current", type=Path, help="Compare these results instead of running the suite")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Allowed relative increase before a case counts as a regression")
+    parser.add_argument("--run-case", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_case:
+        print(json.dumps(run_case(args.run_case, args.fixtures_dir, max(1, args.repeat))))
+        return
+
+    if args.current:
+        results = json.loads(args.current.read_text())
+    else:
+        names = [
+            name for name in CASES
+            if not args.cases or any(name.startswith(prefix) for prefix in args.cases)
+        ]
+        _print_header()
+        results = run_suite(names, args.fixtures_dir, max(1, args.repeat))
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+    if args.compare:
+        print()
+        if not compare(json.loads(args.compare.read_text()), results, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Server configuration loaded from environment variables.
+"""
+
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer environment variable, falling back to a default."""
+    value = os.environ.get(name)
+    if value is None or not value.strip():
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """Read a boolean environment variable ("1", "true", "yes", "on"), falling back to a default."""
+    value = os.environ.get(name)
+    if value is None or not value.strip():
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _default_cache_dir() -> str:
+    """Per-user cache directory, honouring XDG_CACHE_HOME."""
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return str(Path(base) / "pdfreadermcp")
+
+
+@dataclass
+class ServerConfig:
+    """
+    Runtime settings for the MCP server.
+
+    Every field can be overridden with a ``PDFREADERMCP_*`` environment
+    variable (see ``from_env``).
+    """
+    max_threads: int = 4
+    max_processes: int = 0
+    max_concurrency: int = 8
+    process_min_pages: int = 20
+    memory_cache_mb: int = 256
+    cache_dir: str = field(default_factory=_default_cache_dir)
+    disk_cache_mb: int = 512
+    cache_identity: str = "path"
+    document_idle_seconds: int = 120
+    max_open_documents: int = 0
+    tokenizer: str = "approximate"
+    log_level: str = "INFO"
+    log_timings: bool = False
+    metrics_file: str = ""
+    metrics_interval_seconds: int = 15
+    profile_dir: str = ""
+    profile_threshold_ms: int = 2000
+
+    @classmethod
+    def from_env(cls) -> "ServerConfig":
+        """
+        Build a configuration from the process environment.
+
+        Recognised variables:
+            PDFREADERMCP_MAX_THREADS: Thread pool size for light work
+            PDFREADERMCP_MAX_PROCESSES: Process pool size for CPU-bound work
+                (0 uses the CPU count, a negative value disables the pool)
+            PDFREADERMCP_MAX_CONCURRENCY: Maximum jobs running at once
+            PDFREADERMCP_PROCESS_MIN_PAGES: Minimum page count before text
+                extraction is moved to the process pool
+            PDFREADERMCP_MEMORY_CACHE_MB: Memory budget of the in-process
+                page cache in megabytes
+            PDFREADERMCP_CACHE_DIR: Directory for the persistent cache
+            PDFREADERMCP_DISK_CACHE_MB: Size cap of the persistent cache in
+                megabytes (0 disables it)
+            PDFREADERMCP_CACHE_IDENTITY: How cached files are identified,
+                "path" (path + mtime/size) or "content" (content fingerprint)
+            PDFREADERMCP_DOCUMENT_IDLE_SECONDS: Seconds before an unused
+                open document is closed
+            PDFREADERMCP_MAX_OPEN_DOCUMENTS: Maximum number of open document
+                handles (0 derives a limit from the file descriptor limit)
+            PDFREADERMCP_TOKENIZER: Tokenizer for chunks sized in tokens,
+                "approximate" or a tiktoken encoding such as "cl100k_base"
+            PDFREADERMCP_LOG_LEVEL: Level of the JSON logs written to stderr
+            PDFREADERMCP_LOG_TIMINGS: Log per-stage timings of every read_pdf
+                call ("1"/"true"), not only of calls that request them
+            PDFREADERMCP_METRICS_FILE: File the server stats are written to
+                in Prometheus text format (unset disables the export)
+            PDFREADERMCP_METRICS_INTERVAL_SECONDS: Minimum seconds between
+                rewrites of the metrics file
+            PDFREADERMCP_PROFILE_DIR: Directory receiving stack-sample
+                profiles of slow tool calls (unset disables profiling)
+            PDFREADERMCP_PROFILE_THRESHOLD_MS: Tool calls taking at least
+                this many milliseconds are profiled
+
+        Returns:
+            ServerConfig instance
+        """
+        defaults = cls()
+        return cls(
+            max_threads=_env_int("PDFREADERMCP_MAX_THREADS", defaults.max_threads),
+            max_processes=_env_int("PDFREADERMCP_MAX_PROCESSES", defaults.max_processes),
+            max_concurrency=_env_int("PDFREADERMCP_MAX_CONCURRENCY", defaults.max_concurrency),
+            process_min_pages=_env_int("PDFREADERMCP_PROCESS_MIN_PAGES", defaults.process_min_pages),
+            memory_cache_mb=_env_int("PDFREADERMCP_MEMORY_CACHE_MB", defaults.memory_cache_mb),
+            cache_dir=os.environ.get("PDFREADERMCP_CACHE_DIR") or defaults.cache_dir,
+            disk_cache_mb=_env_int("PDFREADERMCP_DISK_CACHE_MB", defaults.disk_cache_mb),
+            cache_identity=os.environ.get("PDFREADERMCP_CACHE_IDENTITY") or defaults.cache_identity,
+            document_idle_seconds=_env_int("PDFREADERMCP_DOCUMENT_IDLE_SECONDS", defaults.document_idle_seconds),
+            max_open_documents=_env_int("PDFREADERMCP_MAX_OPEN_DOCUMENTS", defaults.max_open_documents),
+            tokenizer=os.environ.get("PDFREADERMCP_TOKENIZER") or defaults.tokenizer,
+            log_level=os.environ.get("PDFREADERMCP_LOG_LEVEL") or defaults.log_level,
+            log_timings=_env_bool("PDFREADERMCP_LOG_TIMINGS", defaults.log_timings),
+            metrics_file=os.environ.get("PDFREADERMCP_METRICS_FILE") or defaults.metrics_file,
+            metrics_interval_seconds=_env_int(
+                "PDFREADERMCP_METRICS_INTERVAL_SECONDS", defaults.metrics_interval_seconds
+            ),
+            profile_dir=os.environ.get("PDFREADERMCP_PROFILE_DIR") or defaults.profile_dir,
+            profile_threshold_ms=_env_int("PDFREADERMCP_PROFILE_THRESHOLD_MS", defaults.profile_threshold_ms),
+        )
@@ -2,60 +2,242 @@
 MCP Server for PDF reading with text extraction.
 """
 
-from typing import Any, List
-from mcp.server.fastmcp import FastMCP
+from typing import Any, Dict, List
+from mcp.server.fastmcp import Context, FastMCP
 from .tools.pdf_reader import PDFReader
 from .tools.pdf_operations import PDFOperations
+from .utils.executor import WorkerPool
+from .utils.disk_cache import DiskCache
+from .utils.document_cache import DocumentCache
+from .utils.fingerprint import FileFingerprinter
+from .utils.pdf_probe import PDFProbe
+from .utils.tokenizer import get_tokenizer
+from .utils.serializer import dumps
+from .utils.instrumentation import configure_logging, logger
+from .utils.metrics import ServerMetrics, process_memory
+from .utils.profiler import SlowCallProfiler
+from .config import ServerConfig
 
 # Create FastMCP app
 app = FastMCP("PDF Reader MCP Server")
 
+# Shared worker pool so blocking PDF work never runs on the event loop
+config = ServerConfig.from_env()
+configure_logging(config.log_level)
+worker_pool = WorkerPool.from_config(config)
+
+# Persistent cache tier so extracted text survives server restarts
+disk_cache = None
+if config.disk_cache_mb > 0:
+    disk_cache = DiskCache(config.cache_dir, max_bytes=config.disk_cache_mb * 1024 * 1024)
+
+# Opened documents are pooled so consecutive tools reuse the parsed file
+document_cache = DocumentCache(
+    idle_timeout=config.document_idle_seconds,
+    max_open=config.max_open_documents
+)
+
+# One fingerprinter for every cache, so each file is hashed and memoized once
+fingerprinter = FileFingerprinter() if config.cache_identity == "content" else None
+
+# Page counts and document metadata come from a cached trailer/xref probe
+pdf_probe = PDFProbe(
+    documents=document_cache,
+    disk_cache=disk_cache,
+    cache_identity=config.cache_identity,
+    fingerprinter=fingerprinter
+)
+
+# An unusable tokenizer setting must not keep the server from starting
+try:
+    tokenizer = get_tokenizer(config.tokenizer)
+except (ImportError, ValueError, OSError) as e:
+    logger.warning(
+        "PDFREADERMCP_TOKENIZER=%r cannot be used (%s); using the approximate tokenizer",
+        config.tokenizer, e
+    )
+    tokenizer = get_tokenizer()
+
 # Initialize PDF processing tools
-pdf_reader = PDFReader()
-pdf_operations = PDFOperations()
+pdf_reader = PDFReader(
+    executor=worker_pool,
+    process_min_pages=config.process_min_pages,
+    cache_max_bytes=config.memory_cache_mb * 1024 * 1024,
+    disk_cache=disk_cache,
+    cache_identity=config.cache_identity,
+    fingerprinter=fingerprinter,
+    documents=document_cache,
+    probe=pdf_probe,
+    tokenizer=tokenizer,
+    log_timings=config.log_timings
+)
+pdf_operations = PDFOperations(executor=worker_pool, documents=document_cache, probe=pdf_probe)
+
+# Per-tool call counts, latencies and pages, reported by server_stats
+metrics = ServerMetrics()
+
+
+def collect_stats() -> Dict[str, Any]:
+    """Gather tool metrics, cache, worker pool and memory statistics."""
+    return {
+        'success': True,
+        **metrics.snapshot(),
+        'caches': {
+            'pages': pdf_reader.page_cache.get_stats(),
+            'pdf_info': pdf_probe.cache.get_stats(),
+            'documents': document_cache.get_stats()
+        },
+        'worker_pool': worker_pool.get_stats(),
+        'memory': process_memory()
+    }
+
+
+if config.metrics_file:
+    metrics.export_to(config.metrics_file, collect_stats, config.metrics_interval_seconds)
+
+# Opt-in stack sampling; calls slower than the threshold leave a profile
+profiler = SlowCallProfiler(
+    directory=config.profile_dir or None,
+    threshold_seconds=config.profile_threshold_ms / 1000
+)
 
 
 @app.tool()
+@metrics.instrument
+@profiler.instrument
 async def read_pdf(
     file_path: str,
     pages: str = None,
     chunk_size: int = 1000,
-    chunk_overlap: int = 100
+    chunk_overlap: int = 100,
+    parallel: bool = None,
+    stream: bool = False,
+    cursor: str = None,
+    max_chunks: int = None,
+    size_unit: str = "chars",
+    chunk_mode: str = "page",
+    format: str = "compact",
+    timings: bool = False,
+    engine: str = "plumber",
+    ctx: Context = None
 ) -> str:
     """Extract text from PDF files with intelligent page handling and chunking.
     
+    In streaming mode every page is sent as soon as it is parsed: a progress
+    notification tracks pages done, and a log message (logger "read_pdf")
+    carries the page's chunks as JSON. The final result then only contains
+    the summary.
+    
     Args:
         file_path: Path to the PDF file
         pages: Page range (e.g., '1,3,5-10,-1' for pages 1, 3, 5 to 10, and last page)
         chunk_size: Maximum size of text chunks
         chunk_overlap: Overlap between chunks to preserve context
+        parallel: Extract pages across worker processes (default: automatic for large ranges)
+        stream: Send pages incrementally through notifications instead of one large result
+        cursor: Continuation cursor from a previous paginated response
+        max_chunks: Maximum chunks per response; enables pagination with a 'next_cursor'
+        size_unit: Unit of chunk_size and chunk_overlap: 'chars' or 'tokens' (sized for LLM/embedding budgets)
+        chunk_mode: 'page' keeps chunks within a page, 'document' lets chunks span pages (fewer, fuller chunks)
+        format: Response format: 'compact' (default), 'pretty' (indented) or 'ndjson' (one line per chunk after a header line)
+        timings: Add per-stage and per-page timings, cache hits and misses to the response under 'metadata'
+        engine: Text extraction engine: 'plumber' (default, pdfplumber layout analysis), 'pypdf' (content stream order, several times faster) or 'auto' (pypdf for pages drawn top to bottom, pdfplumber for columns and rotated text); each page's metadata reports the engine used
         
     Returns:
         JSON string with extracted text and metadata
     """
     try:
+        if stream:
+            async def send_page(page: Dict[str, Any], pages_done: int, pages_total: int) -> None:
+                if ctx is None:
+                    return
+                await ctx.log('info', dumps(page), logger_name='read_pdf')
+                await ctx.report_progress(pages_done, pages_total)
+            
+            return await pdf_reader.extract_text_stream(
+                file_path=file_path,
+                pages=pages,
+                chunk_size=chunk_size,
+                chunk_overlap=chunk_overlap,
+                on_page=send_page,
+                size_unit=size_unit,
+                chunk_mode=chunk_mode,
+                output_format=format,
+                timings=timings,
+                engine=engine
+            )
+        
         result = await pdf_reader.extract_text(
             file_path=file_path,
             pages=pages,
             chunk_size=chunk_size,
-            chunk_overlap=chunk_overlap
+            chunk_overlap=chunk_overlap,
+            parallel=parallel,
+            cursor=cursor,
+            max_chunks=max_chunks,
+            size_unit=size_unit,
+            chunk_mode=chunk_mode,
+            output_format=format,
+            timings=timings,
+            engine=engine
         )
         return result
     except Exception as e:
-        import json
-        return json.dumps({
+        return dumps({
             'success': False,
             'error': f'PDF text extraction failed: {str(e)}',
             'extraction_method': 'text_extraction'
-        }, ensure_ascii=False, indent=2)
+        })
+
+
+@app.tool()
+@metrics.instrument
+@profiler.instrument
+async def pdf_info(
+    file_path: str,
+    include_pages: bool = False,
+    format: str = "compact"
+) -> str:
+    """Get PDF metadata without extracting text.
+    
+    Reads the page count, PDF version, encryption flag, producer and
+    linearization status from the document's cross-reference data, trailer
+    and catalog without reading any page content, and caches the result.
+    Use it to plan page ranges before calling read_pdf or the page tools;
+    include_pages loads the full page list and is slower.
+    
+    Args:
+        file_path: Path to the PDF file
+        include_pages: Also list each page's size, rotation and object offset
+        format: Response format: 'compact' (default), 'pretty' (indented) or 'ndjson'
+        
+    Returns:
+        JSON string with document metadata
+    """
+    try:
+        result = await pdf_reader.get_info(
+            file_path=file_path,
+            include_pages=include_pages,
+            output_format=format
+        )
+        return result
+    except Exception as e:
+        return dumps({
+            'success': False,
+            'error': f'PDF info failed: {str(e)}',
+            'operation': 'pdf_info'
+        })
 
 
 @app.tool()
+@metrics.instrument
+@profiler.instrument
 async def split_pdf(
     file_path: str,
     split_ranges: List[str],
     output_dir: str = None,
-    prefix: str = None
+    prefix: str = None,
+    format: str = "compact"
 ) -> str:
     """Split PDF into multiple files based on page ranges.
     
@@ -64,6 +246,7 @@ async def split_pdf(
         split_ranges: List of page ranges (e.g., ["1-5", "6-10", "11-15"])
         output_dir: Output directory (defaults to source file directory)
         prefix: Output file prefix (defaults to source filename)
+        format: Response format: 'compact' (default), 'pretty' (indented) or 'ndjson'
         
     Returns:
         JSON string with split operation results and output file information
@@ -73,24 +256,27 @@ async def split_pdf(
             file_path=file_path,
             split_ranges=split_ranges,
             output_dir=output_dir,
-            prefix=prefix
+            prefix=prefix,
+            output_format=format
         )
         return result
     except Exception as e:
-        import json
-        return json.dumps({
+        return dumps({
             'success': False,
             'error': f'PDF split failed: {str(e)}',
             'operation': 'split_pdf'
-        }, ensure_ascii=False, indent=2)
+        })
 
 
 @app.tool()
+@metrics.instrument
+@profiler.instrument
 async def extract_pages(
     file_path: str,
     pages: str,
     output_file: str = None,
-    output_dir: str = None
+    output_dir: str = None,
+    format: str = "compact"
 ) -> str:
     """Extract specific pages from PDF to a new file.
     
@@ -99,6 +285,7 @@ async def extract_pages(
         pages: Page range (e.g., "1,3,5-7" for pages 1, 3, and 5 to 7)
         output_file: Output filename (optional, auto-generated if not provided)
         output_dir: Output directory (defaults to source file directory)
+        format: Response format: 'compact' (default), 'pretty' (indented) or 'ndjson'
         
     Returns:
         JSON string with extraction results and output file information
@@ -108,23 +295,26 @@ async def extract_pages(
             file_path=file_path,
             pages=pages,
             output_file=output_file,
-            output_dir=output_dir
+            output_dir=output_dir,
+            output_format=format
         )
         return result
     except Exception as e:
-        import json
-        return json.dumps({
+        return dumps({
             'success': False,
             'error': f'Page extraction failed: {str(e)}',
             'operation': 'extract_pages'
-        }, ensure_ascii=False, indent=2)
+        })
 
 
 @app.tool()
+@metrics.instrument
+@profiler.instrument
 async def merge_pdfs(
     file_paths: List[str],
     output_file: str = None,
-    output_dir: str = None
+    output_dir: str = None,
+    format: str = "compact"
 ) -> str:
     """Merge multiple PDF files into a single file.
     
@@ -132,6 +322,7 @@ async def merge_pdfs(
         file_paths: List of PDF file paths to merge
         output_file: Output filename (optional, auto-generated if not provided)
         output_dir: Output directory (defaults to first file's directory)
+        format: Response format: 'compact' (default), 'pretty' (indented) or 'ndjson'
         
     Returns:
         JSON string with merge results and output file information
@@ -140,15 +331,46 @@ async def merge_pdfs(
         result = await pdf_operations.merge_pdfs(
             file_paths=file_paths,
             output_file=output_file,
-            output_dir=output_dir
+            output_dir=output_dir,
+            output_format=format
         )
         return result
     except Exception as e:
-        import json
-        return json.dumps({
+        return dumps({
             'success': False,
             'error': f'PDF merge failed: {str(e)}',
             'operation': 'merge_pdfs'
-        }, ensure_ascii=False, indent=2)
+        })
 
 
+@app.tool()
+@metrics.instrument
+@profiler.instrument
+async def server_stats(format: str = "compact") -> str:
+    """Report server-wide metrics for monitoring and capacity planning.
+    
+    Includes per-tool call and error counts, calls in flight, pages read or
+    written, pages per second, latency histograms (cumulative buckets in
+    seconds with estimated p50/p90/p99), hit ratios of the page, pdf_info
+    and open-document caches, worker pool queue depth and running jobs, and
+    the server's resident memory. When PDFREADERMCP_METRICS_FILE is set the
+    same data is also written there in Prometheus text format.
+    
+    Args:
+        format: Response format: 'compact' (default), 'pretty' (indented) or 'ndjson'
+        
+    Returns:
+        JSON string with server statistics
+    """
+    try:
+        # Collected on the event loop, not the worker pool, so the stats
+        # stay available while every worker is busy; no part of it waits for
+        # a worker (the disk tier reports counters kept by its writers)
+        stats = collect_stats()
+        return dumps(stats, format)
+    except Exception as e:
+        return dumps({
+            'success': False,
+            'error': f'Server stats failed: {str(e)}',
+            'operation': 'server_stats'
+        })
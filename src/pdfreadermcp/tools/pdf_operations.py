@@ -5,7 +5,6 @@ PDF operations tool for splitting, extracting, and merging PDF documents.
 import asyncio
 from pathlib import Path
 from typing import List, Optional, Dict, Any, Union
-import json
 from datetime import datetime
 
 try:
@@ -15,7 +14,11 @@ except ImportError:
     PdfWriter = None
 
 from ..utils.file_handler import FileHandler
-from ..utils.cache import PDFCache
+from ..utils.document_cache import DocumentCache
+from ..utils.executor import WorkerPool
+from ..utils.metrics import count_pages
+from ..utils.pdf_probe import PDFProbe
+from ..utils.serializer import check_format, dumps
 
 
 class PDFOperations:
@@ -23,17 +26,32 @@ class PDFOperations:
     PDF operations tool for splitting, extracting pages, and merging PDFs.
     """
     
-    def __init__(self):
-        """Initialize the PDF operations tool."""
+    def __init__(
+        self,
+        executor: Optional[WorkerPool] = None,
+        documents: Optional[DocumentCache] = None,
+        probe: Optional[PDFProbe] = None
+    ):
+        """
+        Initialize the PDF operations tool.
+        
+        Args:
+            executor: Worker pool for blocking work (a private pool is created if omitted)
+            documents: Cache of opened documents, shared with PDFReader
+            probe: Metadata probe used for page counts, shared with PDFReader
+        """
         self.file_handler = FileHandler()
-        self.cache = PDFCache(max_entries=20, max_age_seconds=1800)  # 30 minutes
+        self.documents = documents or DocumentCache()
+        self.probe = probe or PDFProbe(documents=self.documents)
+        self.executor = executor or WorkerPool()
     
     async def split_pdf(
         self,
         file_path: Union[str, Path],
         split_ranges: List[str],
         output_dir: Optional[str] = None,
-        prefix: Optional[str] = None
+        prefix: Optional[str] = None,
+        output_format: str = "compact"
     ) -> str:
         """
         Split PDF into multiple files based on page ranges.
@@ -43,16 +61,31 @@ class PDFOperations:
             split_ranges: List of page ranges (e.g., ["1-5", "6-10", "11-15"])
             output_dir: Output directory (defaults to source file directory)
             prefix: Output file prefix (defaults to source filename)
+            output_format: Response format, 'compact', 'pretty' or 'ndjson'
             
         Returns:
             JSON string with operation results
         """
+        return await self.executor.run_in_thread(
+            self._split_pdf, file_path, split_ranges, output_dir, prefix, output_format
+        )
+    
+    def _split_pdf(
+        self,
+        file_path: Union[str, Path],
+        split_ranges: List[str],
+        output_dir: Optional[str] = None,
+        prefix: Optional[str] = None,
+        output_format: str = "compact"
+    ) -> str:
+        """Blocking implementation of ``split_pdf``, run on the worker pool."""
         if PdfReader is None or PdfWriter is None:
             return self._error_response("pypdf is not installed. Please install it with: pip install pypdf")
         
         try:
             # Validate source file
             pdf_path = self.file_handler.validate_pdf_path(file_path)
+            check_format(output_format)
             
             # Set defaults
             if output_dir is None:
@@ -64,40 +97,46 @@ class PDFOperations:
             if prefix is None:
                 prefix = pdf_path.stem
             
-            # Read source PDF
-            reader = PdfReader(pdf_path)
-            total_pages = len(reader.pages)
-            
-            # Process each split range
-            output_files = []
+            # Plan the output files from the probed page count
+            total_pages = self.probe.page_count(pdf_path)
+            planned_splits = []
             for i, range_str in enumerate(split_ranges, 1):
                 # Parse page range
                 page_numbers = self.file_handler.parse_page_range(range_str, total_pages)
                 
-                if not page_numbers:
-                    continue
-                
-                # Create output filename
-                output_filename = f"{prefix}_split_{i:02d}.pdf"
-                output_path = output_dir / output_filename
-                
-                # Create new PDF with specified pages
-                writer = PdfWriter()
-                for page_num in page_numbers:
-                    if 0 <= page_num < total_pages:
-                        writer.add_page(reader.pages[page_num])
-                
-                # Write to file
-                with open(output_path, 'wb') as output_file:
-                    writer.write(output_file)
-                
-                output_files.append({
-                    'filename': output_filename,
-                    'path': str(output_path),
-                    'pages': [p + 1 for p in page_numbers],  # Convert to 1-indexed
-                    'page_count': len(page_numbers),
-                    'size': output_path.stat().st_size
-                })
+                if page_numbers:
+                    planned_splits.append((i, page_numbers))
+            
+            output_files = []
+            if planned_splits:
+                # Read source PDF (reusing an already parsed document)
+                with self.documents.acquire(pdf_path, 'pypdf') as reader:
+                    available_pages = len(reader.pages)
+                    
+                    # Process each split range
+                    for i, page_numbers in planned_splits:
+                        # Create output filename
+                        output_filename = f"{prefix}_split_{i:02d}.pdf"
+                        output_path = output_dir / output_filename
+                        
+                        # Create new PDF with specified pages
+                        writer = PdfWriter()
+                        for page_num in page_numbers:
+                            if 0 <= page_num < available_pages:
+                                writer.add_page(reader.pages[page_num])
+                        
+                        # Write to file
+                        with open(output_path, 'wb') as output_file:
+                            writer.write(output_file)
+                        
+                        count_pages(len(page_numbers))
+                        output_files.append({
+                            'filename': output_filename,
+                            'path': str(output_path),
+                            'pages': [p + 1 for p in page_numbers],  # Convert to 1-indexed
+                            'page_count': len(page_numbers),
+                            'size': output_path.stat().st_size
+                        })
             
             result = {
                 'success': True,
@@ -109,7 +148,7 @@ class PDFOperations:
                 'split_count': len(output_files)
             }
             
-            return self._format_result(result)
+            return self._format_result(result, output_format)
             
         except Exception as e:
             return self._error_response(f"PDF split failed: {str(e)}")
@@ -119,7 +158,8 @@ class PDFOperations:
         file_path: Union[str, Path],
         pages: str,
         output_file: Optional[str] = None,
-        output_dir: Optional[str] = None
+        output_dir: Optional[str] = None,
+        output_format: str = "compact"
     ) -> str:
         """
         Extract specific pages from PDF to a new file.
@@ -129,16 +169,31 @@ class PDFOperations:
             pages: Page range (e.g., "1,3,5-7")
             output_file: Output filename (optional, auto-generated if not provided)
             output_dir: Output directory (defaults to source file directory)
+            output_format: Response format, 'compact', 'pretty' or 'ndjson'
             
         Returns:
             JSON string with operation results
         """
+        return await self.executor.run_in_thread(
+            self._extract_pages, file_path, pages, output_file, output_dir, output_format
+        )
+    
+    def _extract_pages(
+        self,
+        file_path: Union[str, Path],
+        pages: str,
+        output_file: Optional[str] = None,
+        output_dir: Optional[str] = None,
+        output_format: str = "compact"
+    ) -> str:
+        """Blocking implementation of ``extract_pages``, run on the worker pool."""
         if PdfReader is None or PdfWriter is None:
             return self._error_response("pypdf is not installed. Please install it with: pip install pypdf")
         
         try:
             # Validate source file
             pdf_path = self.file_handler.validate_pdf_path(file_path)
+            check_format(output_format)
             
             # Set output directory
             if output_dir is None:
@@ -147,16 +202,23 @@ class PDFOperations:
                 output_dir = Path(output_dir)
                 output_dir.mkdir(parents=True, exist_ok=True)
             
-            # Read source PDF
-            reader = PdfReader(pdf_path)
-            total_pages = len(reader.pages)
-            
-            # Parse page range
+            # Parse page range against the probed page count
+            total_pages = self.probe.page_count(pdf_path)
             page_numbers = self.file_handler.parse_page_range(pages, total_pages)
             
             if not page_numbers:
                 return self._error_response("No valid pages specified")
             
+            # Read source PDF (reusing an already parsed document)
+            with self.documents.acquire(pdf_path, 'pypdf') as reader:
+                available_pages = len(reader.pages)
+                
+                # Create new PDF with specified pages
+                writer = PdfWriter()
+                for page_num in page_numbers:
+                    if 0 <= page_num < available_pages:
+                        writer.add_page(reader.pages[page_num])
+            
             # Generate output filename if not provided
             if output_file is None:
                 pages_desc = pages.replace(',', '_').replace('-', 'to')
@@ -164,16 +226,12 @@ class PDFOperations:
             
             output_path = output_dir / output_file
             
-            # Create new PDF with specified pages
-            writer = PdfWriter()
-            for page_num in page_numbers:
-                if 0 <= page_num < total_pages:
-                    writer.add_page(reader.pages[page_num])
-            
             # Write to file
             with open(output_path, 'wb') as file:
                 writer.write(file)
             
+            count_pages(len(page_numbers))
+            
             result = {
                 'success': True,
                 'operation': 'extract_pages',
@@ -185,7 +243,7 @@ class PDFOperations:
                 'output_size': output_path.stat().st_size
             }
             
-            return self._format_result(result)
+            return self._format_result(result, output_format)
             
         except Exception as e:
             return self._error_response(f"Page extraction failed: {str(e)}")
@@ -194,7 +252,8 @@ class PDFOperations:
         self,
         file_paths: List[str],
         output_file: Optional[str] = None,
-        output_dir: Optional[str] = None
+        output_dir: Optional[str] = None,
+        output_format: str = "compact"
     ) -> str:
         """
         Merge multiple PDF files into a single file.
@@ -203,10 +262,23 @@ class PDFOperations:
             file_paths: List of PDF file paths to merge
             output_file: Output filename (optional, auto-generated if not provided)
             output_dir: Output directory (defaults to first file's directory)
+            output_format: Response format, 'compact', 'pretty' or 'ndjson'
             
         Returns:
             JSON string with operation results
         """
+        return await self.executor.run_in_thread(
+            self._merge_pdfs, file_paths, output_file, output_dir, output_format
+        )
+    
+    def _merge_pdfs(
+        self,
+        file_paths: List[str],
+        output_file: Optional[str] = None,
+        output_dir: Optional[str] = None,
+        output_format: str = "compact"
+    ) -> str:
+        """Blocking implementation of ``merge_pdfs``, run on the worker pool."""
         if PdfReader is None or PdfWriter is None:
             return self._error_response("pypdf is not installed. Please install it with: pip install pypdf")
         
@@ -219,6 +291,7 @@ class PDFOperations:
             for file_path in file_paths:
                 pdf_path = self.file_handler.validate_pdf_path(file_path)
                 validated_paths.append(pdf_path)
+            check_format(output_format)
             
             # Set output directory
             if output_dir is None:
@@ -240,12 +313,14 @@ class PDFOperations:
             total_pages = 0
             
             for pdf_path in validated_paths:
-                reader = PdfReader(pdf_path)
-                page_count = len(reader.pages)
-                
-                # Add all pages from this PDF
-                for page in reader.pages:
-                    writer.add_page(page)
+                # Pages are copied into the writer, so each source is only
+                # checked out while its pages are added
+                with self.documents.acquire(pdf_path, 'pypdf') as reader:
+                    page_count = len(reader.pages)
+                    
+                    # Add all pages from this PDF
+                    for page in reader.pages:
+                        writer.add_page(page)
                 
                 source_info.append({
                     'filename': pdf_path.name,
@@ -260,6 +335,8 @@ class PDFOperations:
             with open(output_path, 'wb') as file:
                 writer.write(file)
             
+            count_pages(total_pages)
+            
             result = {
                 'success': True,
                 'operation': 'merge_pdfs',
@@ -270,18 +347,18 @@ class PDFOperations:
                 'output_size': output_path.stat().st_size
             }
             
-            return self._format_result(result)
+            return self._format_result(result, output_format)
             
         except Exception as e:
             return self._error_response(f"PDF merge failed: {str(e)}")
     
-    def _format_result(self, result: Dict[str, Any]) -> str:
+    def _format_result(self, result: Dict[str, Any], output_format: str = "compact") -> str:
         """Format result as JSON string."""
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return dumps(result, output_format)
     
     def _error_response(self, message: str) -> str:
-        """Format error response."""
-        return json.dumps({
+        """Format error response as compact JSON."""
+        return dumps({
             'success': False,
             'error': message
-        }, ensure_ascii=False, indent=2)
\ No newline at end of file
+        })
\ No newline at end of file
@@ -1,20 +1,285 @@
 """
-PDF text extraction tool using pdfplumber with intelligent text quality detection.
+PDF text extraction tool using pdfplumber or pypdf with intelligent text quality detection.
 """
 
 import asyncio
+import base64
+import json
+import time
+from collections import deque
+from contextlib import ExitStack
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Union
-import re
+from typing import AsyncIterator, Awaitable, Callable, ContextManager, List, Optional, Dict, Any, Tuple, Union
 
 try:
     import pdfplumber
 except ImportError:
     pdfplumber = None
 
+try:
+    from pypdf import PdfReader
+except ImportError:
+    PdfReader = None
+
 from ..utils.file_handler import FileHandler
-from ..utils.chunker import TextChunker, TextChunk
+from ..utils.chunker import DocumentChunker, TextChunker, TextChunk
+from ..utils.serializer import check_format, dumps
 from ..utils.cache import PDFCache
+from ..utils.disk_cache import DiskCache
+from ..utils.document_cache import DocumentCache
+from ..utils.executor import WorkerPool
+from ..utils.fingerprint import FileFingerprinter
+from ..utils.instrumentation import NULL_TIMER, RequestTimer
+from ..utils.metrics import count_pages
+from ..utils.pdf_probe import PDFProbe
+from ..utils.text_quality import QUALITY_VERSION, analyze_text_quality
+from ..utils.tokenizer import Tokenizer
+
+
+# Text extraction engines: pdfplumber's layout analysis, pypdf's content
+# stream order, or pypdf for pages whose text is drawn in reading order
+ENGINES = ("plumber", "pypdf", "auto")
+
+# Bump when the rules choosing an engine in 'auto' mode change
+AUTO_ENGINE_VERSION = 1
+
+# Document kinds (as opened by DocumentCache) used by each engine
+_ENGINE_DOCUMENTS = {'plumber': 'pdfplumber', 'pypdf': 'pypdf', 'auto': 'pypdf'}
+
+
+def extract_page_records(
+    pdf_path: str,
+    page_numbers: List[int],
+    timed: bool = False,
+    engine: str = "plumber"
+) -> List[Dict[str, Any]]:
+    """
+    Extract text and quality metrics for a list of pages.
+    
+    Module-level so it can run inside worker processes.
+    
+    Args:
+        pdf_path: Path to PDF file
+        page_numbers: 0-indexed page numbers to extract
+        timed: Add per-page stage times in seconds under 'timings'
+        engine: Extraction engine, 'plumber', 'pypdf' or 'auto'
+        
+    Returns:
+        List of page dictionaries with 'text', 'page_number' and 'metadata'
+    """
+    def open_document(kind: str) -> ContextManager[Any]:
+        if kind == 'pypdf':
+            return PdfReader(pdf_path)
+        return pdfplumber.open(pdf_path)
+    
+    with _OpenDocuments(open_document) as documents:
+        return _extract_pages(documents, page_numbers, engine, timed)
+
+
+class _OpenDocuments:
+    """
+    Document handles of one extraction job by kind, opened on first use.
+    
+    Each handle can be released on its own, so a job never has to hold a
+    pypdf and a pdfplumber handle of the shared document pool at once.
+    """
+    
+    def __init__(self, open_document: Callable[[str], ContextManager[Any]]):
+        self._open_document = open_document
+        self._handles: Dict[str, Any] = {}
+        self._stacks: Dict[str, ExitStack] = {}
+        self.open_seconds = 0.0
+    
+    def __enter__(self) -> "_OpenDocuments":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        for kind in list(self._stacks):
+            self.release(kind)
+    
+    def get(self, kind: str) -> Any:
+        """Return the 'pdfplumber' or 'pypdf' handle, opening it if needed."""
+        handle = self._handles.get(kind)
+        if handle is None:
+            started = time.perf_counter()
+            stack = ExitStack()
+            handle = stack.enter_context(self._open_document(kind))
+            self._stacks[kind] = stack
+            self._handles[kind] = handle
+            self.open_seconds += time.perf_counter() - started
+        return handle
+    
+    def release(self, kind: str) -> None:
+        """Close or return the handle of a kind, if one is open."""
+        self._handles.pop(kind, None)
+        stack = self._stacks.pop(kind, None)
+        if stack is not None:
+            stack.close()
+
+
+def _extract_pages(
+    documents: _OpenDocuments,
+    page_numbers: List[int],
+    engine: str = "plumber",
+    timed: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Extract page dictionaries with the given engine.
+    
+    In 'auto' mode every page is first extracted with pypdf, which is
+    several times faster than pdfplumber's character-level layout analysis.
+    The pypdf text is kept when it is drawn in reading order and passes the
+    quality check (or is empty on a page without fonts). The remaining
+    pages are extracted again with pdfplumber once the pypdf handle has
+    been released.
+    
+    When timed, every page gets a 'timings' entry and the time spent
+    opening documents is attributed to the first page.
+    """
+    reader = documents.get(_ENGINE_DOCUMENTS[engine])
+    total_pages = len(reader.pages)
+    page_numbers = [page_num for page_num in page_numbers if page_num < total_pages]
+    
+    # page number -> (text, engine used, quality analysis if already computed)
+    extracted: Dict[int, Tuple[str, str, Optional[Dict[str, Any]]]] = {}
+    extract_seconds: Dict[int, float] = {}
+    
+    plumber_pages = page_numbers
+    if engine != 'plumber':
+        plumber_pages = []
+        for page_num in page_numbers:
+            started = time.perf_counter()
+            result = _pypdf_page_text(reader, page_num, engine == 'auto')
+            extract_seconds[page_num] = time.perf_counter() - started
+            if result is None:
+                plumber_pages.append(page_num)
+            else:
+                extracted[page_num] = result
+        if plumber_pages:
+            documents.release('pypdf')
+    
+    if plumber_pages:
+        pdf = documents.get('pdfplumber')
+        for page_num in plumber_pages:
+            started = time.perf_counter()
+            page = pdf.pages[page_num]
+            text = page.extract_text() or ""
+            
+            # Drop the page's parsed layout objects; the document may stay open
+            page.close()
+            extracted[page_num] = (text, 'plumber', None)
+            extract_seconds[page_num] = extract_seconds.get(page_num, 0.0) + time.perf_counter() - started
+    
+    pages_content = []
+    for page_num in page_numbers:
+        text, page_engine, quality_info = extracted[page_num]
+        
+        # Analyze text quality (already done when 'auto' kept the pypdf text)
+        started = time.perf_counter()
+        if quality_info is None:
+            quality_info = analyze_text_quality(text)
+        
+        pages_content.append({
+            'text': text,
+            'page_number': page_num + 1,  # Convert back to 1-indexed for display
+            'metadata': {
+                'quality_score': quality_info['quality_score'],
+                'word_count': quality_info['word_count'],
+                'script': quality_info['script'],
+                'char_count': len(text),
+                'has_extractable_text': quality_info['has_extractable_text'],
+                'engine': page_engine
+            }
+        })
+        if timed:
+            pages_content[-1]['timings'] = {
+                'extract_text': extract_seconds[page_num],
+                'quality': time.perf_counter() - started
+            }
+    
+    if timed and pages_content:
+        pages_content[0]['timings']['open'] = documents.open_seconds
+    return pages_content
+
+
+def _pypdf_page_text(reader, page_num: int, check: bool) -> Optional[Tuple[str, str, Optional[Dict[str, Any]]]]:
+    """
+    Extract a page with pypdf.
+    
+    Args:
+        reader: pypdf document
+        page_num: 0-indexed page number
+        check: Only accept text drawn in reading order that passes the
+            quality check ('auto' mode)
+        
+    Returns:
+        Tuple of text, 'pypdf' and the quality analysis (None when not
+        checked), or None when the page needs pdfplumber
+    """
+    if not check:
+        return _pypdf_text(reader.pages[page_num])[0], 'pypdf', None
+    
+    try:
+        page = reader.pages[page_num]
+        text, in_reading_order = _pypdf_text(page)
+    except Exception:
+        return None
+    if in_reading_order:
+        quality_info = analyze_text_quality(text)
+        if quality_info['has_extractable_text'] or (not text.strip() and not _has_fonts(page)):
+            return text, 'pypdf', quality_info
+    return None
+
+
+def _pypdf_text(page) -> Tuple[str, bool]:
+    """Extract a pypdf page's text and whether it was drawn in reading order."""
+    check = _ReadingOrderCheck()
+    text = page.extract_text(visitor_text=check) or ""
+    return text, check.in_reading_order
+
+
+def _has_fonts(page) -> bool:
+    """Whether a pypdf page declares any fonts, i.e. may carry text."""
+    resources = page.get('/Resources')
+    if resources is None:
+        return False
+    return bool(resources.get_object().get('/Font'))
+
+
+class _ReadingOrderCheck:
+    """
+    pypdf text visitor checking that a page's text is upright and moves
+    down the page.
+    
+    pypdf returns text in content stream order, while pdfplumber orders
+    characters by position. Both agree when the text is drawn top to
+    bottom; text that jumps back up the page (columns, sidebars, tables
+    filled column-wise) or is rotated needs pdfplumber's layout analysis.
+    """
+    
+    def __init__(self):
+        self.in_reading_order = True
+        self._last_y: Optional[float] = None
+    
+    def __call__(self, text: str, cm: List[float], tm: List[float], font_dict: Any, font_size: float) -> None:
+        if not self.in_reading_order or not text.strip():
+            return
+        
+        # Text space to device space: the text matrix followed by the CTM
+        a = tm[0] * cm[0] + tm[1] * cm[2]
+        b = tm[0] * cm[1] + tm[1] * cm[3]
+        c = tm[2] * cm[0] + tm[3] * cm[2]
+        d = tm[2] * cm[1] + tm[3] * cm[3]
+        if abs(b) > 1e-3 * abs(a) or abs(c) > 1e-3 * abs(d):
+            self.in_reading_order = False
+            return
+        
+        # Moving up by more than a line (superscripts move less)
+        y = tm[4] * cm[1] + tm[5] * cm[3] + cm[5]
+        if self._last_y is not None and y > self._last_y + max(abs(d) * font_size, 1.0):
+            self.in_reading_order = False
+            return
+        self._last_y = y
 
 
 class PDFReader:
@@ -23,26 +288,111 @@ class PDFReader:
     and automatic OCR fallback recommendation.
     """
     
-    def __init__(self):
-        """Initialize the PDF reader with cache."""
-        self.cache = PDFCache(max_entries=50, max_age_seconds=1800)  # 30 minutes
+    # Chunks per response when paginating without an explicit max_chunks
+    DEFAULT_PAGE_CHUNKS = 50
+    
+    # Settings that change extracted page records, by engine; part of every page cache key
+    EXTRACTION_SETTINGS = {
+        'plumber': {'extractor': 'plumber', 'quality': QUALITY_VERSION},
+        'pypdf': {'extractor': 'pypdf', 'quality': QUALITY_VERSION},
+        'auto': {'extractor': 'auto', 'rules': AUTO_ENGINE_VERSION, 'quality': QUALITY_VERSION}
+    }
+    
+    def __init__(
+        self,
+        executor: Optional[WorkerPool] = None,
+        process_min_pages: int = 20,
+        cache_max_bytes: int = 256 * 1024 * 1024,
+        disk_cache: Optional[DiskCache] = None,
+        cache_identity: str = "path",
+        fingerprinter: Optional[FileFingerprinter] = None,
+        documents: Optional[DocumentCache] = None,
+        probe: Optional[PDFProbe] = None,
+        tokenizer: Optional[Tokenizer] = None,
+        log_timings: bool = False
+    ):
+        """
+        Initialize the PDF reader with cache.
+        
+        Args:
+            executor: Worker pool for blocking work (a private pool is created if omitted)
+            process_min_pages: Minimum number of pages before extraction moves to the process pool
+            cache_max_bytes: Memory budget of the page cache
+            disk_cache: Optional persistent tier for the page cache
+            cache_identity: Page cache file identity, 'path' or 'content'
+            fingerprinter: Fingerprinter for content identity, shared with
+                the probe (created if omitted)
+            documents: Cache of opened documents, shared with PDFOperations
+            probe: Metadata probe used for page counts, shared with PDFOperations
+            tokenizer: Tokenizer for chunks sized in tokens (defaults to the
+                approximate BPE tokenizer)
+            log_timings: Time every text extraction and log the timings to
+                the 'pdfreadermcp' logger, even when not requested
+        """
+        # Per-page extraction cache; chunking is redone from cached page text
+        self.page_cache = PDFCache(
+            max_entries=100000,
+            max_age_seconds=1800,  # 30 minutes
+            max_bytes=cache_max_bytes,
+            disk_cache=disk_cache,
+            identity=cache_identity,
+            fingerprinter=fingerprinter
+        )
         self.file_handler = FileHandler()
+        self.documents = documents or DocumentCache()
+        self.probe = probe or PDFProbe(
+            documents=self.documents,
+            disk_cache=disk_cache,
+            cache_identity=cache_identity,
+            fingerprinter=self.page_cache.fingerprinter
+        )
+        self.executor = executor or WorkerPool()
+        self.process_min_pages = process_min_pages
+        self.tokenizer = tokenizer
+        self.log_timings = log_timings
     
     async def extract_text(
         self,
         file_path: Union[str, Path],
         pages: Optional[str] = None,
         chunk_size: int = 1000,
-        chunk_overlap: int = 100
+        chunk_overlap: int = 100,
+        parallel: Optional[bool] = None,
+        cursor: Optional[str] = None,
+        max_chunks: Optional[int] = None,
+        size_unit: str = "chars",
+        chunk_mode: str = "page",
+        output_format: str = "compact",
+        timings: bool = False,
+        engine: str = "plumber"
     ) -> str:
         """
         Extract text from PDF with intelligent chunking and caching.
         
+        When max_chunks or cursor is given the response is paginated: it
+        holds at most max_chunks chunks plus a 'next_cursor' that resumes
+        extraction at the page where this response stopped.
+        
         Args:
             file_path: Path to PDF file
             pages: Page range string (e.g., "1,3,5-10,-1")
             chunk_size: Maximum size of text chunks
             chunk_overlap: Overlap between chunks
+            parallel: Shard pages across worker processes. None decides
+                automatically from the page count, False always extracts
+                sequentially in a single worker thread
+            cursor: Continuation cursor returned by a previous paginated call
+            max_chunks: Maximum number of chunks to return in this response
+            size_unit: Unit of chunk_size and chunk_overlap, 'chars' or 'tokens'
+            chunk_mode: 'page' keeps chunks within a page, 'document' lets
+                them continue across page boundaries
+            output_format: Response format, 'compact', 'pretty' or 'ndjson'
+            timings: Add per-stage and per-page timings under
+                'metadata.timings' (see ``RequestTimer``)
+            engine: Text extraction engine: 'plumber' (pdfplumber layout
+                analysis), 'pypdf' (content stream order, much faster) or
+                'auto' (pypdf for pages drawn in reading order, pdfplumber
+                for the rest); the engine used is in each page's metadata
             
         Returns:
             JSON string with extracted text and metadata
@@ -51,189 +401,689 @@ class PDFReader:
             return self._error_response("pdfplumber is not installed. Please install it with: pip install pdfplumber")
         
         try:
-            # Validate file path
+            # Validate file path and chunk settings before any page is parsed
             pdf_path = self.file_handler.validate_pdf_path(file_path)
+            chunker = self._make_chunker(chunk_size, chunk_overlap, size_unit, chunk_mode)
+            check_format(output_format)
+            self._check_engine(engine)
+            timer = self._make_timer('read_pdf', pdf_path, timings)
             
-            # Check cache
-            cache_key_params = {
-                'pages': pages,
-                'chunk_size': chunk_size,
-                'chunk_overlap': chunk_overlap
-            }
-            cached_result = self.cache.get(pdf_path, 'extract_text', **cache_key_params)
-            if cached_result:
-                return cached_result
-            
-            # Extract text from PDF
-            result = await self._extract_text_from_pdf(pdf_path, pages, chunk_size, chunk_overlap)
-            
-            # Cache the result
-            self.cache.set(pdf_path, 'extract_text', result, **cache_key_params)
+            # Extract text from PDF; page text comes from the page cache where possible
+            if cursor is not None or max_chunks is not None:
+                result = await self._extract_text_paginated(
+                    pdf_path, pages, chunker, cursor, max_chunks, engine, output_format, timer
+                )
+            else:
+                result = await self._extract_text_from_pdf(
+                    pdf_path, pages, chunker, parallel, engine, output_format, timer
+                )
             
             return result
             
         except Exception as e:
             return self._error_response(f"Error processing PDF: {str(e)}")
     
-    async def _extract_text_from_pdf(
+    async def get_info(
         self,
-        pdf_path: Path,
-        pages_str: Optional[str],
-        chunk_size: int,
-        chunk_overlap: int
+        file_path: Union[str, Path],
+        include_pages: bool = False,
+        output_format: str = "compact"
     ) -> str:
-        """Extract text from PDF pages."""
+        """
+        Get document metadata without extracting any text.
         
-        with pdfplumber.open(pdf_path) as pdf:
-            total_pages = len(pdf.pages)
-            page_numbers = self.file_handler.parse_page_range(pages_str, total_pages)
+        Args:
+            file_path: Path to PDF file
+            include_pages: Include per-page sizes, rotation and object offsets
+            output_format: Response format, 'compact', 'pretty' or 'ndjson'
+            
+        Returns:
+            JSON string with page count, version, encryption, producer and linearization
+        """
+        try:
+            # Validate file path
+            pdf_path = self.file_handler.validate_pdf_path(file_path)
+            check_format(output_format)
+            
+            info = await self.executor.run_in_thread(self.probe.probe, pdf_path, include_pages)
+            
+            result = {
+                'success': True,
+                'file_path': str(pdf_path),
+                **info
+            }
+            return self._format_result(result, output_format)
+            
+        except Exception as e:
+            return self._error_response(f"Error reading PDF info: {str(e)}")
+    
+    async def extract_text_stream(
+        self,
+        file_path: Union[str, Path],
+        pages: Optional[str] = None,
+        chunk_size: int = 1000,
+        chunk_overlap: int = 100,
+        on_page: Optional[Callable[[Dict[str, Any], int, int], Awaitable[None]]] = None,
+        batch_pages: int = 8,
+        size_unit: str = "chars",
+        chunk_mode: str = "page",
+        output_format: str = "compact",
+        timings: bool = False,
+        engine: str = "plumber"
+    ) -> str:
+        """
+        Extract text page by page, handing each page to a callback as soon as it is parsed.
+        
+        Pages are extracted in small batches with the next batches already
+        running on the worker pool, so the first page is delivered long
+        before the last one is parsed. Chunks are not accumulated; the
+        returned response only carries the summary.
+        
+        Args:
+            file_path: Path to PDF file
+            pages: Page range string (e.g., "1,3,5-10,-1")
+            chunk_size: Maximum size of text chunks
+            chunk_overlap: Overlap between chunks
+            on_page: Awaitable callback receiving (page_payload, pages_done, pages_total)
+            batch_pages: Number of pages extracted per worker job
+            size_unit: Unit of chunk_size and chunk_overlap, 'chars' or 'tokens'
+            chunk_mode: 'page' keeps chunks within a page, 'document' lets
+                them continue across page boundaries; a page's payload then
+                carries the chunks that end on or before it
+            output_format: Format of the returned summary, 'compact', 'pretty' or 'ndjson'
+            timings: Add per-stage and per-page timings to the summary
+                response under 'metadata.timings'
+            engine: Text extraction engine, 'plumber', 'pypdf' or 'auto'
+                (see ``extract_text``)
+            
+        Returns:
+            JSON string with document metadata and chunk summary
+        """
+        if pdfplumber is None:
+            return self._error_response("pdfplumber is not installed. Please install it with: pip install pdfplumber")
+        
+        try:
+            pdf_path = self.file_handler.validate_pdf_path(file_path)
+            chunker = self._make_chunker(chunk_size, chunk_overlap, size_unit, chunk_mode)
+            check_format(output_format)
+            self._check_engine(engine)
+            timer = self._make_timer('read_pdf', pdf_path, timings)
+            
+            with timer.stage('page_count'):
+                total_pages = await self._get_page_count(pdf_path)
+            page_numbers = self.file_handler.parse_page_range(pages, total_pages)
             
             if not page_numbers:
                 return self._error_response("No valid pages specified")
             
-            # Extract text from specified pages
-            pages_content = []
             ocr_recommended_pages = []
+            chunked_pages = []
+            total_chunks = 0
+            total_chars = 0
+            pages_done = 0
+            document = DocumentChunker(chunker) if chunk_mode == "document" else None
             
-            for page_num in page_numbers:
-                if page_num >= total_pages:
-                    continue
-                    
-                page = pdf.pages[page_num]
-                text = page.extract_text() or ""
+            async for page_data in self.iter_pages(pdf_path, page_numbers, batch_pages, engine, timer):
+                with timer.stage('chunk'):
+                    if document is None:
+                        chunks = chunker.chunk_text(page_data['text'], page_data['page_number'], page_data['metadata'])
+                    else:
+                        chunks = document.add_page(page_data['text'], page_data['page_number'], page_data['metadata'])
+                        if pages_done + 1 == len(page_numbers):
+                            chunks.extend(document.finish())
+                if not page_data['metadata']['has_extractable_text']:
+                    ocr_recommended_pages.append(page_data['page_number'])
                 
-                # Analyze text quality
-                quality_info = self._analyze_text_quality(text)
+                if chunks:
+                    chunked_pages.append(page_data['page_number'])
+                total_chunks += len(chunks)
+                total_chars += sum(len(chunk.content) for chunk in chunks)
+                pages_done += 1
                 
-                page_data = {
-                    'text': text,
-                    'page_number': page_num + 1,  # Convert back to 1-indexed for display
-                    'metadata': {
-                        'quality_score': quality_info['quality_score'],
-                        'word_count': quality_info['word_count'],
-                        'char_count': len(text),
-                        'has_extractable_text': quality_info['has_extractable_text']
-                    }
-                }
-                
-                pages_content.append(page_data)
-                
-                # Recommend OCR for low-quality text
-                if not quality_info['has_extractable_text']:
-                    ocr_recommended_pages.append(page_num + 1)
+                if on_page is not None:
+                    with timer.stage('send'):
+                        await on_page({
+                            'page_number': page_data['page_number'],
+                            'metadata': page_data['metadata'],
+                            'chunks': [self._chunk_to_dict(chunk) for chunk in chunks]
+                        }, pages_done, len(page_numbers))
             
-            # Chunk the text
-            chunker = TextChunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
-            chunks = chunker.chunk_pages(pages_content)
+            # Pages missing from the document leave the tail unflushed
+            if document is not None and pages_done < len(page_numbers):
+                chunks = document.finish()
+                total_chunks += len(chunks)
+                total_chars += sum(len(chunk.content) for chunk in chunks)
+                if chunks and on_page is not None:
+                    await on_page({
+                        'page_number': chunks[0].page_number,
+                        'metadata': chunks[0].metadata,
+                        'chunks': [self._chunk_to_dict(chunk) for chunk in chunks]
+                    }, pages_done, len(page_numbers))
             
-            # Prepare result
             result = {
                 'success': True,
                 'file_path': str(pdf_path),
                 'total_pages': total_pages,
                 'processed_pages': [p + 1 for p in page_numbers],  # Convert to 1-indexed
-                'chunks': [
-                    {
-                        'content': chunk.content,
-                        'page_number': chunk.page_number,
-                        'chunk_index': chunk.chunk_index,
-                        'metadata': chunk.metadata
-                    }
-                    for chunk in chunks
-                ],
-                'summary': chunker.get_chunks_summary(chunks),
+                'streamed': True,
+                'summary': {
+                    'total_chunks': total_chunks,
+                    'total_chars': total_chars,
+                    'pages': chunked_pages,
+                    'avg_chunk_size': total_chars // total_chunks if total_chunks else 0,
+                    'chunk_size_config': chunk_size,
+                    'overlap_config': chunk_overlap,
+                    'size_unit': size_unit,
+                    'chunk_mode': chunk_mode
+                },
                 'ocr_recommended_pages': ocr_recommended_pages,
                 'extraction_method': 'text_extraction'
             }
+            self._add_recommendations(result, ocr_recommended_pages)
             
-            # Add OCR recommendation if needed
-            if ocr_recommended_pages:
-                result['recommendations'] = [
-                    f"Pages {', '.join(map(str, ocr_recommended_pages))} contain poor quality or no extractable text.",
-                    "Consider using the 'ocr_pdf' tool for better results on these pages."
-                ]
+            return self._format_result(result, output_format, timer)
             
-            return self._format_result(result)
+        except Exception as e:
+            return self._error_response(f"Error processing PDF: {str(e)}")
     
-    def _analyze_text_quality(self, text: str) -> Dict[str, Any]:
+    async def iter_pages(
+        self,
+        pdf_path: Path,
+        page_numbers: List[int],
+        batch_pages: int = 8,
+        engine: str = "plumber",
+        timer: RequestTimer = NULL_TIMER,
+        lookahead: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
         """
-        Analyze the quality of extracted text to determine if OCR is needed.
+        Yield extracted page dictionaries in order as their batches complete.
         
         Args:
-            text: Extracted text
+            pdf_path: Validated path to PDF file
+            page_numbers: 0-indexed page numbers to extract
+            batch_pages: Number of pages extracted per worker job; a batch
+                is never sharded further, the batches in flight provide the
+                concurrency
+            engine: Text extraction engine, 'plumber', 'pypdf' or 'auto'
+            timer: Request timer receiving cache and extraction timings
+            lookahead: Maximum number of batches in flight (None sizes it to
+                the worker pool); 1 extracts a batch only once the previous
+                one has been consumed
             
-        Returns:
-            Dictionary with quality metrics
+        Yields:
+            Page dictionaries with 'text', 'page_number' and 'metadata'
         """
-        if not text.strip():
-            return {
-                'quality_score': 0.0,
-                'word_count': 0,
-                'has_extractable_text': False
-            }
+        batch_pages = max(1, batch_pages)
+        batches = [page_numbers[i:i + batch_pages] for i in range(0, len(page_numbers), batch_pages)]
+        
+        # Each batch is a single process job, so one batch per worker process
+        # (plus one being consumed) keeps the pool busy
+        parallel = self.executor.has_process_pool and len(page_numbers) >= self.process_min_pages
+        if lookahead is None:
+            lookahead = self.executor.max_processes + 1 if parallel else 2
+        lookahead = max(1, lookahead)
+        
+        pending = deque()
+        next_batch = 0
+        try:
+            while pending or next_batch < len(batches):
+                # Keep the next batches running while earlier pages are consumed
+                while next_batch < len(batches) and len(pending) < lookahead:
+                    pending.append(asyncio.ensure_future(
+                        self._get_pages(pdf_path, batches[next_batch], parallel, engine, timer, shards=1)
+                    ))
+                    next_batch += 1
+                
+                for page_data in await pending.popleft():
+                    yield page_data
+        finally:
+            for task in pending:
+                task.cancel()
+    
+    async def _extract_text_from_pdf(
+        self,
+        pdf_path: Path,
+        pages_str: Optional[str],
+        chunker: TextChunker,
+        parallel: Optional[bool] = None,
+        engine: str = "plumber",
+        output_format: str = "compact",
+        timer: RequestTimer = NULL_TIMER
+    ) -> str:
+        """Extract text from PDF pages."""
+        
+        with timer.stage('page_count'):
+            total_pages = await self._get_page_count(pdf_path)
+        page_numbers = self.file_handler.parse_page_range(pages_str, total_pages)
+        
+        if not page_numbers:
+            return self._error_response("No valid pages specified")
+        
+        pages_content = await self._get_pages(pdf_path, page_numbers, parallel, engine, timer)
+        
+        return await self.executor.run_in_thread(
+            self._build_result,
+            pdf_path, total_pages, page_numbers, pages_content, chunker, output_format, timer
+        )
+    
+    async def _extract_text_paginated(
+        self,
+        pdf_path: Path,
+        pages_str: Optional[str],
+        chunker: TextChunker,
+        cursor: Optional[str],
+        max_chunks: Optional[int],
+        engine: str = "plumber",
+        output_format: str = "compact",
+        timer: RequestTimer = NULL_TIMER
+    ) -> str:
+        """Extract one bounded page of chunks, resuming from a cursor."""
+        if max_chunks is None:
+            max_chunks = self.DEFAULT_PAGE_CHUNKS
+        if max_chunks < 1:
+            return self._error_response("max_chunks must be at least 1")
+        
+        stat = pdf_path.stat()
+        request_key = {
+            'file': [stat.st_mtime_ns, stat.st_size],
+            'pages': pages_str,
+            'chunk_size': chunker.chunk_size,
+            'chunk_overlap': chunker.chunk_overlap,
+            'size_unit': chunker.size_unit,
+            'chunk_mode': chunker.chunk_mode,
+            'engine': engine
+        }
+        
+        position, chunk_offset = 0, 0
+        document_state = None
+        if cursor is not None:
+            state = self._decode_cursor(cursor)
+            if state.get('request') != request_key:
+                return self._error_response(
+                    "Cursor does not match this request (file changed or parameters differ)"
+                )
+            position, chunk_offset = state['position'], state['chunk_offset']
+            document_state = state.get('document')
+        
+        with timer.stage('page_count'):
+            total_pages = await self._get_page_count(pdf_path)
+        page_numbers = self.file_handler.parse_page_range(pages_str, total_pages)
+        
+        if not page_numbers:
+            return self._error_response("No valid pages specified")
+        
+        # In document mode the cursor carries a chunker snapshot; only the
+        # pages still holding unfinished text are re-read to restore it
+        document = None
+        if chunker.chunk_mode == "document":
+            if document_state is None:
+                document = DocumentChunker(chunker)
+            else:
+                retain = document_state.get('retain') if isinstance(document_state, dict) else None
+                retained_pages = []
+                if retain:
+                    retained_pages = await self._get_pages(
+                        pdf_path, page_numbers[int(retain[0]):position], engine=engine, timer=timer
+                    )
+                document = DocumentChunker.restore(chunker, document_state, retained_pages)
+        
+        chunks = []
+        processed_pages = []
+        page_metadata = {}
+        ocr_recommended_pages = []
+        next_state = None
+        
+        # Only pages from the cursor onwards are extracted, one small batch
+        # at a time, so at most a page is read beyond the chunk budget
+        pages_iter = self.iter_pages(
+            pdf_path, page_numbers[position:], batch_pages=2, engine=engine, timer=timer, lookahead=1
+        )
+        try:
+            async for page_data in pages_iter:
+                with timer.stage('chunk'):
+                    if document is None:
+                        page_chunks = chunker.chunk_text(
+                            page_data['text'], page_data['page_number'], page_data['metadata']
+                        )[chunk_offset:]
+                    else:
+                        page_state = document.snapshot()
+                        page_chunks = document.add_page(
+                            page_data['text'], page_data['page_number'], page_data['metadata']
+                        )
+                        if position + 1 == len(page_numbers):
+                            page_chunks.extend(document.finish())
+                        page_chunks = page_chunks[chunk_offset:]
+                processed_pages.append(page_data['page_number'])
+                page_metadata[str(page_data['page_number'])] = page_data['metadata']
+                if chunk_offset == 0 and not page_data['metadata']['has_extractable_text']:
+                    ocr_recommended_pages.append(page_data['page_number'])
+                
+                remaining = max_chunks - len(chunks)
+                if len(page_chunks) > remaining:
+                    chunks.extend(page_chunks[:remaining])
+                    next_state = {'position': position, 'chunk_offset': chunk_offset + remaining}
+                    if document is not None:
+                        next_state['document'] = page_state
+                    break
+                
+                chunks.extend(page_chunks)
+                position += 1
+                chunk_offset = 0
+                
+                if len(chunks) == max_chunks and position < len(page_numbers):
+                    next_state = {'position': position, 'chunk_offset': 0}
+                    if document is not None:
+                        next_state['document'] = document.snapshot()
+                    break
+        finally:
+            await pages_iter.aclose()
         
-        # Basic metrics
-        word_count = len(text.split())
-        char_count = len(text)
+        next_cursor = None
+        if next_state is not None:
+            next_state['request'] = request_key
+            next_cursor = self._encode_cursor(next_state)
         
-        # Quality indicators
-        # 1. Character to word ratio (should be reasonable for normal text)
-        char_word_ratio = char_count / max(word_count, 1)
+        result = {
+            'success': True,
+            'file_path': str(pdf_path),
+            'total_pages': total_pages,
+            'processed_pages': processed_pages,
+            'chunks': [self._chunk_to_dict(chunk) for chunk in chunks],
+            'page_metadata': page_metadata,
+            'summary': chunker.get_chunks_summary(chunks),
+            'ocr_recommended_pages': ocr_recommended_pages,
+            'next_cursor': next_cursor,
+            'has_more': next_cursor is not None,
+            'extraction_method': 'text_extraction'
+        }
+        self._add_recommendations(result, ocr_recommended_pages)
         
-        # 2. Presence of normal sentence structures
-        sentences = re.split(r'[.!?]+', text)
-        avg_sentence_length = sum(len(s.split()) for s in sentences) / max(len(sentences), 1)
+        return self._format_result(result, output_format, timer)
+    
+    @staticmethod
+    def _encode_cursor(state: Dict[str, Any]) -> str:
+        """Encode pagination state as an opaque cursor string."""
+        payload = json.dumps(state, separators=(',', ':'), sort_keys=True)
+        return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+    
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Dict[str, Any]:
+        """Decode a cursor produced by ``_encode_cursor``."""
+        try:
+            state = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+            int(state['position']), int(state['chunk_offset'])
+        except (ValueError, TypeError, KeyError, UnicodeError):
+            raise ValueError("Invalid cursor")
+        return state
+    
+    async def _extract_parallel(
+        self,
+        pdf_path: Path,
+        page_numbers: List[int],
+        timed: bool = False,
+        engine: str = "plumber",
+        shard_count: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Shard pages across worker processes and reassemble them in order.
         
-        # 3. Ratio of letters to total characters
-        letters = re.findall(r'[a-zA-Z]', text)
-        letter_ratio = len(letters) / max(char_count, 1)
+        Each worker opens the PDF once and extracts a contiguous slice of the
+        requested pages, which keeps its reads local within the file. At most
+        shard_count jobs are submitted (None for one per worker process).
+        """
+        shards = self._shard_pages(page_numbers, shard_count or self.executor.max_processes)
+        results = await asyncio.gather(*(
+            self.executor.run_in_process(extract_page_records, str(pdf_path), shard, timed, engine)
+            for shard in shards
+        ))
         
-        # 4. Check for garbled text (too many special characters)
-        special_chars = re.findall(r'[^\w\s\.,!?\'"()-]', text)
-        special_char_ratio = len(special_chars) / max(char_count, 1)
+        pages_content = []
+        for shard_content in results:
+            pages_content.extend(shard_content)
+        return pages_content
+    
+    @staticmethod
+    def _shard_pages(page_numbers: List[int], shard_count: int) -> List[List[int]]:
+        """Split page numbers into at most shard_count contiguous, evenly sized slices."""
+        shard_count = max(1, min(shard_count, len(page_numbers)))
+        size, remainder = divmod(len(page_numbers), shard_count)
         
-        # Calculate quality score (0.0 to 1.0)
-        quality_score = 0.0
+        shards = []
+        start = 0
+        for i in range(shard_count):
+            end = start + size + (1 if i < remainder else 0)
+            shards.append(page_numbers[start:end])
+            start = end
+        return shards
+    
+    async def _get_page_count(self, pdf_path: Path) -> int:
+        """Return the number of pages in the PDF from the metadata probe."""
+        info = self.probe.peek(pdf_path)
+        if info is None:
+            info = await self.executor.run_in_thread(self.probe.probe, pdf_path)
+        return info['page_count']
+    
+    def _extract_pages_shared(
+        self,
+        pdf_path: Path,
+        page_numbers: List[int],
+        timed: bool = False,
+        engine: str = "plumber"
+    ) -> List[Dict[str, Any]]:
+        """Extract pages in this process from the shared document handles."""
+        def open_document(kind: str) -> ContextManager[Any]:
+            return self.documents.acquire(pdf_path, kind)
         
-        # Good character to word ratio (typically 4-6 for English text)
-        if 3 <= char_word_ratio <= 8:
-            quality_score += 0.3
+        with _OpenDocuments(open_document) as documents:
+            return _extract_pages(documents, page_numbers, engine, timed)
+    
+    async def _get_pages(
+        self,
+        pdf_path: Path,
+        page_numbers: List[int],
+        parallel: Optional[bool] = None,
+        engine: str = "plumber",
+        timer: RequestTimer = NULL_TIMER,
+        shards: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get page dictionaries, extracting only pages missing from the page cache.
         
-        # Reasonable sentence length (5-20 words)
-        if 3 <= avg_sentence_length <= 25:
-            quality_score += 0.3
+        Args:
+            pdf_path: Validated path to PDF file
+            page_numbers: 0-indexed page numbers
+            parallel: Shard missing pages across worker processes (None decides
+                from the number of missing pages)
+            engine: Text extraction engine, 'plumber', 'pypdf' or 'auto'
+            timer: Request timer receiving cache hits/misses and extraction timings
+            shards: Maximum number of process jobs when parallel (None for one
+                per worker process)
+            
+        Returns:
+            Page dictionaries in the order of page_numbers
+        """
+        settings = self.EXTRACTION_SETTINGS[engine]
+        with timer.stage('cache_lookup'):
+            # The memory tier is read on the loop; its misses go to the disk
+            # tier in one worker-thread call so SQLite never blocks the loop
+            on_disk = self.page_cache.disk_cache is not None
+            cached = self.page_cache.get_many(
+                pdf_path, 'page_text', [dict(page=p, **settings) for p in page_numbers], disk=not on_disk
+            )
+            if on_disk:
+                unresolved = [p for p, page_data in zip(page_numbers, cached) if page_data is None]
+                if unresolved:
+                    from_disk = await self.executor.run_in_thread(
+                        self.page_cache.get_many, pdf_path, 'page_text',
+                        [dict(page=p, **settings) for p in unresolved]
+                    )
+                    found = dict(zip(unresolved, from_disk))
+                    cached = [found.get(p, page_data) for p, page_data in zip(page_numbers, cached)]
         
-        # Good letter ratio (should be high for text)
-        if letter_ratio >= 0.6:
-            quality_score += 0.3
+        pages_by_number = {}
+        missing = []
+        for page_num, page_data in zip(page_numbers, cached):
+            if page_data is None:
+                missing.append(page_num)
+            else:
+                pages_by_number[page_num] = page_data
+        timer.count('cache_hits', len(pages_by_number))
+        timer.count('cache_misses', len(missing))
         
-        # Low special character ratio
-        if special_char_ratio <= 0.1:
-            quality_score += 0.1
+        if missing:
+            if parallel is None:
+                parallel = len(missing) >= self.process_min_pages
+            
+            with timer.stage('extract'):
+                if parallel and self.executor.has_process_pool:
+                    extracted = await self._extract_parallel(pdf_path, missing, timer.enabled, engine, shards)
+                else:
+                    extracted = await self.executor.run_in_thread(
+                        self._extract_pages_shared, pdf_path, missing, timer.enabled, engine
+                    )
+            
+            items = []
+            for page_data in extracted:
+                # Timings are per request and never cached with the page
+                page_timings = page_data.pop('timings', None)
+                if page_timings is not None:
+                    timer.add_page(page_data['page_number'], page_timings)
+                page_num = page_data['page_number'] - 1
+                pages_by_number[page_num] = page_data
+                items.append((page_data, dict(page=page_num, **settings)))
+            
+            if self.page_cache.disk_cache is not None:
+                await self.executor.run_in_thread(self.page_cache.set_many, pdf_path, 'page_text', items)
+            else:
+                self.page_cache.set_many(pdf_path, 'page_text', items)
         
-        # Minimum word count threshold
-        has_extractable_text = word_count >= 5 and quality_score >= 0.4
+        pages = [pages_by_number[p] for p in page_numbers if p in pages_by_number]
+        count_pages(len(pages))
+        return pages
+    
+    def _build_result(
+        self,
+        pdf_path: Path,
+        total_pages: int,
+        page_numbers: List[int],
+        pages_content: List[Dict[str, Any]],
+        chunker: TextChunker,
+        output_format: str = "compact",
+        timer: RequestTimer = NULL_TIMER
+    ) -> str:
+        """Chunk extracted pages and format the response."""
+        # Recommend OCR for low-quality text
+        ocr_recommended_pages = [
+            page_data['page_number']
+            for page_data in pages_content
+            if not page_data['metadata']['has_extractable_text']
+        ]
+        
+        # Chunk the text
+        with timer.stage('chunk'):
+            chunks = chunker.chunk_pages(pages_content)
+        
+        # Prepare result
+        result = {
+            'success': True,
+            'file_path': str(pdf_path),
+            'total_pages': total_pages,
+            'processed_pages': [p + 1 for p in page_numbers],  # Convert to 1-indexed
+            'chunks': [self._chunk_to_dict(chunk) for chunk in chunks],
+            'page_metadata': self._page_metadata(pages_content),
+            'summary': chunker.get_chunks_summary(chunks),
+            'ocr_recommended_pages': ocr_recommended_pages,
+            'extraction_method': 'text_extraction'
+        }
+        self._add_recommendations(result, ocr_recommended_pages)
+        
+        return self._format_result(result, output_format, timer)
+    
+    def _make_chunker(
+        self,
+        chunk_size: int,
+        chunk_overlap: int,
+        size_unit: str,
+        chunk_mode: str = "page"
+    ) -> TextChunker:
+        """Create a chunker for one request; raises ValueError for invalid settings."""
+        return TextChunker(
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            size_unit=size_unit,
+            tokenizer=self.tokenizer,
+            chunk_mode=chunk_mode
+        )
+    
+    @staticmethod
+    def _check_engine(engine: str) -> None:
+        """Validate an extraction engine name; raises ValueError if it cannot be used."""
+        if engine not in ENGINES:
+            raise ValueError(f"engine must be one of: {', '.join(ENGINES)}")
+        if engine != "plumber" and PdfReader is None:
+            raise ValueError("pypdf is not installed. Please install it with: pip install pypdf")
+    
+    @staticmethod
+    def _chunk_to_dict(chunk: TextChunk) -> Dict[str, Any]:
+        """
+        Convert a chunk to its response representation.
         
+        Page metadata is not repeated per chunk; responses carry it once per
+        page under 'page_metadata', keyed by the chunk's page_number.
+        """
         return {
-            'quality_score': quality_score,
-            'word_count': word_count,
-            'char_word_ratio': char_word_ratio,
-            'avg_sentence_length': avg_sentence_length,
-            'letter_ratio': letter_ratio,
-            'special_char_ratio': special_char_ratio,
-            'has_extractable_text': has_extractable_text
+            'content': chunk.content,
+            'page_number': chunk.page_number,
+            'chunk_index': chunk.chunk_index,
+            'start_char': chunk.start_char,
+            'end_char': chunk.end_char,
+            'end_page_number': chunk.end_page_number
         }
     
-    def _format_result(self, result: Dict[str, Any]) -> str:
-        """Format result as JSON string."""
-        import json
-        return json.dumps(result, ensure_ascii=False, indent=2)
+    @staticmethod
+    def _page_metadata(pages_content: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Map each page number (as a JSON object key) to its page metadata."""
+        return {str(page_data['page_number']): page_data['metadata'] for page_data in pages_content}
+    
+    @staticmethod
+    def _add_recommendations(result: Dict[str, Any], ocr_recommended_pages: List[int]) -> None:
+        """Add OCR recommendation if needed."""
+        if ocr_recommended_pages:
+            result['recommendations'] = [
+                f"Pages {', '.join(map(str, ocr_recommended_pages))} contain poor quality or no extractable text.",
+                "Consider using the 'ocr_pdf' tool for better results on these pages."
+            ]
+    
+    def _make_timer(self, operation: str, pdf_path: Path, attach: bool) -> RequestTimer:
+        """Timer for one request; a no-op unless timings are requested or always logged."""
+        if not (attach or self.log_timings):
+            return NULL_TIMER
+        return RequestTimer(operation, attach=attach, fields={'file_path': str(pdf_path)})
+    
+    def _format_result(
+        self,
+        result: Dict[str, Any],
+        output_format: str = "compact",
+        timer: RequestTimer = NULL_TIMER
+    ) -> str:
+        """
+        Format result as JSON string.
+        
+        Timings attached to the response cover everything up to
+        serialization; the logged timings also include 'serialize' and
+        'response_bytes'.
+        """
+        if timer.attach:
+            result['metadata'] = {'timings': timer.to_dict()}
+        with timer.stage('serialize'):
+            output = dumps(result, output_format)
+        timer.finish(output)
+        return output
     
     def _error_response(self, message: str) -> str:
-        """Format error response."""
-        import json
-        return json.dumps({
+        """Format error response as compact JSON."""
+        return dumps({
             'success': False,
             'error': message,
             'extraction_method': 'text_extraction'
-        }, ensure_ascii=False, indent=2)
\ No newline at end of file
+        })
\ No newline at end of file
@@ -2,8 +2,17 @@
 Utility modules for PDF processing.
 """
 
-from .chunker import TextChunker
+from .chunker import TextChunker, DocumentChunker
 from .cache import PDFCache
 from .file_handler import FileHandler
+from .executor import WorkerPool
+from .disk_cache import DiskCache
+from .document_cache import DocumentCache
+from .pdf_probe import PDFProbe
+from .text_quality import analyze_text_quality
+from .tokenizer import Tokenizer, ApproximateTokenizer, get_tokenizer
+from .instrumentation import RequestTimer, configure_logging
+from .metrics import ServerMetrics, count_pages
+from .profiler import SlowCallProfiler
 
-__all__ = ["TextChunker", "PDFCache", "FileHandler"]
\ No newline at end of file
+__all__ = ["TextChunker", "DocumentChunker", "PDFCache", "FileHandler", "WorkerPool", "DiskCache", "DocumentCache", "PDFProbe", "analyze_text_quality", "Tokenizer", "ApproximateTokenizer", "get_tokenizer", "RequestTimer", "configure_logging", "ServerMetrics", "count_pages", "SlowCallProfiler"]
\ No newline at end of file
@@ -4,11 +4,17 @@ Caching system for PDF processing results.
 
 import hashlib
 import json
+import sys
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass, asdict
 
+from .disk_cache import DiskCache
+from .fingerprint import FileFingerprinter
+
 
 @dataclass
 class CacheEntry:
@@ -18,6 +24,8 @@ class CacheEntry:
     file_mtime: float
     file_size: int
     cache_key: str
+    content_hash: Optional[str] = None
+    size: int = 0
     
     def is_valid(self, file_path: Union[str, Path]) -> bool:
         """Check if cache entry is still valid."""
@@ -38,19 +46,67 @@ class CacheEntry:
 class PDFCache:
     """
     In-memory cache for PDF processing results with file modification tracking.
+    
+    Entries are kept in least-recently-used order: a hit moves the entry to
+    the back, and inserts beyond ``max_entries`` or ``max_bytes`` evict
+    from the front in O(1). Entry sizes are measured once on insert, so
+    the memory budget is enforced without rescanning the cache. Expiry is
+    checked lazily when an entry is read.
+    
+    An optional ``DiskCache`` adds a persistent second tier: writes go
+    through to disk, and memory misses are served from disk when the file
+    is unchanged. Disk entries are not subject to ``max_age_seconds``.
+    
+    Files are identified by path and validated by mtime/size by default.
+    With ``identity="content"`` they are identified by a sampled content
+    fingerprint instead, so copies of a document share entries and a
+    changed mtime alone does not invalidate them; once the background full
+    hash of a file is known it is used to confirm entries.
     """
     
-    def __init__(self, max_entries: int = 100, max_age_seconds: int = 3600):
+    IDENTITIES = ("path", "content")
+    
+    def __init__(
+        self,
+        max_entries: int = 100,
+        max_age_seconds: int = 3600,
+        max_bytes: Optional[int] = None,
+        disk_cache: Optional[DiskCache] = None,
+        identity: str = "path",
+        fingerprinter: Optional[FileFingerprinter] = None
+    ):
         """
         Initialize the PDF cache.
         
         Args:
             max_entries: Maximum number of entries to keep in memory
             max_age_seconds: Maximum age of cache entries in seconds
+            max_bytes: Memory budget for cached data (None for no byte limit)
+            disk_cache: Optional persistent tier behind the in-memory cache
+            identity: How files are identified, 'path' or 'content'
+            fingerprinter: Fingerprinter for content identity (created if omitted)
         """
+        if identity not in self.IDENTITIES:
+            raise ValueError(f"Unknown cache identity: {identity}")
+        
         self.max_entries = max_entries
         self.max_age_seconds = max_age_seconds
-        self._cache: Dict[str, CacheEntry] = {}
+        self.max_bytes = max_bytes
+        self.disk_cache = disk_cache
+        self.identity = identity
+        if identity == "content" and fingerprinter is None:
+            fingerprinter = FileFingerprinter()
+        self.fingerprinter = fingerprinter
+        self._cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._total_bytes = 0
+        
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
     
     def _generate_cache_key(self, file_path: Union[str, Path], operation: str, **kwargs) -> str:
         """
@@ -65,8 +121,13 @@ class PDFCache:
             Unique cache key
         """
         # Create a string representation of all parameters
+        if self.identity == "content":
+            file_identity = {'file_id': self.fingerprinter.fingerprint(file_path)}
+        else:
+            file_identity = {'file_path': str(file_path)}
+        
         params = {
-            'file_path': str(file_path),
+            **file_identity,
             'operation': operation,
             **kwargs
         }
@@ -89,24 +150,105 @@ class PDFCache:
         Returns:
             Cached result or None if not found/invalid
         """
-        cache_key = self._generate_cache_key(file_path, operation, **kwargs)
+        return self.get_many(file_path, operation, [kwargs])[0]
+    
+    def get_many(
+        self,
+        file_path: Union[str, Path],
+        operation: str,
+        params_list: List[Dict[str, Any]],
+        disk: bool = True
+    ) -> List[Optional[Any]]:
+        """
+        Get cached results for several parameter sets of one file.
         
-        if cache_key not in self._cache:
-            return None
+        With disk=False only the memory tier is read, so the call never
+        blocks on the persistent tier; memory misses are returned as None
+        without being counted, and the caller resolves them with a second
+        call with disk=True (normally from a worker thread).
         
-        entry = self._cache[cache_key]
+        Args:
+            file_path: Path to the file
+            operation: Type of operation
+            params_list: Additional parameters of each lookup
+            disk: Fall back to the persistent tier on memory misses
+            
+        Returns:
+            Cached results (None where not found/invalid), in the order of params_list
+        """
+        results: List[Optional[Any]] = [None] * len(params_list)
+        absent: Dict[int, str] = {}
+        stale: List[str] = []
+        unresolved = 0
+        for i, params in enumerate(params_list):
+            try:
+                cache_key = self._generate_cache_key(file_path, operation, **params)
+            except OSError:
+                continue
+            status, data = self._get_from_memory(file_path, cache_key)
+            if status == "hit":
+                results[i] = data
+                continue
+            unresolved += 1
+            if status == "absent":
+                absent[i] = cache_key
+            elif status == "invalid":
+                stale.append(cache_key)
+        
+        if not disk:
+            return results
+        
+        # All disk reads and deletes of the call share one transaction each
+        found = 0
+        if self.disk_cache is not None:
+            if stale:
+                self.disk_cache.delete_many(stale)
+            if absent:
+                stored = self._get_from_disk(file_path, list(absent.values()))
+                for i, cache_key in absent.items():
+                    if cache_key in stored:
+                        results[i] = stored[cache_key]
+                        found += 1
+        
+        with self._lock:
+            self.disk_hits += found
+            self.misses += unresolved - found
+        return results
+    
+    def _get_from_memory(self, file_path: Union[str, Path], cache_key: str) -> Tuple[str, Any]:
+        """
+        Look up one key in the memory tier.
+        
+        Returns:
+            Tuple of status and data; the status is 'hit', 'absent', 'invalid'
+            (the file changed; the entry was dropped) or 'expired'
+        """
+        with self._lock:
+            entry = self._cache.get(cache_key)
+        
+        if entry is None:
+            return "absent", None
         
         # Check if entry is still valid
-        if not entry.is_valid(file_path):
-            self._remove_entry(cache_key)
-            return None
+        if not self._is_entry_valid(entry, file_path):
+            with self._lock:
+                self._remove_entry(cache_key)
+                self.invalidations += 1
+            return "invalid", None
         
-        # Check if entry has expired
-        if time.time() - entry.created_at > self.max_age_seconds:
-            self._remove_entry(cache_key)
-            return None
+        with self._lock:
+            # Check if entry has expired
+            if time.time() - entry.created_at > self.max_age_seconds:
+                self._remove_entry(cache_key)
+                self.expirations += 1
+                return "expired", None
+            
+            # Promote to most recently used
+            if cache_key in self._cache:
+                self._cache.move_to_end(cache_key)
+            self.hits += 1
         
-        return entry.data
+        return "hit", entry.data
     
     def set(self, file_path: Union[str, Path], operation: str, data: Any, **kwargs) -> None:
         """
@@ -118,63 +260,158 @@ class PDFCache:
             data: Data to cache
             **kwargs: Additional parameters
         """
-        cache_key = self._generate_cache_key(file_path, operation, **kwargs)
+        self.set_many(file_path, operation, [(data, kwargs)])
+    
+    def set_many(
+        self,
+        file_path: Union[str, Path],
+        operation: str,
+        items: List[Tuple[Any, Dict[str, Any]]]
+    ) -> None:
+        """
+        Store several results for one file.
         
+        Writes go through to the persistent tier, so callers on the event
+        loop should run this on a worker thread when ``disk_cache`` is set.
+        
+        Args:
+            file_path: Path to the file
+            operation: Type of operation
+            items: Tuples of (data, additional parameters)
+        """
         try:
             path = Path(file_path)
             stat = path.stat()
+            content_hash = self.fingerprinter.full_hash(path) if self.identity == "content" else None
+            
+            disk_items = []
+            for data, params in items:
+                cache_key = self._generate_cache_key(file_path, operation, **params)
+                entry = CacheEntry(
+                    data=data,
+                    created_at=time.time(),
+                    file_mtime=stat.st_mtime,
+                    file_size=stat.st_size,
+                    cache_key=cache_key,
+                    content_hash=content_hash
+                )
+                
+                self._store_entry(entry)
+                disk_items.append((cache_key, data, stat.st_mtime, stat.st_size))
+            
+            if self.disk_cache is not None:
+                self.disk_cache.set_many(disk_items)
             
+        except (OSError, AttributeError):
+            # If we can't get file stats, don't cache
+            pass
+    
+    def _get_from_disk(self, file_path: Union[str, Path], cache_keys: List[str]) -> Dict[str, Any]:
+        """Look up keys in the persistent tier and promote valid hits into memory."""
+        if self.disk_cache is None:
+            return {}
+        
+        found = {}
+        stale = []
+        for cache_key, (data, file_mtime, file_size, _) in self.disk_cache.get_many(cache_keys).items():
             entry = CacheEntry(
                 data=data,
                 created_at=time.time(),
-                file_mtime=stat.st_mtime,
-                file_size=stat.st_size,
+                file_mtime=file_mtime,
+                file_size=file_size,
                 cache_key=cache_key
             )
             
-            self._cache[cache_key] = entry
-            
-            # Clean up old entries if needed
-            self._cleanup_if_needed()
+            if not self._is_entry_valid(entry, file_path):
+                stale.append(cache_key)
+                continue
             
-        except (OSError, AttributeError):
-            # If we can't get file stats, don't cache
-            pass
+            self._store_entry(entry)
+            found[cache_key] = data
+        
+        if stale:
+            self.disk_cache.delete_many(stale)
+        return found
     
-    def _remove_entry(self, cache_key: str) -> None:
-        """Remove a cache entry."""
-        if cache_key in self._cache:
-            del self._cache[cache_key]
+    def _is_entry_valid(self, entry: CacheEntry, file_path: Union[str, Path]) -> bool:
+        """Check an entry against the current state of its file."""
+        if self.identity == "path":
+            return entry.is_valid(file_path)
+        
+        # The key already embeds the sampled fingerprint; the full hash,
+        # once computed, upgrades or refutes the match
+        full_hash = self.fingerprinter.full_hash(file_path)
+        if full_hash is None:
+            return Path(file_path).exists()
+        if entry.content_hash is None:
+            entry.content_hash = full_hash
+            return True
+        return entry.content_hash == full_hash
     
-    def _cleanup_if_needed(self) -> None:
-        """Clean up old or excess cache entries."""
-        current_time = time.time()
+    @staticmethod
+    def _estimate_size(data: Any) -> int:
+        """
+        Estimate the memory held by cached data.
         
-        # Remove expired entries
-        expired_keys = []
-        for key, entry in self._cache.items():
-            if current_time - entry.created_at > self.max_age_seconds:
-                expired_keys.append(key)
+        Walks containers recursively and sums ``sys.getsizeof``; objects
+        reached more than once are only counted once.
+        """
+        seen = set()
+        stack = [data]
+        total = 0
+        
+        while stack:
+            obj = stack.pop()
+            if id(obj) in seen:
+                continue
+            seen.add(id(obj))
+            total += sys.getsizeof(obj)
+            
+            if isinstance(obj, dict):
+                stack.extend(obj.keys())
+                stack.extend(obj.values())
+            elif isinstance(obj, (list, tuple, set, frozenset)):
+                stack.extend(obj)
         
-        for key in expired_keys:
-            self._remove_entry(key)
+        return total
+    
+    def _store_entry(self, entry: CacheEntry) -> None:
+        """Insert an entry as most recently used and evict from the LRU end."""
+        if not entry.size:
+            entry.size = self._estimate_size(entry.data)
         
-        # Remove excess entries (LRU-style, remove oldest)
-        if len(self._cache) > self.max_entries:
-            # Sort by creation time and remove oldest
-            sorted_entries = sorted(
-                self._cache.items(),
-                key=lambda x: x[1].created_at
-            )
+        with self._lock:
+            self._remove_entry(entry.cache_key)
+            
+            # An entry larger than the whole budget would only flush the cache
+            if self.max_bytes is not None and entry.size > self.max_bytes:
+                return
             
-            entries_to_remove = len(self._cache) - self.max_entries
-            for i in range(entries_to_remove):
-                key, _ = sorted_entries[i]
-                self._remove_entry(key)
+            self._cache[entry.cache_key] = entry
+            self._total_bytes += entry.size
+            
+            while self._cache and (
+                len(self._cache) > self.max_entries or
+                (self.max_bytes is not None and self._total_bytes > self.max_bytes)
+            ):
+                _, evicted = self._cache.popitem(last=False)
+                self._total_bytes -= evicted.size
+                self.evictions += 1
+    
+    def _remove_entry(self, cache_key: str) -> None:
+        """Remove a cache entry."""
+        with self._lock:
+            entry = self._cache.pop(cache_key, None)
+            if entry is not None:
+                self._total_bytes -= entry.size
     
     def clear(self) -> None:
-        """Clear all cache entries."""
-        self._cache.clear()
+        """Clear all cache entries, including the persistent tier."""
+        with self._lock:
+            self._cache.clear()
+            self._total_bytes = 0
+        if self.disk_cache is not None:
+            self.disk_cache.clear()
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -187,25 +424,33 @@ class PDFCache:
         
         valid_entries = 0
         expired_entries = 0
-        total_size = 0
         
-        for entry in self._cache.values():
+        with self._lock:
+            entries = list(self._cache.values())
+            total_size = self._total_bytes
+        
+        for entry in entries:
             if current_time - entry.created_at > self.max_age_seconds:
                 expired_entries += 1
             else:
                 valid_entries += 1
-            
-            # Rough estimate of memory usage
-            try:
-                total_size += len(str(entry.data))
-            except:
-                pass
+        
+        lookups = self.hits + self.disk_hits + self.misses
         
         return {
-            "total_entries": len(self._cache),
+            "total_entries": len(entries),
             "valid_entries": valid_entries,
             "expired_entries": expired_entries,
             "max_entries": self.max_entries,
             "max_age_seconds": self.max_age_seconds,
-            "estimated_size_bytes": total_size
+            "resident_bytes": total_size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_ratio": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "disk": self.disk_cache.get_stats() if self.disk_cache is not None else None
         }
\ No newline at end of file
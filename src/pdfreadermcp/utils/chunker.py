@@ -3,23 +3,40 @@ Text chunking utilities for processing large PDF content.
 """
 
 import re
-from typing import List, Dict, Any, Optional
+from bisect import bisect_right
+from typing import Callable, Iterable, Iterator, List, Dict, Any, Optional, Sequence, Tuple
 from dataclasses import dataclass
 
+from .tokenizer import Tokenizer, get_tokenizer
 
-@dataclass
+
+@dataclass(slots=True)
 class TextChunk:
-    """Represents a chunk of text with metadata."""
+    """
+    Represents a chunk of text with metadata.
+    
+    Chunks are slotted records; metadata is the dictionary of the page the
+    chunk starts on, shared by every chunk of that page rather than copied.
+    """
     content: str
     page_number: int
     chunk_index: int
     start_char: int
     end_char: int
     metadata: Dict[str, Any] = None
+    end_page_number: Optional[int] = None
     
     def __post_init__(self):
         if self.metadata is None:
             self.metadata = {}
+        if self.end_page_number is None:
+            self.end_page_number = self.page_number
+
+
+# First non-whitespace character, start of a word and any whitespace
+_NON_SPACE = re.compile(r'\S')
+_WORD_START = re.compile(r'(?<!\S)\S')
+_WHITESPACE = re.compile(r'\s')
 
 
 class TextChunker:
@@ -30,56 +47,94 @@ class TextChunker:
     
     DEFAULT_SEPARATORS = ["\n\n", "\n", ". ", " ", ""]
     
-    def __init__(self, chunk_size: int = 1000, chunk_overlap: int = 100):
+    SIZE_UNITS = ("chars", "tokens")
+    
+    CHUNK_MODES = ("page", "document")
+    
+    def __init__(
+        self,
+        chunk_size: int = 1000,
+        chunk_overlap: int = 100,
+        size_unit: str = "chars",
+        tokenizer: Optional[Tokenizer] = None,
+        chunk_mode: str = "page"
+    ):
         """
         Initialize the text chunker.
         
         Args:
             chunk_size: Maximum size of each chunk
-            chunk_overlap: Number of characters to overlap between chunks
+            chunk_overlap: Amount of text a chunk repeats from the end of the
+                previous one (must be smaller than chunk_size)
+            size_unit: Unit of chunk_size and chunk_overlap, 'chars' or 'tokens'
+            tokenizer: Tokenizer counting tokens in 'tokens' mode (defaults to
+                the shared approximate BPE tokenizer)
+            chunk_mode: 'page' chunks every page on its own, 'document' lets
+                chunks continue across page boundaries (see DocumentChunker)
         """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        if not 0 <= chunk_overlap < chunk_size:
+            raise ValueError("chunk_overlap must be at least 0 and smaller than chunk_size")
+        if size_unit not in self.SIZE_UNITS:
+            raise ValueError(f"size_unit must be one of: {', '.join(self.SIZE_UNITS)}")
+        if chunk_mode not in self.CHUNK_MODES:
+            raise ValueError(f"chunk_mode must be one of: {', '.join(self.CHUNK_MODES)}")
+        
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
+        self.size_unit = size_unit
+        self.chunk_mode = chunk_mode
+        self.tokenizer = None
+        if size_unit == "tokens":
+            self.tokenizer = tokenizer or get_tokenizer()
         
     def chunk_text(self, text: str, page_number: int = 0, metadata: Optional[Dict[str, Any]] = None) -> List[TextChunk]:
         """
-        Split text into chunks using recursive character text splitting.
+        Split text into overlapping chunks using recursive character text splitting.
+        
+        Each chunk's content is exactly ``text[start_char:end_char]`` of the
+        text passed in, with surrounding whitespace trimmed from the range.
+        The text is cut into ranges of at most chunk_size - chunk_overlap
+        units; every chunk after the first then starts up to chunk_overlap
+        units earlier, at a word boundary, so it repeats the end of the
+        previous chunk and no chunk exceeds chunk_size.
+        
+        In 'tokens' mode the text is tokenized once and every size check is
+        a binary search over the token start offsets, so splitting, refining
+        and overlapping never re-tokenize any part of it.
         
         Args:
             text: Text to chunk
             page_number: Page number this text came from
-            metadata: Additional metadata for chunks
+            metadata: Page metadata, shared by all chunks of the text
             
         Returns:
             List of TextChunk objects
         """
         if not text.strip():
             return []
-            
-        # Clean the text
-        cleaned_text = self._clean_text(text)
         
-        # Perform recursive splitting
-        chunks = self._split_text_recursive(cleaned_text, self.DEFAULT_SEPARATORS)
+        if metadata is None:
+            metadata = {}
+        
+        units = self._unit_starts(text)
+        ranges = self._split_text(text, 0, units)
         
-        # Create TextChunk objects
+        # Create TextChunk objects; each chunk is sliced once
         text_chunks = []
-        start_char = 0
         
-        for i, chunk_content in enumerate(chunks):
-            end_char = start_char + len(chunk_content)
-            
+        for start_char, end_char in self._chunk_bounds(text, units, ranges, -1):
             chunk = TextChunk(
-                content=chunk_content.strip(),
+                content=text[start_char:end_char],
                 page_number=page_number,
-                chunk_index=i,
+                chunk_index=len(text_chunks),
                 start_char=start_char,
                 end_char=end_char,
-                metadata=metadata.copy() if metadata else {}
+                metadata=metadata
             )
             
             text_chunks.append(chunk)
-            start_char = end_char - self.chunk_overlap
         
         return text_chunks
     
@@ -87,12 +142,18 @@ class TextChunker:
         """
         Chunk content from multiple pages.
         
+        In 'document' mode chunks flow across page boundaries; otherwise
+        every page is chunked on its own.
+        
         Args:
             pages_content: List of dictionaries with 'text', 'page_number', and optional metadata
             
         Returns:
             List of TextChunk objects from all pages
         """
+        if self.chunk_mode == "document":
+            return list(self.chunk_document(pages_content))
+        
         all_chunks = []
         
         for page_data in pages_content:
@@ -105,71 +166,191 @@ class TextChunker:
         
         return all_chunks
     
-    def _clean_text(self, text: str) -> str:
-        """Clean and normalize text."""
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
+    def chunk_document(self, pages_content: Iterable[Dict[str, Any]]) -> Iterator[TextChunk]:
+        """
+        Chunk pages as one continuous text, yielding chunks as pages arrive.
+        
+        Args:
+            pages_content: Iterable of dictionaries with 'text', 'page_number', and optional metadata
+            
+        Yields:
+            TextChunk objects whose page_number/end_page_number give their page span
+        """
+        document = DocumentChunker(self)
+        for page_data in pages_content:
+            yield from document.add_page(
+                page_data.get('text', ''),
+                page_data.get('page_number', 0),
+                page_data.get('metadata', {})
+            )
+        yield from document.finish()
+    
+    def _unit_starts(self, text: str) -> Sequence[int]:
+        """Offsets at which each size unit (character or token) of text starts."""
+        return self.tokenizer.token_starts(text) if self.tokenizer else range(len(text))
+    
+    def _split_text(self, text: str, start: int, units: Sequence[int]) -> List[Tuple[int, int]]:
+        """Split text[start:] into non-overlapping ranges of at most chunk_size - chunk_overlap units."""
+        split_size = self.chunk_size - self.chunk_overlap
+        text_end = len(text)
+        return self._split_ranges(
+            text, start, text_end, self.DEFAULT_SEPARATORS,
+            lambda position: self._advance(units, position, split_size, text_end)
+        )
+    
+    def _chunk_bounds(
+        self,
+        text: str,
+        units: Sequence[int],
+        ranges: List[Tuple[int, int]],
+        previous_start: int
+    ) -> List[Tuple[int, int]]:
+        """
+        Turn split ranges into chunk bounds.
         
-        # Remove page headers/footers patterns (simple heuristics)
-        text = re.sub(r'^\d+\s*$', '', text, flags=re.MULTILINE)  # Page numbers on separate lines
+        Ranges are trimmed of surrounding whitespace (whitespace-only ranges
+        are dropped) and, after the first chunk, moved back to overlap the
+        previous one.
         
-        # Normalize line breaks
-        text = text.replace('\r\n', '\n').replace('\r', '\n')
+        Args:
+            text: Text the ranges refer to
+            units: Unit start offsets of text
+            ranges: Ranges from ``_split_text``
+            previous_start: Start of the chunk before the first range (-1 if none)
+            
+        Returns:
+            List of (start, end) offsets of chunks
+        """
+        bounds = []
+        for range_start, range_end in ranges:
+            start_char, end_char = self._trim_range(text, range_start, range_end)
+            if start_char == end_char:
+                continue
+            
+            if previous_start >= 0 and self.chunk_overlap:
+                start_char = self._overlap_start(text, units, start_char, previous_start)
+            
+            bounds.append((start_char, end_char))
+            previous_start = start_char
+        return bounds
+    
+    @staticmethod
+    def _trim_range(text: str, start: int, end: int) -> Tuple[int, int]:
+        """Shrink text[start:end] to exclude leading and trailing whitespace."""
+        match = _NON_SPACE.search(text, start, end)
+        if match is None:
+            return start, start
+        start = match.start()
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        return start, end
+    
+    @staticmethod
+    def _advance(units: Sequence[int], position: int, count: int, text_end: int) -> int:
+        """Offset reached by moving count units forward from the unit containing position."""
+        index = bisect_right(units, position) - 1 + count
+        return units[index] if index < len(units) else text_end
+    
+    def _overlap_start(self, text: str, units: Sequence[int], start: int, previous_start: int) -> int:
+        """
+        Move a chunk start back to repeat the end of the previous chunk.
+        
+        The new start is the first word start within chunk_overlap units
+        before start, and always after the previous chunk's start. Text
+        without whitespace in that window (e.g. Chinese or Japanese) overlaps
+        by exactly chunk_overlap units.
+        """
+        index = max(bisect_right(units, start) - 1 - self.chunk_overlap, 0)
+        window_start = max(units[index], previous_start + 1)
+        if window_start >= start:
+            return start
         
-        return text.strip()
+        match = _WORD_START.search(text, window_start, start)
+        if match is not None:
+            return match.start()
+        if _WHITESPACE.search(text, window_start, start) is None:
+            return window_start
+        return start
     
-    def _split_text_recursive(self, text: str, separators: List[str]) -> List[str]:
+    def _split_ranges(
+        self,
+        text: str,
+        start: int,
+        end: int,
+        separators: List[str],
+        limit: Callable[[int], int]
+    ) -> List[Tuple[int, int]]:
         """
-        Recursively split text using different separators.
+        Split text[start:end] into chunk ranges.
+        
+        Works on offsets into the original string instead of concatenating
+        pieces: a chunk is extended to the last separator before its size
+        limit with a single ``rfind``, so the Python-level work is per chunk
+        rather than per piece and only chunk-sized windows are scanned.
+        Oversized pieces are refined with the remaining separators on the
+        same string; the empty separator cuts pieces that contain no other
+        separator into windows of the maximum size.
         
         Args:
-            text: Text to split
+            text: Original text
+            start: Start offset of the range to split
+            end: End offset of the range to split
             separators: List of separators to try in order
+            limit: Maps a range start to the furthest end keeping the range
+                within the chunk size
             
         Returns:
-            List of text chunks
+            List of (start, end) offsets of chunks
         """
-        final_chunks = []
-        
-        # Use the first separator that exists in the text
-        separator = ""
-        for sep in separators:
-            if sep in text:
-                separator = sep
+        # Use the first separator that exists in the range
+        level = len(separators) - 1
+        for i, sep in enumerate(separators):
+            if not sep or text.find(sep, start, end) != -1:
+                level = i
                 break
+        separator = separators[level] if separators else ""
         
-        # Split by the chosen separator
-        if separator:
-            splits = text.split(separator)
-        else:
-            splits = [text]
-        
-        # Process each split
-        current_chunk = ""
-        for split in splits:
-            # If adding this split would exceed chunk size
-            if len(current_chunk) + len(split) + len(separator) > self.chunk_size:
-                if current_chunk:
-                    final_chunks.append(current_chunk)
-                    current_chunk = ""
-                
-                # If single split is too large, recursively split it further
-                if len(split) > self.chunk_size and len(separators) > 1:
-                    sub_chunks = self._split_text_recursive(split, separators[1:])
-                    final_chunks.extend(sub_chunks)
-                else:
-                    final_chunks.append(split)
-            else:
-                # Add to current chunk
-                if current_chunk:
-                    current_chunk += separator
-                current_chunk += split
+        if not separator:
+            windows = []
+            while start < end:
+                window_end = min(max(limit(start), start + 1), end)
+                windows.append((start, window_end))
+                start = window_end
+            return windows
         
-        # Don't forget the last chunk
-        if current_chunk:
-            final_chunks.append(current_chunk)
+        sep_len = len(separator)
+        can_refine = level + 1 < len(separators)
         
-        return final_chunks
+        # Punctuation in a separator (the '.' of '. ') stays with the text before it
+        keep = len(separator.rstrip())
+        
+        chunks = []
+        piece_start = start
+        while True:
+            found = text.find(separator, piece_start, end)
+            piece_end = end if found == -1 else found + keep
+            
+            chunk_limit = limit(piece_start)
+            if piece_end <= chunk_limit:
+                if piece_end > piece_start:
+                    # Extend over every following piece that keeps the chunk within its limit
+                    if end <= chunk_limit:
+                        found, piece_end = -1, end
+                    else:
+                        found = text.rfind(separator, found, chunk_limit - keep + sep_len)
+                        piece_end = found + keep
+                    chunks.append((piece_start, piece_end))
+            elif can_refine:
+                # A single piece is too large, split it further
+                chunks.extend(self._split_ranges(text, piece_start, piece_end, separators[level + 1:], limit))
+            else:
+                chunks.append((piece_start, piece_end))
+            
+            if found == -1:
+                break
+            piece_start = found + sep_len
+        
+        return chunks
     
     def merge_chunks(self, chunks: List[TextChunk]) -> str:
         """
@@ -197,7 +378,8 @@ class TextChunker:
             return {"total_chunks": 0, "total_chars": 0, "pages": []}
         
         total_chars = sum(len(chunk.content) for chunk in chunks)
-        pages = list(set(chunk.page_number for chunk in chunks))
+        pages = set(chunk.page_number for chunk in chunks)
+        pages.update(chunk.end_page_number for chunk in chunks)
         
         return {
             "total_chunks": len(chunks),
@@ -205,5 +387,231 @@ class TextChunker:
             "pages": sorted(pages),
             "avg_chunk_size": total_chars // len(chunks) if chunks else 0,
             "chunk_size_config": self.chunk_size,
-            "overlap_config": self.chunk_overlap
-        }
\ No newline at end of file
+            "overlap_config": self.chunk_overlap,
+            "size_unit": self.size_unit,
+            "chunk_mode": self.chunk_mode
+        }
+
+
+class DocumentChunker:
+    """
+    Streaming chunker that lets chunks continue across page boundaries.
+    
+    Pages are added one at a time and joined with a blank line. Every chunk
+    that can no longer grow is returned as soon as its page is added; only
+    the unfinished tail (plus the previous chunk's start, for overlap) is
+    kept, so memory stays bounded by the chunk size and the longest page.
+    A chunk's page_number/start_char locate its start in the page text it
+    begins on, end_page_number/end_char its end in the page it ends on.
+    
+    ``snapshot`` captures the state between pages as a few page positions
+    and offsets, and ``restore`` rebuilds it from the pages those refer to,
+    so a paginated read can resume mid-document without re-chunking the
+    pages before it.
+    """
+    
+    PAGE_SEPARATOR = "\n\n"
+    
+    def __init__(self, chunker: TextChunker):
+        """
+        Initialize the document chunker.
+        
+        Args:
+            chunker: Chunker providing the size, overlap and unit settings
+        """
+        self.chunker = chunker
+        self._buffer = ""
+        # (buffer offset, page position, page number, page offset, metadata) per page in the buffer
+        self._segments: List[Tuple[int, int, int, int, Dict[str, Any]]] = []
+        self._split_from = 0
+        self._previous_start = -1
+        self._next_index = 0
+        self._position = 0
+    
+    def add_page(self, text: str, page_number: int, metadata: Optional[Dict[str, Any]] = None) -> List[TextChunk]:
+        """
+        Add the next page and return the chunks it completes.
+        
+        Args:
+            text: Page text
+            page_number: Page number of the text
+            metadata: Page metadata, shared by chunks starting on this page
+            
+        Returns:
+            Chunks that end before the unfinished tail of the text so far
+        """
+        self._append(text, 0, page_number, metadata or {})
+        return self._emit(final=False)
+    
+    def finish(self) -> List[TextChunk]:
+        """
+        Return the remaining chunks once every page has been added.
+        
+        Returns:
+            Chunks covering the unfinished tail
+        """
+        chunks = self._emit(final=True)
+        self._buffer = ""
+        self._segments = []
+        self._split_from = 0
+        self._previous_start = -1
+        return chunks
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Capture the state before the next page as JSON-serializable data.
+        
+        Returns:
+            Dictionary with the next page position, next chunk index and
+            [page position, page offset] pairs for the retained text
+        """
+        return {
+            'position': self._position,
+            'next_index': self._next_index,
+            'retain': self._locate(0) if self._segments else None,
+            'split_from': self._locate(self._split_from) if self._split_from < len(self._buffer) else None,
+            'previous_start': self._locate(self._previous_start) if self._previous_start >= 0 else None
+        }
+    
+    @classmethod
+    def restore(
+        cls,
+        chunker: TextChunker,
+        state: Dict[str, Any],
+        pages_content: List[Dict[str, Any]]
+    ) -> "DocumentChunker":
+        """
+        Rebuild a document chunker from a snapshot.
+        
+        Args:
+            chunker: Chunker with the same settings as when the snapshot was taken
+            state: Result of ``snapshot``
+            pages_content: Page dictionaries for the positions from
+                state['retain'] up to (excluding) state['position']
+            
+        Returns:
+            DocumentChunker in the captured state
+            
+        Raises:
+            ValueError: If the snapshot does not match the pages
+        """
+        document = cls(chunker)
+        try:
+            position = int(state['position'])
+            document._next_index = int(state['next_index'])
+            retain = state['retain']
+            if retain is None:
+                document._position = position
+                return document
+            
+            document._position = int(retain[0])
+            if document._position + len(pages_content) != position:
+                raise ValueError("pages do not cover the snapshot")
+            
+            for i, page_data in enumerate(pages_content):
+                document._append(
+                    page_data.get('text', ''),
+                    int(retain[1]) if i == 0 else 0,
+                    page_data.get('page_number', 0),
+                    page_data.get('metadata', {})
+                )
+            
+            split_from, previous_start = state['split_from'], state['previous_start']
+            document._split_from = len(document._buffer) if split_from is None else document._offset(split_from)
+            document._previous_start = -1 if previous_start is None else document._offset(previous_start)
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid document chunker state: {e}")
+        return document
+    
+    def _append(self, text: str, page_offset: int, page_number: int, metadata: Dict[str, Any]) -> None:
+        """Append text[page_offset:] of the next page position to the buffer."""
+        position = self._position
+        self._position += 1
+        if not text[page_offset:].strip():
+            return
+        
+        if self._segments:
+            self._buffer += self.PAGE_SEPARATOR
+        self._segments.append((len(self._buffer), position, page_number, page_offset, metadata))
+        self._buffer += text[page_offset:]
+    
+    def _emit(self, final: bool) -> List[TextChunk]:
+        """Chunk the buffered tail, keeping its last range open unless final."""
+        buffer = self._buffer
+        if self._split_from >= len(buffer):
+            return []
+        
+        units = self.chunker._unit_starts(buffer)
+        ranges = self.chunker._split_text(buffer, self._split_from, units)
+        if not final and ranges:
+            # The last range may still grow with the next page
+            open_start = ranges.pop()[0]
+        else:
+            open_start = len(buffer)
+        
+        chunks = []
+        for start, end in self.chunker._chunk_bounds(buffer, units, ranges, self._previous_start):
+            start_segment = self._segment(start)
+            end_segment = self._segment(end - 1)
+            chunks.append(TextChunk(
+                content=buffer[start:end],
+                page_number=start_segment[2],
+                chunk_index=self._next_index,
+                start_char=start - start_segment[0] + start_segment[3],
+                end_char=end - end_segment[0] + end_segment[3],
+                metadata=start_segment[4],
+                end_page_number=end_segment[2]
+            ))
+            self._next_index += 1
+            self._previous_start = start
+        
+        # The open range starts at its first non-whitespace character, so
+        # retained text always begins inside a page
+        match = _NON_SPACE.search(buffer, open_start)
+        self._split_from = match.start() if match else len(buffer)
+        self._discard_before(self._previous_start if self._previous_start >= 0 else self._split_from)
+        return chunks
+    
+    def _discard_before(self, offset: int) -> None:
+        """Drop buffered text before offset, which lies inside a page."""
+        if offset <= 0:
+            return
+        if offset >= len(self._buffer):
+            self._buffer = ""
+            self._segments = []
+            self._split_from = 0
+            self._previous_start = -1
+            return
+        
+        index = self._segment_index(offset)
+        buffer_start, position, page_number, page_offset, metadata = self._segments[index]
+        segments = [(0, position, page_number, page_offset + offset - buffer_start, metadata)]
+        segments.extend(
+            (segment[0] - offset,) + segment[1:] for segment in self._segments[index + 1:]
+        )
+        self._segments = segments
+        self._buffer = self._buffer[offset:]
+        self._split_from -= offset
+        if self._previous_start >= 0:
+            self._previous_start -= offset
+    
+    def _segment_index(self, offset: int) -> int:
+        """Index of the segment containing a buffer offset."""
+        return bisect_right([segment[0] for segment in self._segments], offset) - 1
+    
+    def _segment(self, offset: int) -> Tuple[int, int, int, int, Dict[str, Any]]:
+        """Segment containing a buffer offset."""
+        return self._segments[self._segment_index(offset)]
+    
+    def _locate(self, offset: int) -> List[int]:
+        """Map a buffer offset inside a page to [page position, page offset]."""
+        buffer_start, position, _, page_offset, _ = self._segment(offset)
+        return [position, offset - buffer_start + page_offset]
+    
+    def _offset(self, location: List[int]) -> int:
+        """Map [page position, page offset] back to a buffer offset."""
+        position, page_offset = int(location[0]), int(location[1])
+        for buffer_start, segment_position, _, segment_offset, _ in self._segments:
+            if segment_position == position:
+                return buffer_start + page_offset - segment_offset
+        raise ValueError(f"page position {position} is not buffered")
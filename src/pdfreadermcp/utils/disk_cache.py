@@ -0,0 +1,358 @@
+"""
+Persistent SQLite-backed cache tier for PDF processing results.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from .instrumentation import logger
+
+# Storage failures treated as cache misses: database errors and file system
+# errors such as an unwritable or missing cache directory
+_STORAGE_ERRORS = (sqlite3.Error, OSError)
+
+# Keys per statement, below SQLite's default limit of bound parameters
+_BATCH_SIZE = 500
+
+
+def _batches(keys: List[str]) -> Iterator[List[str]]:
+    """Split keys into slices small enough for one IN (...) clause."""
+    for start in range(0, len(keys), _BATCH_SIZE):
+        yield keys[start:start + _BATCH_SIZE]
+
+
+class DiskCache:
+    """
+    On-disk cache that survives server restarts.
+
+    Values are stored as zlib-compressed JSON in a single SQLite database
+    together with a checksum and the source file's mtime/size. The total
+    payload size is capped; least recently accessed entries are evicted
+    first. Any storage error is treated as a cache miss so a damaged
+    cache never breaks a tool call. If the database cannot be opened at
+    all, the tier turns itself off for the rest of the process.
+    """
+
+    SCHEMA_VERSION = 1
+    DB_NAME = "cache.sqlite3"
+
+    def __init__(self, cache_dir: Union[str, Path], max_bytes: int = 512 * 1024 * 1024):
+        """
+        Initialize the disk cache.
+
+        Args:
+            cache_dir: Directory holding the cache database
+            max_bytes: Maximum total size of stored payloads
+        """
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.max_bytes = max_bytes
+        self.db_path = self.cache_dir / self.DB_NAME
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._total_bytes = 0
+        self._entry_count = 0
+        self._corrupt_entries = 0
+        self.disabled = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open the database on first use, recreating it if it is damaged.
+
+        Raises:
+            sqlite3.Error: If the tier is disabled or the database cannot be opened
+            OSError: If the cache directory cannot be created
+        """
+        if self._conn is not None:
+            return self._conn
+        if self.disabled:
+            raise sqlite3.OperationalError("disk cache is disabled")
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            try:
+                conn = self._open_database()
+            except sqlite3.DatabaseError:
+                # Unreadable or corrupt database file: start over
+                for suffix in ("", "-wal", "-shm"):
+                    Path(str(self.db_path) + suffix).unlink(missing_ok=True)
+                conn = self._open_database()
+            entry_count, total_bytes = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+        except _STORAGE_ERRORS as e:
+            self.disabled = True
+            logger.warning("Disk cache at %s disabled: %s", self.cache_dir, e)
+            raise
+
+        self._conn = conn
+        self._entry_count = entry_count
+        self._total_bytes = total_bytes
+        return conn
+
+    def _open_database(self) -> sqlite3.Connection:
+        """Connect, verify integrity and create the schema."""
+        conn = sqlite3.connect(self.db_path, timeout=5, check_same_thread=False)
+        try:
+            if conn.execute("PRAGMA quick_check").fetchone()[0] != "ok":
+                raise sqlite3.DatabaseError("cache database failed integrity check")
+
+            if conn.execute("PRAGMA user_version").fetchone()[0] != self.SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS entries")
+                conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS entries (
+                    cache_key TEXT PRIMARY KEY,
+                    payload BLOB NOT NULL,
+                    checksum TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    file_mtime REAL NOT NULL,
+                    file_size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at)")
+            conn.commit()
+        except sqlite3.DatabaseError:
+            conn.close()
+            raise
+        return conn
+
+    @staticmethod
+    def _checksum(payload: bytes) -> str:
+        """Checksum used to detect damaged payloads."""
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def get(self, cache_key: str) -> Optional[Tuple[Any, float, int, float]]:
+        """
+        Look up an entry.
+
+        Args:
+            cache_key: Key generated by ``PDFCache``
+
+        Returns:
+            Tuple of (data, file_mtime, file_size, created_at) or None
+        """
+        return self.get_many([cache_key]).get(cache_key)
+
+    def get_many(self, cache_keys: List[str]) -> Dict[str, Tuple[Any, float, int, float]]:
+        """
+        Look up several entries in one transaction.
+
+        Damaged entries are dropped, and the access time of the entries
+        found is updated in the same transaction.
+
+        Args:
+            cache_keys: Keys generated by ``PDFCache``
+
+        Returns:
+            Mapping of the keys found to (data, file_mtime, file_size, created_at)
+        """
+        if not cache_keys or self.disabled:
+            return {}
+
+        found = {}
+        with self._lock:
+            try:
+                conn = self._connect()
+                rows = []
+                for batch in _batches(list(dict.fromkeys(cache_keys))):
+                    rows.extend(conn.execute(
+                        "SELECT cache_key, payload, checksum, file_mtime, file_size, created_at "
+                        f"FROM entries WHERE cache_key IN ({', '.join('?' * len(batch))})",
+                        batch
+                    ).fetchall())
+
+                corrupt = []
+                for cache_key, payload, checksum, file_mtime, file_size, created_at in rows:
+                    try:
+                        if self._checksum(payload) != checksum:
+                            raise ValueError("checksum mismatch")
+                        data = json.loads(zlib.decompress(payload))
+                    except (ValueError, zlib.error):
+                        corrupt.append(cache_key)
+                        continue
+                    found[cache_key] = (data, file_mtime, file_size, created_at)
+
+                if corrupt:
+                    self._corrupt_entries += len(corrupt)
+                    self._delete(conn, corrupt)
+                if found:
+                    now = time.time()
+                    conn.executemany(
+                        "UPDATE entries SET accessed_at = ? WHERE cache_key = ?",
+                        [(now, cache_key) for cache_key in found]
+                    )
+                if corrupt or found:
+                    conn.commit()
+                return found
+            except _STORAGE_ERRORS:
+                return {}
+
+    def set(self, cache_key: str, data: Any, file_mtime: float, file_size: int) -> bool:
+        """
+        Store an entry.
+
+        Args:
+            cache_key: Key generated by ``PDFCache``
+            data: JSON-serializable value
+            file_mtime: Modification time of the source file
+            file_size: Size of the source file
+
+        Returns:
+            True if the entry was stored
+        """
+        return self.set_many([(cache_key, data, file_mtime, file_size)]) == 1
+
+    def set_many(self, items: List[Tuple[str, Any, float, int]]) -> int:
+        """
+        Store several entries in one transaction.
+
+        Args:
+            items: Tuples of (cache key, JSON-serializable value, source
+                file mtime, source file size)
+
+        Returns:
+            Number of entries stored
+        """
+        if self.disabled:
+            return 0
+
+        rows = {}
+        now = time.time()
+        for cache_key, data, file_mtime, file_size in items:
+            try:
+                payload = zlib.compress(json.dumps(data, ensure_ascii=False).encode("utf-8"))
+            except (TypeError, ValueError):
+                continue
+            if len(payload) > self.max_bytes:
+                continue
+            rows[cache_key] = (
+                cache_key, payload, self._checksum(payload), len(payload),
+                file_mtime, file_size, now, now
+            )
+        if not rows:
+            return 0
+
+        with self._lock:
+            try:
+                conn = self._connect()
+                old_sizes = {}
+                for batch in _batches(list(rows)):
+                    old_sizes.update(conn.execute(
+                        f"SELECT cache_key, size FROM entries WHERE cache_key IN ({', '.join('?' * len(batch))})",
+                        batch
+                    ).fetchall())
+                conn.executemany(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    list(rows.values())
+                )
+                self._total_bytes += sum(row[3] for row in rows.values()) - sum(old_sizes.values())
+                self._entry_count += len(rows) - len(old_sizes)
+                self._evict_if_needed(conn)
+                conn.commit()
+                return len(rows)
+            except _STORAGE_ERRORS:
+                # Leave no half-written batch for the next commit to pick up
+                if self._conn is not None:
+                    try:
+                        self._conn.rollback()
+                    except sqlite3.Error:
+                        pass
+                return 0
+
+    def delete(self, cache_key: str) -> None:
+        """Remove an entry."""
+        self.delete_many([cache_key])
+
+    def delete_many(self, cache_keys: List[str]) -> None:
+        """Remove several entries in one transaction."""
+        if not cache_keys or self.disabled:
+            return
+        with self._lock:
+            try:
+                conn = self._connect()
+                self._delete(conn, cache_keys)
+                conn.commit()
+            except _STORAGE_ERRORS:
+                pass
+
+    def _delete(self, conn: sqlite3.Connection, cache_keys: List[str]) -> None:
+        """Remove entries using an open connection; the caller commits."""
+        for batch in _batches(list(dict.fromkeys(cache_keys))):
+            placeholders = ', '.join('?' * len(batch))
+            count, size = conn.execute(
+                f"SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries WHERE cache_key IN ({placeholders})",
+                batch
+            ).fetchone()
+            if count:
+                conn.execute(f"DELETE FROM entries WHERE cache_key IN ({placeholders})", batch)
+                self._total_bytes -= size
+                self._entry_count -= count
+
+    def _evict_if_needed(self, conn: sqlite3.Connection) -> None:
+        """Evict least recently accessed entries until under the size cap."""
+        while self._total_bytes > self.max_bytes:
+            rows = conn.execute(
+                "SELECT cache_key, size FROM entries ORDER BY accessed_at LIMIT 64"
+            ).fetchall()
+            if not rows:
+                self._total_bytes = 0
+                self._entry_count = 0
+                break
+            for cache_key, size in rows:
+                conn.execute("DELETE FROM entries WHERE cache_key = ?", (cache_key,))
+                self._total_bytes -= size
+                self._entry_count -= 1
+                if self._total_bytes <= self.max_bytes:
+                    break
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            try:
+                conn = self._connect()
+                conn.execute("DELETE FROM entries")
+                conn.commit()
+                self._total_bytes = 0
+                self._entry_count = 0
+            except _STORAGE_ERRORS:
+                pass
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get disk cache statistics.
+
+        The entry count and size are kept up to date by the writers, so this
+        never waits for the database lock and is safe on the event loop.
+        Both are 0 until the database is first used.
+
+        Returns:
+            Dictionary with cache stats
+        """
+        return {
+            "path": str(self.db_path),
+            "entries": self._entry_count,
+            "size_bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+            "disabled": self.disabled,
+            "corrupt_entries_dropped": self._corrupt_entries
+        }
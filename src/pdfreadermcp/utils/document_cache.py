@@ -0,0 +1,348 @@
+"""
+Shared pool of opened PDF documents.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+try:
+    import pdfplumber
+except ImportError:
+    pdfplumber = None
+
+try:
+    from pypdf import PdfReader
+except ImportError:
+    PdfReader = None
+
+
+def _open_pypdf(path: Path) -> Any:
+    """
+    Open a document with pypdf.
+
+    Given a path, pypdf reads the whole file into memory; given a file
+    object it reads objects from the file on demand. The file is closed
+    with the handle (see ``DocumentCache._discard``).
+    """
+    if PdfReader is None:
+        raise RuntimeError("pypdf is not installed. Please install it with: pip install pypdf")
+    stream = open(path, "rb")
+    try:
+        return PdfReader(stream)
+    except BaseException:
+        stream.close()
+        raise
+
+
+def _open_pdfplumber(path: Path) -> Any:
+    """Open a document with pdfplumber."""
+    if pdfplumber is None:
+        raise RuntimeError("pdfplumber is not installed. Please install it with: pip install pdfplumber")
+    return pdfplumber.open(path)
+
+
+def default_max_open(limit: int = 64) -> int:
+    """
+    Pick a handle limit that leaves most file descriptors to the rest of the process.
+
+    Args:
+        limit: Upper bound for the result
+
+    Returns:
+        A quarter of the soft RLIMIT_NOFILE, capped at limit
+    """
+    if resource is None:
+        return limit
+    soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft == resource.RLIM_INFINITY:
+        return limit
+    return max(1, min(limit, soft // 4))
+
+
+DocumentKey = Tuple[str, str]
+
+
+@dataclass
+class DocumentEntry:
+    """An opened document handle together with its bookkeeping."""
+    key: DocumentKey
+    handle: Any
+    file_mtime: float
+    file_size: int
+    last_used: float
+    in_use: bool = False
+    stale: bool = False
+
+    def matches(self, stat) -> bool:
+        """Check whether the document still reflects the file on disk."""
+        return self.file_mtime == stat.st_mtime and self.file_size == stat.st_size
+
+
+class DocumentCache:
+    """
+    Bounded pool of parsed PDF documents shared by all tools.
+
+    Opening a PDF parses its cross-reference table and object tree, which
+    dominates the cost of small operations. Handles are kept open per
+    (file, library) and reused by later calls. Neither pypdf nor pdfplumber
+    handles are safe for concurrent use, so each checkout is exclusive:
+    worker threads working on the same file get separate handles (up to
+    ``max_handles_per_document``) or wait for one to be returned.
+
+    At most ``max_open`` handles exist at once; when the limit is reached
+    the least recently used idle handle is closed. Handles idle for longer
+    than ``idle_timeout`` seconds are closed by a background sweeper, and
+    handles whose file changed on disk are discarded.
+    """
+
+    OPENERS: Dict[str, Callable[[Path], Any]] = {
+        "pypdf": _open_pypdf,
+        "pdfplumber": _open_pdfplumber,
+    }
+
+    def __init__(
+        self,
+        idle_timeout: float = 120.0,
+        max_open: Optional[int] = None,
+        max_handles_per_document: int = 2,
+        checkout_timeout: float = 120.0
+    ):
+        """
+        Initialize the document pool.
+
+        Args:
+            idle_timeout: Seconds after which an unused handle is closed
+            max_open: Maximum number of open handles (derived from the
+                file descriptor limit if omitted)
+            max_handles_per_document: Maximum concurrent handles for one file
+            checkout_timeout: Seconds to wait for a free handle before failing
+        """
+        self.idle_timeout = idle_timeout
+        self.max_open = max_open if max_open and max_open > 0 else default_max_open()
+        self.max_handles_per_document = max(1, max_handles_per_document)
+        self.checkout_timeout = checkout_timeout
+
+        self._documents: Dict[DocumentKey, List[DocumentEntry]] = {}
+        self._idle: "OrderedDict[int, DocumentEntry]" = OrderedDict()
+        self._open_count = 0
+        self._cond = threading.Condition()
+        self._sweeper: Optional[threading.Thread] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.waits = 0
+        self.lru_closes = 0
+        self.idle_closes = 0
+        self.invalidations = 0
+
+    @contextmanager
+    def acquire(self, file_path: Union[str, Path], kind: str) -> Iterator[Any]:
+        """
+        Check out an opened document for exclusive use.
+
+        Args:
+            file_path: Path to the PDF file
+            kind: Library used to open it, 'pypdf' or 'pdfplumber'
+
+        Yields:
+            The opened document (``pypdf.PdfReader`` or ``pdfplumber.PDF``)
+
+        Raises:
+            TimeoutError: If no handle became available in time
+        """
+        if kind not in self.OPENERS:
+            raise ValueError(f"Unknown document kind: {kind}")
+
+        path = Path(file_path)
+        key = (str(path.resolve()), kind)
+        entry = self._checkout(key, path)
+
+        try:
+            yield entry.handle
+        finally:
+            self._release(entry)
+
+    def _checkout(self, key: DocumentKey, path: Path) -> DocumentEntry:
+        """Take an idle handle for key, or reserve a slot and open a new one."""
+        stat = path.stat()
+        deadline = time.monotonic() + self.checkout_timeout
+        self._ensure_sweeper()
+
+        with self._cond:
+            while True:
+                entries = self._documents.get(key, [])
+
+                for entry in list(entries):
+                    if not entry.matches(stat):
+                        # The file changed: drop idle handles now, busy ones on release
+                        if not entry.stale:
+                            entry.stale = True
+                            self.invalidations += 1
+                        if not entry.in_use:
+                            self._discard(entry)
+
+                for entry in entries:
+                    if not entry.in_use and not entry.stale:
+                        entry.in_use = True
+                        self._idle.pop(id(entry), None)
+                        self.hits += 1
+                        return entry
+
+                live = sum(1 for entry in entries if not entry.stale)
+                if live < self.max_handles_per_document:
+                    if self._open_count >= self.max_open and self._idle:
+                        _, lru_entry = self._idle.popitem(last=False)
+                        self._discard(lru_entry)
+                        self.lru_closes += 1
+                    if self._open_count < self.max_open:
+                        self._open_count += 1
+                        break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"Timed out waiting for a handle to {path}")
+                self.waits += 1
+                self._cond.wait(remaining)
+
+        # Open outside the lock; the slot is already reserved
+        try:
+            handle = self.OPENERS[key[1]](path)
+        except BaseException:
+            with self._cond:
+                self._open_count -= 1
+                self._cond.notify_all()
+            raise
+
+        entry = DocumentEntry(
+            key=key,
+            handle=handle,
+            file_mtime=stat.st_mtime,
+            file_size=stat.st_size,
+            last_used=time.monotonic(),
+            in_use=True
+        )
+        with self._cond:
+            self._documents.setdefault(key, []).append(entry)
+            self.misses += 1
+        return entry
+
+    def _release(self, entry: DocumentEntry) -> None:
+        """Return a checked out handle to the pool."""
+        with self._cond:
+            entry.in_use = False
+            entry.last_used = time.monotonic()
+            if entry.stale:
+                self._discard(entry)
+            else:
+                self._idle[id(entry)] = entry
+            self._cond.notify_all()
+
+    def _discard(self, entry: DocumentEntry) -> None:
+        """Remove a handle that is not in use from the pool and close it. Caller holds the lock."""
+        self._idle.pop(id(entry), None)
+        entries = self._documents.get(entry.key)
+        if entries is not None and entry in entries:
+            entries.remove(entry)
+            if not entries:
+                del self._documents[entry.key]
+            self._open_count -= 1
+
+        close = getattr(entry.handle, "close", None)
+        if close is not None:
+            try:
+                close()
+            except Exception:
+                pass
+
+        # pypdf leaves a file object it did not open itself to the caller
+        stream = getattr(entry.handle, "stream", None)
+        if stream is not None and not getattr(stream, "closed", True):
+            try:
+                stream.close()
+            except Exception:
+                pass
+        self._cond.notify_all()
+
+    def close_idle(self) -> int:
+        """
+        Close handles that have not been used for ``idle_timeout`` seconds.
+
+        Returns:
+            Number of handles closed
+        """
+        deadline = time.monotonic() - self.idle_timeout
+        closed = 0
+        with self._cond:
+            # The idle map is in release order, so expired handles come first
+            while self._idle:
+                entry = next(iter(self._idle.values()))
+                if entry.last_used >= deadline:
+                    break
+                self._discard(entry)
+                closed += 1
+            self.idle_closes += closed
+        return closed
+
+    def _ensure_sweeper(self) -> None:
+        """Start the background thread that closes idle handles."""
+        with self._cond:
+            if self._sweeper is not None and self._sweeper.is_alive():
+                return
+            self._sweeper = threading.Thread(
+                target=self._sweep_loop, name="pdfreadermcp-documents", daemon=True
+            )
+            self._sweeper.start()
+
+    def _sweep_loop(self) -> None:
+        """Periodically close idle handles."""
+        interval = max(1.0, self.idle_timeout / 2)
+        while True:
+            time.sleep(interval)
+            self.close_idle()
+
+    def clear(self) -> None:
+        """Close all idle handles and retire the ones in use."""
+        with self._cond:
+            for entries in list(self._documents.values()):
+                for entry in list(entries):
+                    entry.stale = True
+                    if not entry.in_use:
+                        self._discard(entry)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get document pool statistics.
+
+        Returns:
+            Dictionary with pool stats
+        """
+        with self._cond:
+            in_use = sum(
+                1 for entries in self._documents.values() for entry in entries if entry.in_use
+            )
+            return {
+                "open_handles": self._open_count,
+                "in_use": in_use,
+                "idle": len(self._idle),
+                "documents": len(self._documents),
+                "max_open": self.max_open,
+                "max_handles_per_document": self.max_handles_per_document,
+                "idle_timeout": self.idle_timeout,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / (self.hits + self.misses) if self.hits + self.misses else 0.0,
+                "waits": self.waits,
+                "lru_closes": self.lru_closes,
+                "idle_closes": self.idle_closes,
+                "invalidations": self.invalidations
+            }
@@ -0,0 +1,188 @@
+"""
+Worker pool for running blocking PDF work off the asyncio event loop.
+"""
+
+import asyncio
+import contextvars
+import functools
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+
+class WorkerPool:
+    """
+    Executor layer shared by all MCP tools.
+    
+    Light, I/O-heavy work (opening files, writing split/merged PDFs) runs on
+    a thread pool, while CPU-bound layout analysis can be sent to a process
+    pool so it is not serialized by the GIL. A semaphore bounds how many
+    jobs run at once; callers beyond that limit wait in a queue whose depth
+    is reported by ``get_stats``.
+    """
+    
+    def __init__(
+        self,
+        max_threads: int = 4,
+        max_processes: int = 0,
+        max_concurrency: int = 8
+    ):
+        """
+        Initialize the worker pool.
+        
+        Args:
+            max_threads: Number of threads for light work
+            max_processes: Number of worker processes for CPU-bound work
+                (0 uses the CPU count, a negative value disables the pool
+                and CPU-bound work falls back to threads)
+            max_concurrency: Maximum number of jobs running at once
+        """
+        self.max_threads = max(1, max_threads)
+        if max_processes == 0:
+            max_processes = os.cpu_count() or 1
+        self.max_processes = max(0, max_processes)
+        self.max_concurrency = max(1, max_concurrency)
+        
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._lock = threading.Lock()
+        
+        self._waiting = 0
+        self._running = {"thread": 0, "process": 0}
+        self._completed = {"thread": 0, "process": 0}
+        self._failed = {"thread": 0, "process": 0}
+    
+    @classmethod
+    def from_config(cls, config) -> "WorkerPool":
+        """Create a worker pool from a ``ServerConfig``."""
+        return cls(
+            max_threads=config.max_threads,
+            max_processes=config.max_processes,
+            max_concurrency=config.max_concurrency
+        )
+    
+    @property
+    def has_process_pool(self) -> bool:
+        """Whether CPU-bound work is sent to separate processes."""
+        return self.max_processes > 0
+    
+    async def run_in_thread(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking callable on the thread pool.
+        
+        The callable runs in a copy of the caller's context, so context
+        variables such as the current tool call stay visible.
+        
+        Args:
+            func: Callable to run
+            *args: Positional arguments for the callable
+            **kwargs: Keyword arguments for the callable
+        
+        Returns:
+            The callable's return value
+        """
+        call = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+        return await self._submit("thread", self._get_thread_pool(), call)
+    
+    async def run_in_process(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a CPU-bound callable on the process pool.
+        
+        The callable and its arguments must be picklable. When the process
+        pool is disabled the call runs on the thread pool instead.
+        
+        Args:
+            func: Module-level callable to run
+            *args: Positional arguments for the callable
+            **kwargs: Keyword arguments for the callable
+        
+        Returns:
+            The callable's return value
+        """
+        if not self.has_process_pool:
+            return await self.run_in_thread(func, *args, **kwargs)
+        
+        call = functools.partial(func, *args, **kwargs)
+        return await self._submit("process", self._get_process_pool(), call)
+    
+    async def _submit(self, kind: str, executor: Executor, call: Callable[[], Any]) -> Any:
+        """Wait for a free slot, then run the call on the given executor."""
+        semaphore = self._get_semaphore()
+        loop = asyncio.get_running_loop()
+        
+        self._waiting += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            self._waiting -= 1
+        
+        self._running[kind] += 1
+        try:
+            result = await loop.run_in_executor(executor, call)
+        except BaseException:
+            self._failed[kind] += 1
+            raise
+        else:
+            self._completed[kind] += 1
+            return result
+        finally:
+            self._running[kind] -= 1
+            semaphore.release()
+    
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Create the concurrency semaphore lazily inside the running loop."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+    
+    def _get_thread_pool(self) -> ThreadPoolExecutor:
+        """Create the thread pool on first use."""
+        with self._lock:
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(
+                    max_workers=self.max_threads,
+                    thread_name_prefix="pdfreadermcp"
+                )
+            return self._thread_pool
+    
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Create the process pool on first use."""
+        with self._lock:
+            if self._process_pool is None:
+                # Spawned workers behave the same on every platform and do not
+                # inherit the server's threads or open file handles.
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.max_processes,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._process_pool
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down both pools."""
+        with self._lock:
+            if self._thread_pool is not None:
+                self._thread_pool.shutdown(wait=wait)
+                self._thread_pool = None
+            if self._process_pool is not None:
+                self._process_pool.shutdown(wait=wait)
+                self._process_pool = None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get worker pool statistics.
+        
+        Returns:
+            Dictionary with pool sizes, queue depth and job counters
+        """
+        return {
+            "max_threads": self.max_threads,
+            "max_processes": self.max_processes,
+            "max_concurrency": self.max_concurrency,
+            "queue_depth": self._waiting,
+            "running": dict(self._running),
+            "completed": dict(self._completed),
+            "failed": dict(self._failed)
+        }
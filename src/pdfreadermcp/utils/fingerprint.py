@@ -0,0 +1,151 @@
+"""
+Content fingerprints for identifying PDF files independently of their path.
+"""
+
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple, Union
+
+
+# (path, device, inode, size, mtime_ns) - changes whenever the file may have changed
+StatKey = Tuple[str, int, int, int, int]
+
+
+class FileFingerprinter:
+    """
+    Computes content-based file identities.
+
+    ``fingerprint`` returns a fast sampled hash over the file size and a few
+    fixed-size blocks (head, middle, tail), so identical documents at
+    different paths map to the same identity and touching a file does not
+    change it. ``full_hash`` returns a hash of the whole file; it is
+    computed on a background thread the first time it is requested and
+    lets callers confirm that two files with equal samples really match.
+    Both results are memoized per path and stat signature.
+    """
+
+    SAMPLE_SIZE = 64 * 1024
+    READ_SIZE = 1024 * 1024
+
+    def __init__(self, background: bool = True):
+        """
+        Initialize the fingerprinter.
+
+        Args:
+            background: Compute full hashes on a background thread; when
+                False ``full_hash`` computes them synchronously
+        """
+        self.background = background
+        self._sampled: Dict[str, Tuple[StatKey, str]] = {}
+        self._full: Dict[str, Tuple[StatKey, str]] = {}
+        self._pending: Set[StatKey] = set()
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @staticmethod
+    def _stat_key(path: Path) -> StatKey:
+        """Stat signature used to memoize hashes."""
+        stat = path.stat()
+        return (str(path), stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    def fingerprint(self, file_path: Union[str, Path]) -> str:
+        """
+        Get the sampled content fingerprint of a file.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            Hex digest prefixed with the file size
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        path = Path(file_path)
+        stat_key = self._stat_key(path)
+
+        with self._lock:
+            cached = self._sampled.get(stat_key[0])
+            if cached is not None and cached[0] == stat_key:
+                return cached[1]
+
+        size = stat_key[3]
+        digest = hashlib.blake2b(str(size).encode(), digest_size=16)
+        with open(path, "rb") as f:
+            if size <= 3 * self.SAMPLE_SIZE:
+                digest.update(f.read())
+            else:
+                for offset in (0, (size - self.SAMPLE_SIZE) // 2, size - self.SAMPLE_SIZE):
+                    f.seek(offset)
+                    digest.update(f.read(self.SAMPLE_SIZE))
+
+        fingerprint = f"{size:x}-{digest.hexdigest()}"
+        with self._lock:
+            self._sampled[stat_key[0]] = (stat_key, fingerprint)
+        return fingerprint
+
+    def full_hash(self, file_path: Union[str, Path]) -> Optional[str]:
+        """
+        Get the full content hash of a file if it is available.
+
+        When the hash has not been computed for the file's current state it
+        is scheduled in the background and None is returned.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            Hex digest of the whole file, or None while it is being computed
+        """
+        path = Path(file_path)
+        try:
+            stat_key = self._stat_key(path)
+        except OSError:
+            return None
+
+        with self._lock:
+            cached = self._full.get(stat_key[0])
+            if cached is not None and cached[0] == stat_key:
+                return cached[1]
+            if self.background:
+                if stat_key not in self._pending:
+                    self._pending.add(stat_key)
+                    if self._executor is None:
+                        self._executor = ThreadPoolExecutor(
+                            max_workers=1, thread_name_prefix="pdfreadermcp-hash"
+                        )
+                    self._executor.submit(self._compute_full_hash, path, stat_key)
+                return None
+
+        return self._compute_full_hash(path, stat_key)
+
+    def _compute_full_hash(self, path: Path, stat_key: StatKey) -> Optional[str]:
+        """Hash the whole file and memoize the result."""
+        try:
+            digest = hashlib.blake2b(digest_size=32)
+            with open(path, "rb") as f:
+                for block in iter(lambda: f.read(self.READ_SIZE), b""):
+                    digest.update(block)
+
+            # Discard the result if the file changed while it was being read
+            if self._stat_key(path) != stat_key:
+                return None
+
+            full_hash = digest.hexdigest()
+            with self._lock:
+                self._full[stat_key[0]] = (stat_key, full_hash)
+            return full_hash
+        except OSError:
+            return None
+        finally:
+            with self._lock:
+                self._pending.discard(stat_key)
+
+    def shutdown(self) -> None:
+        """Stop the background hashing thread."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
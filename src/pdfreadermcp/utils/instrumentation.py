@@ -0,0 +1,171 @@
+"""
+Opt-in request timing and structured logging.
+"""
+
+import json
+import logging
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, Iterator, Optional
+
+logger = logging.getLogger("pdfreadermcp")
+
+
+class JsonFormatter(logging.Formatter):
+    """Format log records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'time': round(record.created, 3),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        entry.update(getattr(record, 'fields', None) or {})
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def configure_logging(level: str = "WARNING") -> None:
+    """
+    Send the package logger to stderr as JSON lines.
+
+    stdout carries the MCP protocol, so logs must never go there. The
+    logger does not propagate, which keeps its records out of handlers the
+    MCP framework installs on the root logger.
+
+    An unknown level name is reported as a warning and replaced by INFO
+    rather than keeping the server from starting.
+
+    Args:
+        level: Logging level name, e.g. 'INFO' or 'WARNING'
+    """
+    if not any(getattr(handler, '_pdfreadermcp', False) for handler in logger.handlers):
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(JsonFormatter())
+        handler._pdfreadermcp = True
+        logger.addHandler(handler)
+    logger.propagate = False
+
+    name = str(level).strip().upper()
+    if name in logging.getLevelNamesMapping():
+        logger.setLevel(name)
+    else:
+        logger.setLevel(logging.INFO)
+        logger.warning("Unknown PDFREADERMCP_LOG_LEVEL %r; using INFO", level)
+
+
+class RequestTimer:
+    """
+    Per-stage and per-page timings of one request.
+
+    Stage times are summed over every call of the stage, so a stage run by
+    concurrent jobs (such as 'extract' while pages are streamed) can add up
+    to more than the request's wall time. Per-page stages measured in
+    worker processes ('open', 'extract_text', 'quality') are also summed
+    into the stage totals; 'open' is attributed to the first page of each
+    worker job.
+    """
+
+    enabled = True
+
+    def __init__(self, operation: str, attach: bool = False, fields: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the timer.
+
+        Args:
+            operation: Name of the timed tool operation
+            attach: Whether the timings are added to the response
+            fields: Extra fields for the log entry, e.g. the file path
+        """
+        self.operation = operation
+        self.attach = attach
+        self.fields = fields or {}
+        self.started = time.perf_counter()
+        self.stages: Dict[str, float] = {}
+        self.pages: Dict[int, Dict[str, float]] = {}
+        self.counters: Dict[str, int] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as (part of) a stage."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - started)
+
+    def add(self, name: str, seconds: float) -> None:
+        """Add seconds to a stage."""
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def add_page(self, page_number: int, timings: Dict[str, float]) -> None:
+        """Record the stage times of one page, in seconds."""
+        page = self.pages.setdefault(page_number, {})
+        for name, seconds in timings.items():
+            page[name] = page.get(name, 0.0) + seconds
+            self.add(name, seconds)
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Increase a counter such as 'cache_hits'."""
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Timings so far, in milliseconds.
+
+        Returns:
+            Dictionary with 'total_ms', 'stages_ms', 'pages_ms' (keyed by
+            page number) and the counters
+        """
+        return {
+            'total_ms': _ms(time.perf_counter() - self.started),
+            'stages_ms': {name: _ms(seconds) for name, seconds in self.stages.items()},
+            'pages_ms': {
+                str(page_number): {name: _ms(seconds) for name, seconds in stages.items()}
+                for page_number, stages in sorted(self.pages.items())
+            },
+            **self.counters
+        }
+
+    def finish(self, response: str) -> None:
+        """Record the response size and log the timings at INFO level."""
+        self.count('response_bytes', len(response.encode('utf-8')))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "%s timings", self.operation,
+                extra={'fields': {'operation': self.operation, **self.fields, **self.to_dict()}}
+            )
+
+
+class NullTimer:
+    """Timer used when instrumentation is off; every method is a no-op."""
+
+    enabled = False
+    attach = False
+
+    _context = nullcontext()
+
+    def stage(self, name: str):
+        return self._context
+
+    def add(self, name: str, seconds: float) -> None:
+        pass
+
+    def add_page(self, page_number: int, timings: Dict[str, float]) -> None:
+        pass
+
+    def count(self, name: str, amount: int = 1) -> None:
+        pass
+
+    def finish(self, response: str) -> None:
+        pass
+
+
+NULL_TIMER = NullTimer()
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
@@ -0,0 +1,446 @@
+"""
+Server-wide tool metrics: call counts, latency histograms and page throughput.
+"""
+
+import bisect
+import contextvars
+import functools
+import math
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+from .instrumentation import logger
+
+# Upper bounds of the latency buckets in seconds, Prometheus style
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+# Pages counted by the tool call running in the current task
+_current_call: contextvars.ContextVar[Optional["_Call"]] = contextvars.ContextVar(
+    "pdfreadermcp_call", default=None
+)
+
+
+class _Call:
+    """Mutable per-call record shared by the tasks and threads of one tool call."""
+
+    __slots__ = ("pages",)
+
+    def __init__(self):
+        self.pages = 0
+
+
+def count_pages(amount: int) -> None:
+    """
+    Add pages to the tool call running in the current context.
+
+    Outside an instrumented tool call this does nothing.
+
+    Args:
+        amount: Number of pages read or written
+    """
+    call = _current_call.get()
+    if call is not None:
+        call.pages += amount
+
+
+class LatencyHistogram:
+    """Cumulative-bucket latency histogram with an estimated quantile."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Initialize the histogram.
+
+        Args:
+            buckets: Increasing upper bounds in seconds; an implicit '+Inf'
+                bucket catches the rest
+        """
+        self.bounds: Tuple[float, ...] = tuple(buckets)
+        self.counts: List[int] = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record one latency."""
+        self.counts[bisect.bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """Bucket labels ('le' values) with cumulative counts, ending with '+Inf'."""
+        labels = [_format_bound(bound) for bound in self.bounds] + ["+Inf"]
+        total = 0
+        buckets = []
+        for label, count in zip(labels, self.counts):
+            total += count
+            buckets.append((label, total))
+        return buckets
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile by linear interpolation inside its bucket.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Estimated latency in seconds, or None without observations.
+            Quantiles in the '+Inf' bucket report the largest finite bound.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                if index == len(self.bounds):
+                    return self.bounds[-1]
+                lower = self.bounds[index - 1] if index else 0.0
+                return lower + (self.bounds[index] - lower) * (rank - seen) / count
+            seen += count
+        return self.bounds[-1]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Histogram summary.
+
+        Returns:
+            Dictionary with 'count', 'sum_seconds', estimated 'p50_ms',
+            'p90_ms' and 'p99_ms', and cumulative 'buckets' keyed by upper
+            bound in seconds
+        """
+        summary: Dict[str, Any] = {'count': self.count, 'sum_seconds': round(self.sum, 6)}
+        for name, q in (('p50_ms', 0.5), ('p90_ms', 0.9), ('p99_ms', 0.99)):
+            value = self.quantile(q)
+            summary[name] = round(value * 1000, 3) if value is not None else None
+        summary['buckets'] = dict(self.cumulative())
+        return summary
+
+
+class _ToolStats:
+    """Counters of one tool."""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.calls = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.pages = 0
+        self.latency = LatencyHistogram(buckets)
+
+
+class ServerMetrics:
+    """
+    Registry of per-tool call counts, errors, latencies and pages.
+
+    Tools are wrapped with ``instrument``; code running inside a tool call
+    reports its pages with ``count_pages``. Tool responses are JSON strings
+    whose first key is 'success', so a call counts as an error when it
+    raises or returns a response starting with '{"success":false'.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Initialize the registry.
+
+        Args:
+            buckets: Upper bounds of the latency buckets in seconds
+        """
+        self.buckets = tuple(buckets)
+        self.started = time.time()
+        self._tools: Dict[str, _ToolStats] = {}
+        self._lock = threading.Lock()
+        self._export_path: Optional[Path] = None
+        self._export_collect: Optional[Callable[[], Dict[str, Any]]] = None
+        self._export_interval = 0.0
+        self._last_export = 0.0
+        self._exporting = False
+
+    def instrument(self, func: Callable[..., Awaitable[str]]) -> Callable[..., Awaitable[str]]:
+        """
+        Decorate an async tool so every call is recorded under its name.
+
+        The wrapper keeps the tool's signature, so it can sit below the
+        framework's tool decorator.
+
+        Args:
+            func: Async tool function returning a JSON string
+
+        Returns:
+            Wrapped tool function
+        """
+        name = func.__name__
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            call = _Call()
+            token = _current_call.set(call)
+            stats = self._tool(name)
+            with self._lock:
+                stats.in_flight += 1
+            started = time.perf_counter()
+            failed = True
+            try:
+                response = await func(*args, **kwargs)
+                failed = _is_error(response)
+                return response
+            finally:
+                elapsed = time.perf_counter() - started
+                _current_call.reset(token)
+                with self._lock:
+                    stats.in_flight -= 1
+                    stats.calls += 1
+                    stats.errors += failed
+                    stats.pages += call.pages
+                    stats.latency.observe(elapsed)
+                self.maybe_export()
+
+        return wrapper
+
+    def _tool(self, name: str) -> _ToolStats:
+        """Get or create the counters of a tool."""
+        with self._lock:
+            stats = self._tools.get(name)
+            if stats is None:
+                stats = self._tools[name] = _ToolStats(self.buckets)
+            return stats
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Current tool metrics.
+
+        'pages_per_second' of a tool is its pages divided by the summed
+        duration of its calls (throughput while busy); the server-wide
+        rates are averaged over the uptime.
+
+        Returns:
+            Dictionary with 'uptime_seconds', per-tool 'tools' entries and
+            server-wide 'totals'
+        """
+        uptime = time.time() - self.started
+        tools = {}
+        calls = pages = 0
+        with self._lock:
+            for name, stats in sorted(self._tools.items()):
+                tools[name] = {
+                    'calls': stats.calls,
+                    'errors': stats.errors,
+                    'in_flight': stats.in_flight,
+                    'pages': stats.pages,
+                    'pages_per_second': round(stats.pages / stats.latency.sum, 3) if stats.latency.sum else 0.0,
+                    'latency': stats.latency.to_dict()
+                }
+                calls += stats.calls
+                pages += stats.pages
+        return {
+            'uptime_seconds': round(uptime, 3),
+            'tools': tools,
+            'totals': {
+                'calls': calls,
+                'pages': pages,
+                'calls_per_second': round(calls / uptime, 3) if uptime else 0.0,
+                'pages_per_second': round(pages / uptime, 3) if uptime else 0.0
+            }
+        }
+
+    def export_to(
+        self,
+        path: str,
+        collect: Callable[[], Dict[str, Any]],
+        interval_seconds: float = 15.0
+    ) -> None:
+        """
+        Periodically write the stats in Prometheus text format to a file.
+
+        The file is rewritten in the background after a tool call once at
+        least interval_seconds have passed since the last write, by an
+        atomic rename, so it suits the node_exporter textfile collector.
+
+        Args:
+            path: Output file, conventionally ending in '.prom'
+            collect: Returns the full stats dictionary (see ``render_prometheus``)
+            interval_seconds: Minimum seconds between writes
+        """
+        self._export_path = Path(path)
+        self._export_collect = collect
+        self._export_interval = interval_seconds
+
+    def maybe_export(self, force: bool = False) -> None:
+        """
+        Write the Prometheus file if an export is configured and due.
+
+        Collecting and writing run on a background thread, so the tool call
+        that triggers the export does not wait for them. An export still in
+        progress is not started again.
+        """
+        if self._export_path is None or self._export_collect is None:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if self._exporting or (not force and now - self._last_export < self._export_interval):
+                return
+            self._last_export = now
+            self._exporting = True
+        threading.Thread(target=self._export, name="pdfreadermcp-metrics", daemon=True).start()
+
+    def _export(self) -> None:
+        """Collect the stats and write the Prometheus file."""
+        try:
+            write_prometheus(self._export_path, render_prometheus(self._export_collect()))
+        except Exception:
+            logger.warning("Writing metrics to %s failed", self._export_path, exc_info=True)
+        finally:
+            with self._lock:
+                self._exporting = False
+
+
+def process_memory() -> Dict[str, Any]:
+    """
+    Memory use of the server process.
+
+    Returns:
+        Dictionary with 'rss_bytes' (current resident set, None where
+        /proc is unavailable) and 'max_rss_bytes' (peak resident set of
+        this process; worker processes are not included)
+    """
+    rss = None
+    try:
+        with open('/proc/self/statm', 'rb') as statm:
+            rss = int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+
+    max_rss = None
+    if resource is not None:
+        # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+        scale = 1 if sys.platform == 'darwin' else 1024
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+    return {'rss_bytes': rss, 'max_rss_bytes': max_rss}
+
+
+def render_prometheus(stats: Dict[str, Any], prefix: str = "pdfreadermcp") -> str:
+    """
+    Render server stats in the Prometheus text exposition format.
+
+    Args:
+        stats: Dictionary from ``ServerMetrics.snapshot`` extended with
+            'caches' (name to cache stats with 'hits' and 'misses'),
+            'worker_pool' (``WorkerPool.get_stats``) and 'memory'
+            (``process_memory``)
+        prefix: Metric name prefix
+
+    Returns:
+        Exposition text ending with a newline
+    """
+    lines: List[str] = []
+
+    def metric(name: str, kind: str, help_text: str, samples: List[Tuple[Dict[str, str], Any]]) -> None:
+        samples = [(labels, value) for labels, value in samples if value is not None]
+        if not samples:
+            return
+        lines.append(f"# HELP {prefix}_{name} {help_text}")
+        lines.append(f"# TYPE {prefix}_{name} {kind}")
+        for labels, value in samples:
+            lines.append(f"{prefix}_{name}{_labels(labels)} {_format_value(value)}")
+
+    tools = stats.get('tools', {})
+    metric("uptime_seconds", "gauge", "Seconds since the server started.",
+           [({}, stats.get('uptime_seconds'))])
+    metric("tool_calls_total", "counter", "Completed tool calls.",
+           [({'tool': name}, tool['calls']) for name, tool in tools.items()])
+    metric("tool_errors_total", "counter", "Tool calls that failed.",
+           [({'tool': name}, tool['errors']) for name, tool in tools.items()])
+    metric("tool_in_flight", "gauge", "Tool calls currently running.",
+           [({'tool': name}, tool['in_flight']) for name, tool in tools.items()])
+    metric("tool_pages_total", "counter", "Pages read or written by tool calls.",
+           [({'tool': name}, tool['pages']) for name, tool in tools.items()])
+
+    if tools:
+        lines.append(f"# HELP {prefix}_tool_duration_seconds Tool call latency.")
+        lines.append(f"# TYPE {prefix}_tool_duration_seconds histogram")
+        for name, tool in tools.items():
+            latency = tool['latency']
+            for bound, count in latency['buckets'].items():
+                lines.append(f"{prefix}_tool_duration_seconds_bucket{_labels({'tool': name, 'le': bound})} {count}")
+            lines.append(f"{prefix}_tool_duration_seconds_sum{_labels({'tool': name})} {_format_value(latency['sum_seconds'])}")
+            lines.append(f"{prefix}_tool_duration_seconds_count{_labels({'tool': name})} {latency['count']}")
+
+    caches = {name: cache for name, cache in (stats.get('caches') or {}).items() if cache}
+    metric("cache_hits_total", "counter", "Cache lookups that found an entry.",
+           [({'cache': name}, cache.get('hits', 0) + cache.get('disk_hits', 0)) for name, cache in caches.items()])
+    metric("cache_misses_total", "counter", "Cache lookups that found no entry.",
+           [({'cache': name}, cache.get('misses')) for name, cache in caches.items()])
+    metric("cache_hit_ratio", "gauge", "Share of cache lookups that hit since startup.",
+           [({'cache': name}, cache.get('hit_ratio')) for name, cache in caches.items()])
+    metric("cache_resident_bytes", "gauge", "Bytes held in memory by the cache.",
+           [({'cache': name}, cache.get('resident_bytes')) for name, cache in caches.items()])
+
+    pool = stats.get('worker_pool') or {}
+    if pool:
+        metric("worker_queue_depth", "gauge", "Jobs waiting for a worker slot.",
+               [({}, pool.get('queue_depth'))])
+        metric("worker_running", "gauge", "Jobs running on the worker pool.",
+               [({'kind': kind}, value) for kind, value in pool.get('running', {}).items()])
+        metric("worker_completed_total", "counter", "Jobs completed by the worker pool.",
+               [({'kind': kind}, value) for kind, value in pool.get('completed', {}).items()])
+        metric("worker_failed_total", "counter", "Jobs that raised on the worker pool.",
+               [({'kind': kind}, value) for kind, value in pool.get('failed', {}).items()])
+
+    memory = stats.get('memory') or {}
+    metric("resident_memory_bytes", "gauge", "Resident memory of the server process.",
+           [({}, memory.get('rss_bytes'))])
+    metric("max_resident_memory_bytes", "gauge", "Peak resident memory of the server process.",
+           [({}, memory.get('max_rss_bytes'))])
+
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(path: Path, text: str) -> None:
+    """Replace a file atomically, so readers never see a partial write."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    temp_path.write_text(text, encoding='utf-8')
+    os.replace(temp_path, path)
+
+
+def _is_error(response: Any) -> bool:
+    """Whether a tool response is an error response."""
+    if not isinstance(response, str):
+        return False
+    head = response[:40].replace(' ', '').replace('\n', '')
+    return head.startswith('{"success":false')
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    """Render a label set, escaping values."""
+    if not labels:
+        return ""
+    rendered = ",".join(
+        '{}="{}"'.format(key, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for key, value in labels.items()
+    )
+    return "{" + rendered + "}"
+
+
+def _format_value(value: Any) -> str:
+    """Render a sample value."""
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, float):
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        return repr(value)
+    return str(value)
+
+
+def _format_bound(bound: float) -> str:
+    """Render a bucket bound the way Prometheus clients do, e.g. '0.5' or '1.0'."""
+    return repr(float(bound))
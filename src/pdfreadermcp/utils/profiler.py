@@ -0,0 +1,261 @@
+"""
+Opt-in stack sampling of slow tool calls.
+"""
+
+import asyncio
+import functools
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from .instrumentation import logger
+from .serializer import dumps
+
+# A thread whose innermost Python frame is in one of these files is waiting
+# for work (lock, queue or selector), so its samples are skipped
+_IDLE_FILES = (
+    os.sep + 'threading.py',
+    os.sep + 'queue.py',
+    os.sep + 'selectors.py',
+    os.sep + os.path.join('concurrent', 'futures', 'thread.py'),
+)
+
+# Housekeeping threads (document sweeper, this sampler) are named with this
+# prefix; worker threads use 'pdfreadermcp_N' and are sampled
+_SERVICE_THREAD_PREFIX = 'pdfreadermcp-'
+
+_JSON_TYPES = (str, int, float, bool, type(None), list, dict)
+
+
+class _Session:
+    """Stack samples collected while one tool call runs."""
+
+    __slots__ = ("stacks", "samples")
+
+    def __init__(self):
+        self.stacks: Counter = Counter()
+        self.samples = 0
+
+
+class SlowCallProfiler:
+    """
+    Sample the server's thread stacks during tool calls and keep the
+    profiles of calls slower than a threshold.
+
+    Whether a call will be slow is only known once it ends, so every call is
+    sampled while it runs and the samples are dropped for fast calls. One
+    background thread reads ``sys._current_frames()`` at a fixed interval
+    while at least one call is running. It sees every thread of the server
+    process, so the work of concurrent calls shows up in each other's
+    profiles; pages extracted in worker processes appear only as the
+    thread waiting for them.
+
+    A slow call writes two files to the profile directory: ``<name>.json``
+    with the tool, its parameters, the duration and the most frequent
+    functions, and ``<name>.folded`` with one ``thread;frame;frame count``
+    line per stack, the input format of flame graph tools.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        threshold_seconds: float = 2.0,
+        interval_seconds: float = 0.01,
+        max_profiles: int = 100
+    ):
+        """
+        Initialize the profiler.
+
+        Args:
+            directory: Output directory for profiles (None disables profiling)
+            threshold_seconds: Calls taking at least this long are written
+            interval_seconds: Time between stack samples
+            max_profiles: Number of profiles kept; the oldest are deleted
+        """
+        self.directory = Path(directory) if directory else None
+        self.threshold_seconds = threshold_seconds
+        self.interval_seconds = interval_seconds
+        self.max_profiles = max_profiles
+        self._sessions: List[_Session] = []
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether slow calls are profiled."""
+        return self.directory is not None
+
+    def instrument(self, func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        """
+        Decorate an async tool so slow calls are profiled.
+
+        Returns the tool unchanged when profiling is disabled.
+
+        Args:
+            func: Async tool function
+
+        Returns:
+            Wrapped tool function
+        """
+        if not self.enabled:
+            return func
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            session = self._start()
+            started_at = datetime.now()
+            started = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                self._stop(session)
+                if elapsed >= self.threshold_seconds:
+                    # File I/O stays off the event loop
+                    await asyncio.to_thread(self._write, func.__name__, kwargs, started_at, elapsed, session)
+
+        return wrapper
+
+    def _start(self) -> _Session:
+        """Register a session and start the sampler thread if needed."""
+        session = _Session()
+        with self._lock:
+            self._sessions.append(session)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="pdfreadermcp-profiler", daemon=True
+                )
+                self._thread.start()
+        return session
+
+    def _stop(self, session: _Session) -> None:
+        """Unregister a session; the sampler stops once none are left."""
+        with self._lock:
+            self._sessions.remove(session)
+
+    def _run(self) -> None:
+        """Sampler thread: add the current stacks to every running session."""
+        while True:
+            with self._lock:
+                if not self._sessions:
+                    self._thread = None
+                    return
+                sessions = list(self._sessions)
+            stacks = self._sample()
+            with self._lock:
+                for session in sessions:
+                    session.stacks.update(stacks)
+                    session.samples += 1
+            time.sleep(self.interval_seconds)
+
+    @staticmethod
+    def _sample() -> List[str]:
+        """Folded stacks of all busy threads except the housekeeping ones."""
+        own = threading.get_ident()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        stacks = []
+        for ident, frame in sys._current_frames().items():
+            name = names.get(ident, f"thread-{ident}")
+            if ident == own or name.startswith(_SERVICE_THREAD_PREFIX):
+                continue
+            if frame.f_code.co_filename.endswith(_IDLE_FILES):
+                continue
+            frames = []
+            while frame is not None:
+                frames.append(_frame_name(frame))
+                frame = frame.f_back
+            frames.append(name.replace(';', ':'))
+            stacks.append(';'.join(reversed(frames)))
+        return stacks
+
+    def _write(
+        self,
+        tool: str,
+        parameters: Dict[str, Any],
+        started_at: datetime,
+        elapsed: float,
+        session: _Session
+    ) -> None:
+        """Write the profile files of a slow call and prune old profiles."""
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            name = f"{started_at.strftime('%Y%m%d-%H%M%S-%f')}-{tool}"
+            folded = sorted(session.stacks.items(), key=lambda item: -item[1])
+
+            profile = {
+                'tool': tool,
+                'started_at': started_at.isoformat(timespec='milliseconds'),
+                'duration_ms': round(elapsed * 1000, 3),
+                'threshold_ms': round(self.threshold_seconds * 1000, 3),
+                'parameters': {
+                    key: value for key, value in parameters.items() if isinstance(value, _JSON_TYPES)
+                },
+                'sample_interval_ms': round(self.interval_seconds * 1000, 3),
+                'samples': session.samples,
+                'top_functions': _top_functions(session.stacks),
+                'folded_file': f"{name}.folded"
+            }
+
+            (self.directory / f"{name}.folded").write_text(
+                ''.join(f"{stack} {count}\n" for stack, count in folded), encoding='utf-8'
+            )
+            (self.directory / f"{name}.json").write_text(dumps(profile, "pretty"), encoding='utf-8')
+            logger.warning(
+                "Slow %s call profiled", tool,
+                extra={'fields': {
+                    'operation': tool,
+                    'duration_ms': profile['duration_ms'],
+                    'profile': str(self.directory / f"{name}.json")
+                }}
+            )
+            self._prune()
+        except Exception:
+            logger.warning("Writing the profile of a slow %s call failed", tool, exc_info=True)
+
+    def _prune(self) -> None:
+        """Delete the oldest profiles beyond max_profiles."""
+        profiles = sorted(self.directory.glob("*.json"))
+        for path in profiles[:max(0, len(profiles) - self.max_profiles)]:
+            path.unlink(missing_ok=True)
+            path.with_suffix(".folded").unlink(missing_ok=True)
+
+
+def _frame_name(frame) -> str:
+    """Function name with its module file and first line, e.g. 'extract (pdf_reader.py:42)'."""
+    code = frame.f_code
+    path = Path(code.co_filename)
+    location = f"{path.parent.name}/{path.name}" if path.name == "__init__.py" else path.name
+    return f"{code.co_name} ({location}:{code.co_firstlineno})"
+
+
+def _top_functions(stacks: Counter, limit: int = 25) -> List[Dict[str, Any]]:
+    """
+    Most sampled functions.
+
+    Args:
+        stacks: Folded stacks with their sample counts
+        limit: Maximum number of functions
+
+    Returns:
+        Entries with 'function', 'self_samples' (innermost frame) and
+        'total_samples' (anywhere on the stack), by self samples
+    """
+    own: Counter = Counter()
+    total: Counter = Counter()
+    for stack, count in stacks.items():
+        frames = stack.split(';')[1:]
+        if not frames:
+            continue
+        own[frames[-1]] += count
+        for frame in set(frames):
+            total[frame] += count
+    ranked = sorted(total, key=lambda frame: (-own[frame], -total[frame]))[:limit]
+    return [
+        {'function': frame, 'self_samples': own[frame], 'total_samples': total[frame]}
+        for frame in ranked
+    ]
@@ -0,0 +1,73 @@
+"""
+JSON serialization of tool responses.
+"""
+
+import json
+from typing import Any, Dict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# 'compact' is the default: no whitespace between tokens
+OUTPUT_FORMATS = ("compact", "pretty", "ndjson")
+
+
+def check_format(output_format: str) -> None:
+    """
+    Validate an output format name.
+
+    Args:
+        output_format: Requested output format
+
+    Raises:
+        ValueError: If the format is not one of OUTPUT_FORMATS
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"format must be one of: {', '.join(OUTPUT_FORMATS)}")
+
+
+def dumps(data: Any, output_format: str = "compact") -> str:
+    """
+    Serialize a response.
+
+    Uses ``orjson`` when it is installed and falls back to the standard
+    library otherwise (and for values orjson rejects, such as integers
+    beyond 64 bits). Non-ASCII text is emitted as is in every format.
+
+    Args:
+        data: JSON-serializable response
+        output_format: 'compact' for single-line JSON, 'pretty' for JSON
+            indented by two spaces, or 'ndjson' for one JSON document per
+            line: the response without its 'chunks' list, followed by one
+            line per chunk
+
+    Returns:
+        Serialized response
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    check_format(output_format)
+    if output_format == "ndjson":
+        if isinstance(data, dict) and isinstance(data.get('chunks'), list):
+            header: Dict[str, Any] = {key: value for key, value in data.items() if key != 'chunks'}
+            lines = [_dumps(header, False)]
+            lines.extend(_dumps(chunk, False) for chunk in data['chunks'])
+            return "\n".join(lines)
+        return _dumps(data, False)
+    return _dumps(data, output_format == "pretty")
+
+
+def _dumps(data: Any, pretty: bool) -> str:
+    """Serialize one JSON document."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0).decode("utf-8")
+        except TypeError:
+            pass
+    if pretty:
+        return json.dumps(data, ensure_ascii=False, indent=2)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
@@ -0,0 +1,302 @@
+"""
+Text quality analysis used to decide whether a page needs OCR.
+"""
+
+import re
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Pattern, Tuple
+
+
+# Bump when scoring changes so cached page records are recomputed
+QUALITY_VERSION = 3
+
+# Sentence terminators: ASCII, CJK (full and half width), Devanagari danda, Arabic/Urdu
+SENTENCE_BREAKS = '.!?。！？｡．︒।॥؟۔'
+
+# Text produced by pdfminer for glyphs without a Unicode mapping, e.g. "(cid:42)"
+_CID_GLYPH = re.compile(r'\(cid:\d+\)')
+
+_ASCII_LETTER = re.compile(r'[A-Za-z]')
+
+# Runs of Han ideographs and Japanese kana: written without spaces between words
+_CJK_RUN = re.compile(
+    '[\u3040-\u30ff\u31f0-\u31ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\uff66-\uff9f'
+    '\U00020000-\U0003134f]+'
+)
+
+# Pages with more special characters than this are garbled whatever their structure
+GARBLED_SPECIAL_RATIO = 0.3
+
+
+@dataclass(frozen=True)
+class ScriptProfile:
+    """Expected statistics of well-extracted text in a writing system."""
+    char_word_ratio: Tuple[float, float]
+    sentence_length: Tuple[float, float]
+
+
+_DEFAULT_PROFILE = ScriptProfile(char_word_ratio=(3, 8), sentence_length=(3, 25))
+
+SCRIPT_PROFILES: Dict[str, ScriptProfile] = {
+    # Words are counted per character, sentences run to dozens of characters
+    'cjk': ScriptProfile(char_word_ratio=(1, 3), sentence_length=(3, 80)),
+    # Longer average word length than English
+    'cyrillic': ScriptProfile(char_word_ratio=(3, 10), sentence_length=(3, 25)),
+    # Korean separates short word groups (eojeol) with spaces
+    'hangul': ScriptProfile(char_word_ratio=(2, 8), sentence_length=(2, 25)),
+    # Spaces separate phrases rather than words
+    'thai': ScriptProfile(char_word_ratio=(3, 40), sentence_length=(1, 25)),
+    'lao': ScriptProfile(char_word_ratio=(3, 40), sentence_length=(1, 25)),
+    'khmer': ScriptProfile(char_word_ratio=(3, 40), sentence_length=(1, 25)),
+    'myanmar': ScriptProfile(char_word_ratio=(3, 40), sentence_length=(1, 25)),
+}
+
+_SCRIPT_ALIASES = {'hiragana': 'cjk', 'katakana': 'cjk', 'bopomofo': 'cjk'}
+
+
+def _char_class(char: str) -> str:
+    """
+    Classify a character for quality analysis.
+
+    Returns ' ' for whitespace, '.' for sentence breaks, 'a' for letters
+    (including combining marks), '#' for special characters (symbols,
+    control, private-use and unassigned code points) and 'w' for anything
+    else (digits, underscore, punctuation).
+    """
+    if char.isspace():
+        return ' '
+    if char in SENTENCE_BREAKS:
+        return '.'
+    category = unicodedata.category(char)
+    if char.isalpha() or category[0] == 'M':
+        return 'a'
+    if category[0] in 'SC':
+        return '#'
+    return 'w'
+
+
+def _char_ranges(chars) -> str:
+    """Build a regex character class body from a sorted list of characters."""
+    ranges = []
+    start = previous = None
+    for char in chars:
+        code = ord(char)
+        if previous is not None and code == previous + 1:
+            previous = code
+            continue
+        if start is not None:
+            ranges.append((start, previous))
+        start = previous = code
+    if start is not None:
+        ranges.append((start, previous))
+    return ''.join(
+        re.escape(chr(a)) if a == b else f'{re.escape(chr(a))}-{re.escape(chr(b))}'
+        for a, b in ranges
+    )
+
+
+# Class of every ASCII character for the str.translate fast path
+_CLASS_TABLE = {code: _char_class(chr(code)) for code in range(128)}
+
+
+@lru_cache(maxsize=1)
+def _unicode_patterns() -> Dict[str, Pattern]:
+    """
+    Compile the patterns used for non-ASCII text.
+
+    Built from ``unicodedata`` on first use: letters are ``[^\\W\\d_]``,
+    combining marks and special characters are collected from the Basic
+    Multilingual Plane; private-use planes count as special.
+    """
+    marks = []
+    specials = []
+    for code in range(0x80, 0x10000):
+        char = chr(code)
+        if 0xD800 <= code <= 0xDFFF:
+            continue
+        char_class = _char_class(char)
+        if char_class == 'a' and not char.isalpha():
+            marks.append(char)
+        elif char_class == '#':
+            specials.append(char)
+
+    return {
+        'letter': re.compile(r'[^\W\d_]+'),
+        'mark': re.compile(f'[{_char_ranges(marks)}]+'),
+        'special': re.compile(f'[{_char_ranges(specials)}\U000f0000-\U0010ffff]+'),
+        'break': re.compile(f'[{re.escape(SENTENCE_BREAKS)}]+'),
+    }
+
+
+def _count_chars(pattern: Pattern, text: str) -> int:
+    """Count characters matched by a run pattern without building match lists."""
+    return len(text) - len(pattern.sub('', text))
+
+
+@lru_cache(maxsize=8192)
+def _char_script(char: str) -> str:
+    """Script of a letter from the first word of its Unicode name."""
+    words = unicodedata.name(char, '').split()
+    if words and words[0] in ('FULLWIDTH', 'HALFWIDTH'):
+        words = words[1:]
+    if not words:
+        return 'unknown'
+    script = words[0].lower()
+    return _SCRIPT_ALIASES.get(script, script)
+
+
+def detect_script(text: str, sample_size: int = 512) -> str:
+    """
+    Detect the dominant writing system of a text.
+
+    Letters from evenly spaced windows of the text are classified by the
+    first word of their Unicode name, so the cost is bounded by
+    sample_size regardless of page length.
+
+    Args:
+        text: Text to inspect
+        sample_size: Maximum number of characters examined
+
+    Returns:
+        Lower-case script name such as 'latin', 'cjk', 'hangul',
+        'cyrillic', 'arabic' or 'devanagari' ('unknown' without letters)
+    """
+    if text.isascii():
+        return 'latin' if _ASCII_LETTER.search(text) else 'unknown'
+
+    windows = 8
+    window = max(1, sample_size // windows)
+    step = max(window, len(text) // windows)
+    counts = Counter()
+    for start in range(0, len(text), step):
+        for char in text[start:start + window]:
+            if char.isalpha():
+                counts[_char_script(char)] += 1
+
+    if not counts:
+        return 'unknown'
+    return counts.most_common(1)[0][0]
+
+
+def analyze_text_quality(text: str) -> Dict[str, Any]:
+    """
+    Analyze the quality of extracted text to determine if OCR is needed.
+
+    Letters, special characters and sentence breaks are classified by
+    Unicode category, and the expected word and sentence statistics depend
+    on the detected script: Chinese and Japanese text is measured in
+    characters rather than whitespace-separated words. ASCII pages are
+    mapped once onto a string of character classes with ``str.translate``
+    and counted with C-level ``count``/``split``; other pages use a few
+    regex substitutions. No per-character match lists are built.
+
+    Args:
+        text: Extracted text
+
+    Returns:
+        Dictionary with quality metrics
+    """
+    if not text.strip():
+        return {
+            'quality_score': 0.0,
+            'word_count': 0,
+            'script': 'unknown',
+            'has_extractable_text': False
+        }
+
+    # Unmapped glyphs count as one special character each
+    if '(cid:' in text:
+        text = _CID_GLYPH.sub('\ufffd', text)
+
+    char_count = len(text)
+    script = detect_script(text)
+    profile = SCRIPT_PROFILES.get(script, _DEFAULT_PROFILE)
+
+    if text.isascii():
+        classes = text.translate(_CLASS_TABLE)
+        word_count = len(classes.split())
+        letter_count = classes.count('a')
+        special_count = classes.count('#')
+
+        # Sentences are separated by runs of break characters
+        sentence_words = len(classes.replace('.', ' ').split())
+        breaks = classes
+        while '..' in breaks:
+            breaks = breaks.replace('..', '.')
+        sentence_count = breaks.count('.') + 1
+    else:
+        patterns = _unicode_patterns()
+
+        # Han and kana count each character as a word, also within text
+        # dominated by another script. Their runs are collapsed to one space
+        # first: the length difference plus the run count gives the number
+        # of characters removed, and the remaining scans only see the
+        # (much shorter) non-CJK text
+        words_text, runs = _CJK_RUN.subn(' ', text)
+        unit_count = len(text) - len(words_text) + runs
+        word_count = unit_count + len(words_text.split())
+
+        letter_count = (
+            unit_count +
+            _count_chars(patterns['letter'], words_text) +
+            _count_chars(patterns['mark'], words_text)
+        )
+        special_count = _count_chars(patterns['special'], words_text)
+
+        sentence_text, break_runs = patterns['break'].subn(' ', words_text)
+        sentence_words = unit_count + len(sentence_text.split())
+        sentence_count = break_runs + 1
+
+    # Quality indicators
+    # 1. Character to word ratio (should be reasonable for the script)
+    char_word_ratio = char_count / max(word_count, 1)
+
+    # 2. Presence of normal sentence structures
+    avg_sentence_length = sentence_words / sentence_count
+
+    # 3. Ratio of letters to total characters
+    letter_ratio = letter_count / max(char_count, 1)
+
+    # 4. Check for garbled text (too many special characters)
+    special_char_ratio = special_count / max(char_count, 1)
+
+    # Calculate quality score (0.0 to 1.0)
+    quality_score = 0.0
+
+    # Good character to word ratio (typically 4-6 for English text)
+    if profile.char_word_ratio[0] <= char_word_ratio <= profile.char_word_ratio[1]:
+        quality_score += 0.3
+
+    # Reasonable sentence length
+    if profile.sentence_length[0] <= avg_sentence_length <= profile.sentence_length[1]:
+        quality_score += 0.3
+
+    # Good letter ratio (should be high for text)
+    if letter_ratio >= 0.6:
+        quality_score += 0.3
+
+    # Low special character ratio
+    if special_char_ratio <= 0.1:
+        quality_score += 0.1
+
+    # Minimum word count threshold; text dominated by unmapped glyphs or
+    # symbols is garbled even when its word structure looks normal
+    has_extractable_text = (
+        word_count >= 5 and
+        quality_score >= 0.4 and
+        special_char_ratio <= GARBLED_SPECIAL_RATIO
+    )
+
+    return {
+        'quality_score': quality_score,
+        'word_count': word_count,
+        'script': script,
+        'char_word_ratio': char_word_ratio,
+        'avg_sentence_length': avg_sentence_length,
+        'letter_ratio': letter_ratio,
+        'special_char_ratio': special_char_ratio,
+        'has_extractable_text': has_extractable_text
+    }
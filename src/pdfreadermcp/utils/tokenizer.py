@@ -0,0 +1,174 @@
+"""
+Local tokenizers used to size text chunks in tokens.
+"""
+
+import re
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import List
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+
+class Tokenizer(ABC):
+    """
+    Base class for tokenizers used by ``TextChunker``.
+
+    A tokenizer reports where each token of a text starts; the chunker
+    counts the tokens of any range with a binary search over these offsets,
+    so a page is tokenized once however often it is split, refined or
+    re-read by overlapping windows. Offsets of recently seen texts are kept
+    in a small LRU cache, which also covers the same page being chunked
+    again by a paginated request.
+
+    Subclasses implement ``_token_starts``.
+    """
+
+    name = "tokenizer"
+
+    def __init__(self, cache_size: int = 128):
+        """
+        Initialize the tokenizer.
+
+        Args:
+            cache_size: Number of texts whose token offsets are cached
+        """
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, List[int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def token_starts(self, text: str) -> List[int]:
+        """
+        Get the character offset at which each token of text starts.
+
+        Args:
+            text: Text to tokenize
+
+        Returns:
+            Strictly increasing offsets, starting with 0 for non-empty text
+        """
+        with self._lock:
+            starts = self._cache.get(text)
+            if starts is not None:
+                self._cache.move_to_end(text)
+                return starts
+
+        starts = self._token_starts(text)
+
+        with self._lock:
+            self._cache[text] = starts
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return starts
+
+    def count(self, text: str) -> int:
+        """Number of tokens in text."""
+        return len(self.token_starts(text))
+
+    @abstractmethod
+    def _token_starts(self, text: str) -> List[int]:
+        """Tokenize text and return the start offset of every token."""
+
+
+class ApproximateTokenizer(Tokenizer):
+    """
+    Fast dependency-free estimate of byte-pair encoding token counts.
+
+    Text is pre-tokenized like GPT-style BPE tokenizers (a leading space
+    belongs to the following word, digits are grouped in threes) and each
+    piece is then assumed to hold a fixed number of characters per token:
+    six for ASCII words (so common words are a single token), one for
+    Han/kana/Hangul characters and two for other letters. This tracks real
+    encoders closely for English prose and errs on the high side for other
+    scripts, so token-sized chunks stay within budget.
+    """
+
+    name = "approximate"
+
+    # Groups in order: ASCII words, CJK, other letters, digits, punctuation, whitespace
+    _PRETOKEN = re.compile(
+        r" ?([A-Za-z]+)"
+        r"|( ?[\u1100-\u11ff\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff]+)"
+        r"| ?([^\W\d_]+)"
+        r"| ?(\d+)"
+        r"| ?((?:[^\s\w]|_)+)"
+        r"|(\s+)"
+    )
+    _CHARS_PER_TOKEN = (6, 1, 2, 3, 2, None)
+
+    def _token_starts(self, text: str) -> List[int]:
+        starts = []
+        chars_per_token = self._CHARS_PER_TOKEN
+        for match in self._PRETOKEN.finditer(text):
+            start, end = match.span()
+            step = chars_per_token[match.lastindex - 1]
+            if step is None or end - start <= step:
+                starts.append(start)
+            else:
+                starts.extend(range(start, end, step))
+        return starts
+
+
+class TiktokenTokenizer(Tokenizer):
+    """Exact token offsets from a tiktoken encoding (requires ``tiktoken``)."""
+
+    def __init__(self, encoding: str = "cl100k_base", cache_size: int = 128):
+        """
+        Initialize the tokenizer.
+
+        Args:
+            encoding: tiktoken encoding name
+            cache_size: Number of texts whose token offsets are cached
+        """
+        if tiktoken is None:
+            raise ImportError("tiktoken is not installed. Please install it with: pip install tiktoken")
+        super().__init__(cache_size)
+        self.name = encoding
+        self._encoding = tiktoken.get_encoding(encoding)
+
+    def _token_starts(self, text: str) -> List[int]:
+        tokens = self._encoding.encode(text, disallowed_special=())
+        _, offsets = self._encoding.decode_with_offsets(tokens)
+
+        # Tokens holding part of a multi-byte character share its offset
+        starts = []
+        previous = -1
+        for offset in offsets:
+            if offset > previous:
+                starts.append(offset)
+                previous = offset
+        return starts
+
+
+_default_lock = threading.Lock()
+_tokenizers = {}
+
+
+def get_tokenizer(name: str = "approximate") -> Tokenizer:
+    """
+    Get a shared tokenizer by name.
+
+    Args:
+        name: 'approximate' for the built-in estimator, or a tiktoken
+            encoding name such as 'cl100k_base' or 'o200k_base'
+
+    Returns:
+        Tokenizer instance, shared by all callers asking for the same name
+
+    Raises:
+        ImportError: If a tiktoken encoding is requested without tiktoken
+        ValueError: If tiktoken does not know the encoding
+    """
+    with _default_lock:
+        tokenizer = _tokenizers.get(name)
+        if tokenizer is None:
+            if name == ApproximateTokenizer.name:
+                tokenizer = ApproximateTokenizer()
+            else:
+                tokenizer = TiktokenTokenizer(name)
+            _tokenizers[name] = tokenizer
+        return tokenizer
@@ -0,0 +1,57 @@
+"""
+Shared fixtures: small PDFs generated with the benchmark fixture writer.
+"""
+
+from pathlib import Path
+from typing import Callable, List
+
+import pytest
+
+import pdf_fixtures
+
+
+def write_text_pdf(path: Path, pages: List[List[str]], bottom_up: bool = False) -> Path:
+    """
+    Write a Helvetica PDF with the given lines on each page.
+
+    Args:
+        path: Output path
+        pages: Lines of text per page
+        bottom_up: Draw every page's lines from the bottom of the page
+            upwards, so content stream order is the reverse of reading order
+
+    Returns:
+        The output path
+    """
+    writer = pdf_fixtures.PDFWriter()
+    font = writer.add_object(pdf_fixtures._HELVETICA)
+    resources = b"<< /Font << /F1 %d 0 R >> >>" % font
+    for lines in pages:
+        encoded = [b"(" + pdf_fixtures._escape(line) + b")" for line in lines]
+        if bottom_up:
+            parts = [b"BT /F1 11 Tf 50 100 Td"]
+            for line in reversed(encoded):
+                parts.append(line + b" Tj 0 14 Td")
+            parts.append(b"ET")
+            content = b"\n".join(parts)
+        else:
+            content = pdf_fixtures._text_content(encoded, b"F1", 11)
+        writer.add_page(content, resources)
+    writer.write(path)
+    return path
+
+
+@pytest.fixture
+def make_pdf(tmp_path: Path) -> Callable[..., Path]:
+    """Factory writing ``write_text_pdf`` documents into the test directory."""
+    def make(name: str, pages: List[List[str]], bottom_up: bool = False) -> Path:
+        return write_text_pdf(tmp_path / name, pages, bottom_up)
+    return make
+
+
+@pytest.fixture
+def prose_pdf(tmp_path: Path) -> Path:
+    """Three pages of dense prose (about 4 KB of text per page)."""
+    path = tmp_path / "prose.pdf"
+    pdf_fixtures.text_heavy(path, pages=3)
+    return path
@@ -0,0 +1,227 @@
+"""
+Tests for the in-memory page cache and its persistent disk tier.
+"""
+
+import os
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from pdfreadermcp.utils.cache import PDFCache
+from pdfreadermcp.utils.disk_cache import DiskCache
+
+
+@pytest.fixture
+def source(tmp_path: Path) -> Path:
+    """File the cached results belong to."""
+    path = tmp_path / "source.pdf"
+    path.write_bytes(b"%PDF-1.4\n" + b"x" * 1000)
+    return path
+
+
+def _touch(path: Path, data: bytes) -> None:
+    """Rewrite a file and move its mtime forward so the change is visible."""
+    stat = path.stat()
+    path.write_bytes(data)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+class TestPDFCache:
+    def test_set_and_get(self, source):
+        cache = PDFCache()
+        cache.set(source, "page", {'text': 'hello'}, page=1)
+
+        assert cache.get(source, "page", page=1) == {'text': 'hello'}
+        assert cache.get(source, "page", page=2) is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_entry_limit_evicts_least_recently_used(self, source):
+        cache = PDFCache(max_entries=2)
+        cache.set(source, "page", "one", page=1)
+        cache.set(source, "page", "two", page=2)
+        cache.get(source, "page", page=1)
+        cache.set(source, "page", "three", page=3)
+
+        assert cache.get(source, "page", page=2) is None
+        assert cache.get(source, "page", page=1) == "one"
+        assert cache.get(source, "page", page=3) == "three"
+        assert cache.evictions == 1
+
+    def test_byte_budget_evicts_least_recently_used(self, source):
+        value_size = PDFCache._estimate_size("a" * 1000)
+        cache = PDFCache(max_bytes=value_size * 3)
+        for page in range(5):
+            cache.set(source, "page", chr(ord("a") + page) * 1000, page=page)
+
+        assert cache.get_stats()['resident_bytes'] <= value_size * 3
+        assert cache.get(source, "page", page=0) is None
+        assert cache.get(source, "page", page=1) is None
+        assert cache.get(source, "page", page=4) == "e" * 1000
+        assert cache.evictions == 2
+
+    def test_entry_larger_than_budget_is_not_cached(self, source):
+        cache = PDFCache(max_bytes=2000)
+        cache.set(source, "page", "small", page=1)
+        cache.set(source, "page", "x" * 10000, page=2)
+
+        assert cache.get(source, "page", page=2) is None
+        assert cache.get(source, "page", page=1) == "small"
+        assert cache.evictions == 0
+
+    def test_changed_file_invalidates_entries(self, source):
+        cache = PDFCache()
+        cache.set(source, "page", "old", page=1)
+        _touch(source, b"%PDF-1.4\nchanged")
+
+        assert cache.get(source, "page", page=1) is None
+        assert cache.invalidations == 1
+
+    def test_expired_entries_are_dropped(self, source):
+        cache = PDFCache(max_age_seconds=-1)
+        cache.set(source, "page", "old", page=1)
+
+        assert cache.get(source, "page", page=1) is None
+        assert cache.expirations == 1
+
+    def test_memory_only_lookup_does_not_count_misses(self, source):
+        cache = PDFCache()
+        cache.set(source, "page", "one", page=1)
+
+        results = cache.get_many(source, "page", [{'page': 1}, {'page': 2}], disk=False)
+        assert results == ["one", None]
+        assert (cache.hits, cache.misses) == (1, 0)
+
+        cache.get_many(source, "page", [{'page': 2}])
+        assert cache.misses == 1
+
+    def test_content_identity_shares_entries_between_copies(self, source, tmp_path):
+        copy = tmp_path / "copy.pdf"
+        copy.write_bytes(source.read_bytes())
+        cache = PDFCache(identity="content")
+        cache.set(source, "page", "shared", page=1)
+
+        assert cache.get(copy, "page", page=1) == "shared"
+
+    def test_unknown_identity(self):
+        with pytest.raises(ValueError):
+            PDFCache(identity="inode")
+
+
+class TestDiskCache:
+    def test_set_many_and_get_many(self, tmp_path):
+        disk = DiskCache(tmp_path / "cache")
+        stored = disk.set_many([
+            ("a", {'text': 'alpha'}, 1.0, 10),
+            ("b", ["beta"], 2.0, 20),
+            ("c", {1, 2}, 3.0, 30),  # not JSON-serializable, skipped
+        ])
+
+        assert stored == 2
+        found = disk.get_many(["a", "b", "c", "a"])
+        assert set(found) == {"a", "b"}
+        assert found["a"][:3] == ({'text': 'alpha'}, 1.0, 10)
+        assert disk.get("b")[0] == ["beta"]
+        assert disk.get_stats()['entries'] == 2
+
+        disk.delete_many(["a", "missing"])
+        assert disk.get("a") is None
+        assert disk.get_stats()['entries'] == 1
+        disk.close()
+
+    def test_entries_survive_reopening(self, tmp_path):
+        disk = DiskCache(tmp_path / "cache")
+        disk.set("key", {'text': 'persisted'}, 1.0, 10)
+        disk.close()
+
+        reopened = DiskCache(tmp_path / "cache")
+        assert reopened.get("key")[0] == {'text': 'persisted'}
+        stats = reopened.get_stats()
+        assert stats['entries'] == 1
+        assert stats['size_bytes'] > 0
+        reopened.close()
+
+    def test_checksum_mismatch_drops_entry(self, tmp_path):
+        disk = DiskCache(tmp_path / "cache")
+        disk.set_many([("good", "kept", 1.0, 1), ("bad", "damaged", 1.0, 1)])
+
+        with sqlite3.connect(disk.db_path) as conn:
+            conn.execute("UPDATE entries SET payload = ? WHERE cache_key = 'bad'", (b"garbage",))
+
+        found = disk.get_many(["good", "bad"])
+        assert set(found) == {"good"}
+        stats = disk.get_stats()
+        assert stats['corrupt_entries_dropped'] == 1
+        assert stats['entries'] == 1
+
+        with sqlite3.connect(disk.db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0] == 1
+        disk.close()
+
+    def test_corrupt_database_is_recreated(self, tmp_path):
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        (cache_dir / DiskCache.DB_NAME).write_bytes(b"not a database" * 100)
+
+        disk = DiskCache(cache_dir)
+        assert disk.set("key", "value", 1.0, 1)
+        assert disk.get("key")[0] == "value"
+        assert not disk.disabled
+        disk.close()
+
+    def test_size_cap_evicts_least_recently_accessed(self, tmp_path):
+        # Digits of distinct numbers compress poorly, so each payload is a few KB
+        values = {key: [str(i * 7919 + n) for i in range(1000)] for n, key in enumerate("abcd")}
+        disk = DiskCache(tmp_path / "cache")
+        disk.set("a", values["a"], 1.0, 1)
+        payload_size = disk.get_stats()['size_bytes']
+        disk.close()
+
+        disk = DiskCache(tmp_path / "capped", max_bytes=int(payload_size * 3.5))
+        for key in "abc":
+            disk.set(key, values[key], 1.0, 1)
+        disk.get("a")
+        disk.set("d", values["d"], 1.0, 1)
+
+        assert disk.get_stats()['size_bytes'] <= disk.max_bytes
+        assert disk.get("b") is None
+        assert disk.get("a") is not None
+        assert disk.get("d") is not None
+        disk.close()
+
+    def test_unusable_directory_disables_tier(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("not a directory")
+        disk = DiskCache(blocker / "cache")
+
+        assert disk.set("key", "value", 1.0, 1) is False
+        assert disk.get("key") is None
+        assert disk.disabled
+        assert disk.get_stats()['disabled'] is True
+
+
+class TestTieredCache:
+    def test_disk_hit_is_promoted_to_memory(self, source, tmp_path):
+        first = PDFCache(disk_cache=DiskCache(tmp_path / "cache"))
+        first.set_many(source, "page", [("one", {'page': 1}), ("two", {'page': 2})])
+        first.disk_cache.close()
+
+        # A new process: empty memory tier, same database
+        second = PDFCache(disk_cache=DiskCache(tmp_path / "cache"))
+        assert second.get_many(source, "page", [{'page': 1}, {'page': 2}], disk=False) == [None, None]
+        assert second.get_many(source, "page", [{'page': 1}, {'page': 2}, {'page': 3}]) == ["one", "two", None]
+        assert (second.disk_hits, second.misses) == (2, 1)
+
+        assert second.get(source, "page", page=1) == "one"
+        assert second.hits == 1
+        second.disk_cache.close()
+
+    def test_disk_entries_of_changed_file_are_deleted(self, source, tmp_path):
+        disk = DiskCache(tmp_path / "cache")
+        PDFCache(disk_cache=disk).set(source, "page", "old", page=1)
+        _touch(source, b"%PDF-1.4\nchanged")
+
+        cache = PDFCache(disk_cache=disk)
+        assert cache.get(source, "page", page=1) is None
+        assert disk.get_stats()['entries'] == 0
+        disk.close()
@@ -0,0 +1,185 @@
+"""
+Tests for TextChunker and DocumentChunker.
+"""
+
+import random
+import string
+
+import pytest
+
+from pdfreadermcp.utils.chunker import DocumentChunker, TextChunker
+
+
+def _prose(seed: int, words: int) -> str:
+    """Sentence-like text with paragraph breaks."""
+    rng = random.Random(seed)
+    parts = []
+    for i in range(words):
+        parts.append(''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 9))))
+        if i % 17 == 16:
+            parts[-1] += '.'
+        if i % 61 == 60:
+            parts[-1] += '\n\n'
+    return ' '.join(parts)
+
+
+def _pages(count: int) -> list:
+    return [
+        {'text': _prose(seed, 150 + 40 * seed), 'page_number': seed + 1, 'metadata': {'page': seed + 1}}
+        for seed in range(count)
+    ]
+
+
+def _fields(chunks) -> list:
+    return [
+        (c.content, c.page_number, c.chunk_index, c.start_char, c.end_char, c.end_page_number)
+        for c in chunks
+    ]
+
+
+@pytest.mark.parametrize("chunk_size,chunk_overlap", [(200, 0), (200, 50), (57, 13), (1000, 100)])
+def test_chunk_offsets_and_sizes(chunk_size, chunk_overlap):
+    text = _prose(1, 800)
+    chunks = TextChunker(chunk_size, chunk_overlap).chunk_text(text, page_number=4)
+
+    assert chunks
+    for i, chunk in enumerate(chunks):
+        assert chunk.content == text[chunk.start_char:chunk.end_char]
+        assert chunk.content == chunk.content.strip()
+        assert len(chunk.content) <= chunk_size
+        assert chunk.chunk_index == i
+        assert chunk.page_number == chunk.end_page_number == 4
+
+    # Chunks advance through the text and together cover all of it
+    starts = [c.start_char for c in chunks]
+    assert starts == sorted(starts)
+    assert chunks[0].start_char == 0
+    assert chunks[-1].end_char == len(text.rstrip())
+    for previous, chunk in zip(chunks, chunks[1:]):
+        assert not text[previous.end_char:chunk.start_char].strip()
+
+
+def test_overlap_repeats_end_of_previous_chunk():
+    text = _prose(2, 600)
+    chunks = TextChunker(chunk_size=300, chunk_overlap=60).chunk_text(text)
+
+    assert len(chunks) > 3
+    for previous, chunk in zip(chunks, chunks[1:]):
+        assert chunk.start_char < previous.end_char
+        assert previous.content.endswith(text[chunk.start_char:previous.end_char])
+        # The overlap starts at a word boundary
+        assert chunk.start_char == 0 or text[chunk.start_char - 1].isspace()
+
+
+def test_no_overlap_without_chunk_overlap():
+    text = _prose(3, 600)
+    chunks = TextChunker(chunk_size=300, chunk_overlap=0).chunk_text(text)
+
+    for previous, chunk in zip(chunks, chunks[1:]):
+        assert chunk.start_char >= previous.end_char
+
+
+def test_empty_and_blank_text():
+    chunker = TextChunker()
+    assert chunker.chunk_text("") == []
+    assert chunker.chunk_text(" \n\n\t ") == []
+
+
+def test_metadata_is_shared_by_chunks_of_a_page():
+    metadata = {'has_extractable_text': True}
+    chunks = TextChunker(chunk_size=100, chunk_overlap=0).chunk_text(_prose(4, 200), 1, metadata)
+
+    assert len(chunks) > 1
+    assert all(chunk.metadata is metadata for chunk in chunks)
+
+
+@pytest.mark.parametrize("kwargs", [
+    {'chunk_size': 0},
+    {'chunk_size': 100, 'chunk_overlap': 100},
+    {'chunk_size': 100, 'chunk_overlap': -1},
+    {'size_unit': 'words'},
+    {'chunk_mode': 'section'},
+])
+def test_invalid_settings(kwargs):
+    with pytest.raises(ValueError):
+        TextChunker(**kwargs)
+
+
+def test_token_chunks_respect_token_budget():
+    text = _prose(5, 1000)
+    chunker = TextChunker(chunk_size=64, chunk_overlap=8, size_unit="tokens")
+    chunks = chunker.chunk_text(text)
+
+    assert len(chunks) > 1
+    for chunk in chunks:
+        assert chunk.content == text[chunk.start_char:chunk.end_char]
+        assert chunker.tokenizer.count(chunk.content) <= 64
+
+
+def test_chunk_pages_restarts_offsets_per_page():
+    pages = _pages(3)
+    chunks = TextChunker(chunk_size=200, chunk_overlap=20).chunk_pages(pages)
+
+    texts = {page['page_number']: page['text'] for page in pages}
+    for page in pages:
+        indexes = [c.chunk_index for c in chunks if c.page_number == page['page_number']]
+        assert indexes == list(range(len(indexes)))
+    for chunk in chunks:
+        assert chunk.page_number == chunk.end_page_number
+        assert chunk.content == texts[chunk.page_number][chunk.start_char:chunk.end_char]
+
+
+def test_document_mode_chunks_cross_pages():
+    pages = _pages(4)
+    chunker = TextChunker(chunk_size=300, chunk_overlap=40, chunk_mode="document")
+    chunks = chunker.chunk_pages(pages)
+
+    texts = {page['page_number']: page['text'] for page in pages}
+    assert any(c.end_page_number > c.page_number for c in chunks)
+    for chunk in chunks:
+        assert len(chunk.content) <= 300
+        assert chunk.content.startswith(texts[chunk.page_number][chunk.start_char:][:20].rstrip())
+        assert chunk.content.endswith(texts[chunk.end_page_number][:chunk.end_char][-20:].lstrip())
+
+
+@pytest.mark.parametrize("stop_after", [1, 2, 3])
+def test_document_snapshot_restore_matches_uninterrupted_run(stop_after):
+    pages = _pages(5)
+    chunker = TextChunker(chunk_size=250, chunk_overlap=30, chunk_mode="document")
+
+    document = DocumentChunker(chunker)
+    expected = []
+    for page in pages:
+        expected.extend(document.add_page(page['text'], page['page_number'], page['metadata']))
+    expected.extend(document.finish())
+
+    # Stop after a few pages, keep only the JSON snapshot and resume
+    document = DocumentChunker(chunker)
+    resumed = []
+    for page in pages[:stop_after]:
+        resumed.extend(document.add_page(page['text'], page['page_number'], page['metadata']))
+    state = document.snapshot()
+    assert state['position'] == stop_after
+
+    retain = state['retain']
+    retained_pages = pages[retain[0]:stop_after] if retain else []
+    document = DocumentChunker.restore(chunker, state, retained_pages)
+    for page in pages[stop_after:]:
+        resumed.extend(document.add_page(page['text'], page['page_number'], page['metadata']))
+    resumed.extend(document.finish())
+
+    assert _fields(resumed) == _fields(expected)
+
+
+def test_restore_rejects_pages_that_do_not_match():
+    pages = _pages(3)
+    chunker = TextChunker(chunk_size=250, chunk_overlap=30, chunk_mode="document")
+    document = DocumentChunker(chunker)
+    for page in pages[:2]:
+        document.add_page(page['text'], page['page_number'], page['metadata'])
+    state = document.snapshot()
+
+    with pytest.raises(ValueError):
+        DocumentChunker.restore(chunker, state, pages)
+    with pytest.raises(ValueError):
+        DocumentChunker.restore(chunker, {'position': 'x'}, [])
@@ -0,0 +1,149 @@
+"""
+Tests for PDFReader pagination cursors and extraction engines.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from pdfreadermcp.tools.pdf_reader import PDFReader, extract_page_records
+from pdfreadermcp.utils.executor import WorkerPool
+
+
+ENGLISH_LINES = [
+    "The committee reviewed the annual report in detail.",
+    "Each section describes the work carried out this year.",
+    "Several projects were completed ahead of schedule.",
+    "Others will continue during the next reporting period.",
+    "The budget remained within the limits agreed last spring.",
+    "Questions about the figures can be sent to the office.",
+]
+
+
+@pytest.fixture
+def reader():
+    # Threads only: the test documents are far below process_min_pages
+    pool = WorkerPool(max_threads=2, max_processes=-1)
+    yield PDFReader(executor=pool)
+    pool.shutdown()
+
+
+def _read(reader: PDFReader, path, **kwargs) -> dict:
+    return json.loads(asyncio.run(reader.extract_text(str(path), **kwargs)))
+
+
+def _walk(reader: PDFReader, path, cursor=None, **kwargs) -> list:
+    """Follow next_cursor until the last response and return every response."""
+    responses = [_read(reader, path, cursor=cursor, **kwargs)]
+    while responses[-1]['has_more']:
+        assert responses[-1]['success'], responses[-1]
+        responses.append(_read(reader, path, cursor=responses[-1]['next_cursor'], **kwargs))
+    assert responses[-1]['success'], responses[-1]
+    return responses
+
+
+def _chunk_keys(chunks: list) -> list:
+    return [(c['content'], c['page_number'], c['start_char'], c['end_page_number']) for c in chunks]
+
+
+@pytest.mark.parametrize("chunk_mode", ["page", "document"])
+@pytest.mark.parametrize("max_chunks", [1, 3, 7])
+def test_cursor_walk_returns_every_chunk_once(reader, prose_pdf, chunk_mode, max_chunks):
+    settings = {'chunk_size': 500, 'chunk_overlap': 50, 'chunk_mode': chunk_mode}
+    expected = _read(reader, prose_pdf, parallel=False, **settings)
+    assert expected['success']
+
+    responses = _walk(reader, prose_pdf, max_chunks=max_chunks, **settings)
+
+    chunks = [chunk for response in responses for chunk in response['chunks']]
+    assert _chunk_keys(chunks) == _chunk_keys(expected['chunks'])
+    assert all(len(response['chunks']) <= max_chunks for response in responses)
+    assert responses[-1]['next_cursor'] is None
+
+
+def test_document_cursor_resumes_in_a_new_reader(prose_pdf):
+    # The cursor alone carries the chunker state: a restarted server resumes it
+    settings = {'chunk_size': 400, 'chunk_overlap': 40, 'chunk_mode': 'document', 'max_chunks': 5}
+    pool = WorkerPool(max_threads=2, max_processes=-1)
+    try:
+        first = _read(PDFReader(executor=pool), prose_pdf, **settings)
+        resumed = _walk(PDFReader(executor=pool), prose_pdf, cursor=first['next_cursor'], **settings)
+        expected = _read(PDFReader(executor=pool), prose_pdf, parallel=False, **{
+            k: v for k, v in settings.items() if k != 'max_chunks'
+        })
+    finally:
+        pool.shutdown()
+
+    chunks = first['chunks'] + [chunk for response in resumed for chunk in response['chunks']]
+    assert _chunk_keys(chunks) == _chunk_keys(expected['chunks'])
+
+
+def test_cursor_round_trip():
+    state = {'position': 3, 'chunk_offset': 2, 'request': {'pages': '1-5'}}
+    cursor = PDFReader._encode_cursor(state)
+
+    assert isinstance(cursor, str)
+    assert PDFReader._decode_cursor(cursor) == state
+
+
+@pytest.mark.parametrize("cursor", [
+    "not base64!",
+    PDFReader._encode_cursor({'position': 1}),
+    PDFReader._encode_cursor({'position': 'x', 'chunk_offset': 0}),
+    "bm90IGpzb24=",
+])
+def test_invalid_cursor(reader, prose_pdf, cursor):
+    with pytest.raises(ValueError):
+        PDFReader._decode_cursor(cursor)
+
+    response = _read(reader, prose_pdf, cursor=cursor)
+    assert response['success'] is False
+    assert "Invalid cursor" in response['error']
+
+
+def test_cursor_rejected_for_different_request(reader, prose_pdf):
+    first = _read(reader, prose_pdf, chunk_size=500, chunk_overlap=50, max_chunks=2)
+    assert first['has_more']
+
+    response = _read(reader, prose_pdf, chunk_size=600, chunk_overlap=50, cursor=first['next_cursor'])
+    assert response['success'] is False
+    assert "does not match" in response['error']
+
+
+def test_cursor_rejected_after_file_changes(reader, prose_pdf):
+    first = _read(reader, prose_pdf, max_chunks=2)
+    with open(prose_pdf, "ab") as f:
+        f.write(b"\n% appended\n")
+
+    response = _read(reader, prose_pdf, cursor=first['next_cursor'])
+    assert response['success'] is False
+
+
+def test_invalid_max_chunks(reader, prose_pdf):
+    response = _read(reader, prose_pdf, max_chunks=0)
+    assert response['success'] is False
+
+
+def test_auto_engine_uses_pypdf_only_for_reading_order_pages(make_pdf):
+    path = make_pdf("order.pdf", [ENGLISH_LINES, ENGLISH_LINES], bottom_up=False)
+    pages = extract_page_records(str(path), [0, 1], engine='auto')
+    assert [page['metadata']['engine'] for page in pages] == ['pypdf', 'pypdf']
+
+    # Lines drawn from the bottom of the page up are reordered by pdfplumber
+    path = make_pdf("reversed.pdf", [ENGLISH_LINES], bottom_up=True)
+    page, = extract_page_records(str(path), [0], engine='auto')
+    assert page['metadata']['engine'] == 'plumber'
+    assert page['text'].splitlines()[0] == ENGLISH_LINES[0]
+
+    plumber, = extract_page_records(str(path), [0], engine='plumber')
+    assert page['text'] == plumber['text']
+
+
+def test_engines_agree_on_reading_order_text(make_pdf):
+    path = make_pdf("order.pdf", [ENGLISH_LINES])
+    pypdf_page, = extract_page_records(str(path), [0], engine='pypdf')
+    plumber_page, = extract_page_records(str(path), [0], engine='plumber')
+
+    assert pypdf_page['text'].split() == plumber_page['text'].split()
+    assert pypdf_page['metadata']['has_extractable_text']
@@ -0,0 +1,92 @@
+"""
+Tests for script detection and text quality scoring.
+"""
+
+import pytest
+
+from pdfreadermcp.utils.text_quality import analyze_text_quality, detect_script
+
+
+ENGLISH = (
+    "The quick brown fox jumps over the lazy dog. Text extracted from a well formed "
+    "document has ordinary words and sentences. Each sentence ends with a full stop, "
+    "and most characters are letters rather than symbols."
+)
+
+CHINESE = "这是一个中文文档的示例。文本提取工具应该正确识别中文字符，并且给出合理的质量评分。每个汉字都被当作一个词来计算。"
+
+RUSSIAN = (
+    "Это пример текста на русском языке. Извлечённый текст состоит из обычных слов "
+    "и предложений. Каждое предложение заканчивается точкой."
+)
+
+
+@pytest.mark.parametrize("text,script", [
+    (ENGLISH, 'latin'),
+    ("Ärger über Öl und Straße.", 'latin'),
+    (CHINESE, 'cjk'),
+    ("ひらがなとカタカナのテキストです。", 'cjk'),
+    (RUSSIAN, 'cyrillic'),
+    ("한국어 텍스트 예시입니다.", 'hangul'),
+    ("مرحبا بالعالم وهذا نص عربي", 'arabic'),
+    ("１２３ ... !!! 456", 'unknown'),
+    ("", 'unknown'),
+])
+def test_detect_script(text, script):
+    assert detect_script(text) == script
+
+
+def test_empty_text_has_no_extractable_text():
+    for text in ("", "  \n\t "):
+        quality = analyze_text_quality(text)
+        assert quality['has_extractable_text'] is False
+        assert quality['quality_score'] == 0.0
+        assert quality['word_count'] == 0
+
+
+@pytest.mark.parametrize("text", [ENGLISH, CHINESE, RUSSIAN])
+def test_well_formed_text_scores_high(text):
+    quality = analyze_text_quality(text)
+    assert quality['has_extractable_text'] is True
+    assert quality['quality_score'] >= 0.9
+    assert quality['special_char_ratio'] <= 0.1
+
+
+def test_chinese_counts_each_character_as_a_word():
+    quality = analyze_text_quality(CHINESE)
+    assert quality['script'] == 'cjk'
+    assert 1 <= quality['char_word_ratio'] <= 3
+
+    assert analyze_text_quality("中文文本提取")['word_count'] == 6
+
+
+def test_mixed_latin_and_han_counts_han_per_character():
+    text = "Python 是一种编程语言 used widely"
+    quality = analyze_text_quality(text)
+
+    # Six Han characters plus the four Latin words
+    assert quality['word_count'] == 6 + 4
+
+
+def test_cid_glyphs_are_garbled():
+    text = " ".join("(cid:%d)(cid:%d)" % (i, i + 1) for i in range(60))
+    quality = analyze_text_quality(text)
+
+    assert quality['has_extractable_text'] is False
+    assert quality['special_char_ratio'] > 0.3
+
+
+def test_symbol_noise_is_garbled():
+    quality = analyze_text_quality("#$%^ &*@! ~~|| <<>> {{}} ++== ^^%% $$## @@!! " * 10)
+    assert quality['has_extractable_text'] is False
+    assert quality['special_char_ratio'] > 0.3
+
+
+def test_ascii_and_unicode_paths_agree():
+    # A single non-ASCII character moves the text to the Unicode path
+    ascii_quality = analyze_text_quality(ENGLISH)
+    unicode_quality = analyze_text_quality(ENGLISH + " café")
+
+    assert unicode_quality['word_count'] == ascii_quality['word_count'] + 1
+    assert unicode_quality['quality_score'] == ascii_quality['quality_score']
+    assert unicode_quality['has_extractable_text'] is True